@@ -0,0 +1,89 @@
+from article_frame import area_key
+
+
+def _text(value):
+    """비교용 문자열 (공백 제거, 값이 없으면 '')"""
+    if value is None or value == '-':
+        return ''
+    if value.__class__ is str:
+        return value.replace(' ', '') if ' ' in value else value
+    return ''.join(str(value).split())
+
+
+def same_unit_key(article, area_keys=None):
+    """같은 집을 여러 중개사가 올린 매물을 묶는 키 (단지, 거래유형, 동, 층, 면적, 가격, 월세)
+
+    단지번호나 가격이 없으면 같은 집인지 판단할 수 없으므로 None.
+    area_keys는 (공급면적, 전용면적) 원문 → 면적 키 캐시 (같은 면적이 매우 많이 반복됨).
+    """
+    get = article.get
+    complex_no = get('complexNo')
+    price = _text(get('dealOrWarrantPrc'))
+    if not complex_no or not price:
+        return None
+    areas = (get('area2', ''), get('area1', ''))
+    try:
+        area = area_keys[areas]
+    except (KeyError, TypeError):
+        area = area_key(article)
+        if area_keys is not None:
+            area_keys[areas] = area
+    return (str(complex_no), get('tradeTypeName', ''), _text(get('buildingName')),
+            _text(get('floorInfo')), area, price, _text(get('rentPrc')))
+
+
+def dedupe_articles(articles, merge_same_unit=True):
+    """매물 목록의 중복 제거 (해시 한 번씩, O(n))
+
+    1. articleNo가 같은 매물(같은 매물을 여러 번 받은 경우)은 나중에 받은 것 하나만 남긴다.
+    2. merge_same_unit이면 same_unit_key가 같은 매물(같은 집을 여러 중개사가 올린 경우)을 하나로 합친다.
+       매물 확인일이 가장 최근인 매물을 대표로 남기고 duplicateCount(합친 매물 수), duplicateArticleNos,
+       realtorNames를 붙인다.
+    순서는 처음 나온 위치를 따른다. 입력 매물 dict는 고치지 않는다 (합친 매물만 새 dict).
+    반환값: (중복을 없앤 매물 목록, {'input', 'sameArticle', 'sameUnit', 'output'})
+    """
+    # 1단계: articleNo
+    by_article_no = {}
+    unique = []
+    for article in articles:
+        article_no = article.get('articleNo')
+        if article_no is None:
+            unique.append(article)
+            continue
+        position = by_article_no.get(article_no)
+        if position is None:
+            by_article_no[article_no] = len(unique)
+            unique.append(article)
+        else:
+            unique[position] = article
+    same_article = len(articles) - len(unique)
+
+    if not merge_same_unit:
+        return unique, {'input': len(articles), 'sameArticle': same_article, 'sameUnit': 0, 'output': len(unique)}
+
+    # 2단계: 같은 집 (그룹마다 [대표 위치, 매물 목록])
+    groups = {}
+    result = []
+    area_keys = {}
+    for article in unique:
+        key = same_unit_key(article, area_keys)
+        if key is None:
+            result.append(article)
+            continue
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [len(result), [article]]
+            result.append(article)
+        else:
+            group[1].append(article)
+
+    for position, members in groups.values():
+        if len(members) < 2:
+            continue
+        representative = max(members, key=lambda a: str(a.get('articleConfirmYmd') or ''))
+        realtors = list(dict.fromkeys(a.get('realtorName') for a in members if a.get('realtorName')))
+        result[position] = dict(representative, duplicateCount=len(members),
+                                duplicateArticleNos=[a.get('articleNo') for a in members],
+                                realtorNames=', '.join(realtors))
+    return result, {'input': len(articles), 'sameArticle': same_article,
+                    'sameUnit': len(unique) - len(result), 'output': len(result)}
@@ -0,0 +1,153 @@
+import asyncio
+import threading
+
+
+# 증분 갱신은 최신 확인일 순으로 받아야 "이미 아는 페이지" 이후를 건너뛸 수 있음
+INCREMENTAL_ORDER = 'dateDesc'
+
+# 이 값들이 같으면 같은 매물로 보고 변동 없음으로 처리
+PRICE_FIELDS = ('dealOrWarrantPrc', 'rentPrc')
+
+
+def article_price_key(article):
+    """가격 변동 비교용 키"""
+    return tuple(str(article.get(field, '')) for field in PRICE_FIELDS)
+
+
+def compute_article_delta(previous, fetched, reached_end, cutoff_ymd=None):
+    """이전 매물 집합과 새로 받은 페이지들을 비교해 추가/삭제/가격변동 매물 계산
+
+    previous: {articleNo: article}, fetched: 새로 받은 매물 목록(최신순)
+    reached_end가 False면 받지 않은 뒤쪽 페이지의 매물은 그대로 남아 있다고 보고,
+    cutoff_ymd(마지막으로 받은 페이지의 가장 오래된 확인일)보다 최신인데
+    보이지 않은 이전 매물만 삭제된 것으로 판단한다.
+    반환값: (병합된 현재 매물 목록, 추가 목록, 삭제 목록, [(이전, 현재)] 가격변동 목록)
+    """
+    added, price_changed = [], []
+    seen = {}
+    for article in fetched:
+        article_no = str(article.get('articleNo'))
+        if article_no in seen:
+            continue
+        seen[article_no] = article
+        old = previous.get(article_no)
+        if old is None:
+            added.append(article)
+        elif article_price_key(old) != article_price_key(article):
+            price_changed.append((old, article))
+
+    removed, carried_over = [], []
+    for article_no, old in previous.items():
+        if article_no in seen:
+            continue
+        if reached_end or (cutoff_ymd and str(old.get('articleConfirmYmd', '')) > cutoff_ymd):
+            removed.append(old)
+        else:
+            carried_over.append(old)
+
+    return list(seen.values()) + carried_over, added, removed, price_changed
+
+
+class IncrementalRefresher:
+    """단지별 이전 매물 집합을 기억해 바뀐 부분만 받아오는 증분 갱신기
+
+    최신순으로 페이지를 받다가 모든 매물이 이미 알고 있고 가격도 같은 페이지를 만나면
+    더 이상 페이지를 받지 않는다. 바쁜 단지도 보통 1~2번의 요청으로 갱신된다.
+    이전 매물 집합은 ArticleStore(기본값: api.store)에 저장하며, 저장소가 없으면 메모리에만 둔다.
+    """
+
+    def __init__(self, api, store=None):
+        self.api = api
+        self.store = store if store is not None else getattr(api, 'store', None)
+        self._lock = threading.Lock()
+        self._snapshots = {}
+
+    def get_snapshot(self, complex_no):
+        """이전에 저장한 단지의 매물 집합 {articleNo: article}"""
+        complex_no = str(complex_no)
+        if self.store is not None:
+            return {str(a.get('articleNo')): a for a in self.store.get_articles(complex_no=complex_no)}
+        with self._lock:
+            return dict(self._snapshots.get(complex_no, {}))
+
+    def _save_snapshot(self, complex_no, articles):
+        if self.store is not None:
+            try:
+                self.store.replace_complex_articles(complex_no, articles)
+            except Exception as e:
+                print(f"매물 스냅샷 저장 중 오류: {e}")
+            return
+        with self._lock:
+            # 호출 측에서 매물에 단지 정보를 덧붙이므로 스냅샷에는 복사본을 저장
+            self._snapshots[complex_no] = {str(a.get('articleNo')): dict(a) for a in articles}
+
+    def _page_stopper(self, previous, oldest_seen):
+        """모든 매물이 이미 알고 있고 가격도 같은 페이지면 True (그 뒤 페이지는 받지 않음)"""
+        def stop_when_known(page, article_list):
+            page_dates = [str(a.get('articleConfirmYmd', '')) for a in article_list if a.get('articleConfirmYmd')]
+            if page_dates:
+                oldest_seen['ymd'] = min(page_dates)
+            for article in article_list:
+                old = previous.get(str(article.get('articleNo')))
+                if old is None or article_price_key(old) != article_price_key(article):
+                    return False
+            return True
+        return stop_when_known if previous else None
+
+    def _apply_result(self, complex_no, previous, result, oldest_ymd):
+        reached_end = not result.get('isMoreData', False)
+        articles, added, removed, price_changed = compute_article_delta(
+            previous, result.get('articleList', []), reached_end, oldest_ymd)
+
+        self._save_snapshot(complex_no, articles)
+
+        print(f"단지 {complex_no} 증분 갱신: 요청 {result.get('requestCount', 0)}회, "
+              f"신규 {len(added)}건, 삭제 {len(removed)}건, 가격변동 {len(price_changed)}건")
+        result['articleList'] = articles
+        result['totalCount'] = len(articles)
+        result['added'] = added
+        result['removed'] = removed
+        result['priceChanged'] = price_changed
+        result['isFirstFetch'] = not previous
+        return result
+
+    def refresh(self, complex_no):
+        """단지 매물을 증분 갱신하고 변경 내역을 포함한 결과 반환
+
+        반환값의 articleList는 현재 전체 매물 목록이며, added/removed/priceChanged에 변경 내역,
+        requestCount에 이번 갱신에 쓴 요청 수가 들어 있다.
+        """
+        complex_no = str(complex_no)
+        previous = self.get_snapshot(complex_no)
+        oldest_seen = {'ymd': None}
+
+        result = self.api.search_by_complex(
+            complex_no=complex_no,
+            use_cache=False,
+            order=INCREMENTAL_ORDER,
+            page_callback=self._page_stopper(previous, oldest_seen)
+        )
+        if not result or 'error' in result or self.api.use_test_mode or 'message' in result:
+            # 요청이 실패했거나(부분 결과) 테스트 데이터면 스냅샷을 건드리지 않음
+            return None if result and 'error' in result else result
+        return self._apply_result(complex_no, previous, result, oldest_seen['ymd'])
+
+    async def refresh_async(self, complex_no, client):
+        """refresh의 비동기 버전 (client: AsyncNaverLandAPI), 요청이 실패하면 None
+
+        스냅샷 조회/저장은 SQLite 작업이라 루프를 막지 않도록 스레드에서 실행한다.
+        """
+        complex_no = str(complex_no)
+        previous = await asyncio.to_thread(self.get_snapshot, complex_no)
+        oldest_seen = {'ymd': None}
+
+        result = await client.search_by_complex(
+            complex_no,
+            use_cache=False,
+            order=INCREMENTAL_ORDER,
+            page_callback=self._page_stopper(previous, oldest_seen)
+        )
+        if 'error' in result:
+            # 일부 페이지만 받은 상태로 스냅샷을 덮어쓰지 않음
+            return None
+        return await asyncio.to_thread(self._apply_result, complex_no, previous, result, oldest_seen['ymd'])
@@ -0,0 +1,522 @@
+import csv
+import importlib.util
+import json
+import math
+import os
+import threading
+
+import numpy as np
+
+
+# 내보내기 열 (한글 열 이름, 매물 API 키) - 파일 열 순서도 이 순서
+EXPORT_COLUMNS = [
+    ('매물명', 'articleName'),
+    ('부동산유형', 'realEstateTypeName'),
+    ('매물부동산유형', 'articleRealEstateTypeName'),
+    ('거래유형', 'tradeTypeName'),
+    ('확인유형', 'verificationTypeCode'),
+    ('층정보', 'floorInfo'),
+    ('가격변동상태', 'priceChangeState'),
+    ('매매/전세가', 'dealOrWarrantPrc'),
+    ('월세', 'rentPrc'),
+    ('면적명', 'areaName'),
+    ('전용면적', 'area1'),
+    ('공급면적', 'area2'),
+    ('방향', 'direction'),
+    ('매물확인일', 'articleConfirmYmd'),
+    ('매물특징', 'articleFeatureDesc'),
+    ('태그목록', 'tagList'),
+    ('동이름', 'buildingName'),
+    ('동일주소매물수', 'sameAddrCnt'),
+    ('동일주소최고가', 'sameAddrMaxPrc'),
+    ('동일주소최저가', 'sameAddrMinPrc'),
+    ('위도', 'latitude'),
+    ('경도', 'longitude'),
+    ('부동산중개사명', 'realtorName'),
+    ('소유자확인거래', 'tradeCheckedByOwner'),
+    ('직거래여부', 'isDirectTrade'),
+    ('관심여부', 'isInterest'),
+    ('단지여부', 'isComplex'),
+    ('상세주소', 'detailAddress'),
+    ('안심임대인여부', 'isSafeLessorOfHug'),
+    ('단지명', 'complexName'),
+    ('단지번호', 'complexNo'),
+    ('주소', 'cortarAddressFromComplex'),
+    ('지역코드', 'cortarNoFromComplex'),
+    ('링크', 'cpPcArticleUrl'),
+    ('최고층', 'highFloorFromComplex'),
+    ('최저층', 'lowFloorFromComplex'),
+    ('최대공급면적', 'maxSupplyAreaFromComplex'),
+    ('최대전체면적', 'maxTotalAreaFromComplex'),
+    ('최소공급면적', 'minSupplyAreaFromComplex'),
+    ('최소전체면적', 'minTotalAreaFromComplex'),
+    ('총동수', 'totalDongCountFromComplex'),
+    ('총세대수', 'totalHouseholdCountFromComplex'),
+    ('사용승인일', 'useApproveYmdFromComplex'),
+    ('사용여부', 'useYnFromComplex'),
+    ('중복매물수', 'duplicateCount'),
+    ('중개사목록', 'realtorNames'),
+]
+EXPORT_COLUMN_NAMES = [name for name, _ in EXPORT_COLUMNS]
+
+VERIFICATION_NAMES = {'NONE': '없음', 'OWNER': '소유자확인', 'REALTOR': '중개사확인', 'LESSOR': '임대인확인', 'S_VR': 'VR확인', 'SITE': '현장확인', 'NDOC1': '서류확인1', 'DOC': '서류확인', 'DOCV2': '서류확인V2', 'MOBL': '모바일확인', 'NDOC2': '서류확인2'}
+PRICE_CHANGE_NAMES = {'SAME': '변동없음', 'DOWN': '하락', 'UP': '상승', 'DECREASE': '감소', 'INCREASE': '증가', 'NEW': '신규'}
+YN_COLUMNS = {'소유자확인거래', '직거래여부', '관심여부', '단지여부', '안심임대인여부', '사용여부'}
+DATE_COLUMNS = {'사용승인일'}
+
+# 원 단위 정수로 저장하고 엑셀 표시 형식만 천 단위 구분으로
+PRICE_NUMBER_FORMAT = '#,##0'
+PRICE_COLUMNS = {'매매/전세가', '월세'}
+
+# Parquet 열 타입 (나머지는 문자열) - 가격/월세는 해석된 원 단위 값
+PARQUET_INT_COLUMNS = {'매매/전세가', '월세', '동일주소매물수', '최고층', '최저층', '총동수', '총세대수', '중복매물수'}
+PARQUET_FLOAT_COLUMNS = {'전용면적', '공급면적', '위도', '경도', '최대공급면적', '최대전체면적', '최소공급면적', '최소전체면적'}
+
+# 평균가보다 싼 매물 행 채우기 색 (테이블 강조 색과 같음)
+HIGHLIGHT_FILL_COLORS = {'매매': 'FFE4E1', '전세': 'E9F5E9', '월세': 'E0F7FA'}
+
+
+def format_date(date_str):
+    if not date_str or not isinstance(date_str, str) or len(date_str) != 8:
+        return date_str
+    return f"{date_str[:4]}.{date_str[4:6]}.{date_str[6:]}"
+
+
+def _yes_no(value):
+    if value is True or str(value).upper() == 'Y':
+        return 'Y'
+    if value is False or str(value).upper() == 'N':
+        return 'N'
+    return value
+
+
+def _address(article):
+    parts = [part for part in (article.get('cortarAddressFromComplex', ''), article.get('buildingName', ''),
+                               article.get('detailAddress', '')) if part]
+    return " ".join(parts).strip() if parts else '-'
+
+
+# 열 변환 함수: (매물 목록, API 키, 가격 배열, 월세 배열) → 그 열의 값 목록
+# 셀마다 열 이름으로 분기하지 않고 열 하나를 통째로 변환한다.
+
+def _raw_column(articles, api_key):
+    return [article.get(api_key, '-') for article in articles]
+
+
+def _plain_column(articles, api_key, prices, rents):
+    values = _raw_column(articles, api_key)
+    if None in values:
+        values = ['-' if value is None else value for value in values]
+    return values
+
+
+def _number_column(won, raws):
+    """가격 열 값: 해석된 원 단위 정수, 해석할 수 없으면 원문, 값이 없으면 None"""
+    won = np.asarray(won, dtype=float)
+    valid = ~np.isnan(won)
+    numbers = np.where(valid, won, 0).astype(np.int64).tolist()
+    return [number if ok else (None if raw is None or raw == '-' or raw == '' else raw)
+            for number, ok, raw in zip(numbers, valid.tolist(), raws)]
+
+
+def _price_column(articles, api_key, prices, rents):
+    return _number_column(prices, [article.get(api_key) for article in articles])
+
+
+def _rent_column(articles, api_key, prices, rents):
+    return _number_column(rents, [article.get(api_key) for article in articles])
+
+
+_YES_NO_TEXT = {'Y': 'Y', 'y': 'Y', 'N': 'N', 'n': 'N'}
+
+
+def _yes_no_column(articles, api_key, prices, rents):
+    return [(('Y' if value else 'N') if value.__class__ is bool
+             else _YES_NO_TEXT.get(value, value) if value.__class__ is str
+             else _yes_no(value))
+            for value in _raw_column(articles, api_key)]
+
+
+def _code_name_column(names):
+    """코드 → 한글 이름 열 (대소문자 무시, 없는 코드는 원래 값)"""
+    def transform(articles, api_key, prices, rents):
+        return [names[value] if value.__class__ is str and value in names else names.get(str(value).upper(), value)
+                for value in _raw_column(articles, api_key)]
+    return transform
+
+
+def _tag_column(articles, api_key, prices, rents):
+    return [', '.join(value) if value.__class__ is list else value for value in _raw_column(articles, api_key)]
+
+
+def _date_column(articles, api_key, prices, rents):
+    return [format_date(value if value.__class__ is str else str(value)) for value in _raw_column(articles, api_key)]
+
+
+def _address_column(articles, api_key, prices, rents):
+    return [_address(article) for article in articles]
+
+
+def _article_name_column(articles, api_key, prices, rents):
+    return [article.get('articleName', article.get('complexName', '-')) for article in articles]
+
+
+# 값을 변환하는 열 (나머지는 API 값을 그대로, 없거나 None이면 '-')
+COLUMN_TRANSFORMS = {
+    '매물명': _article_name_column,
+    '확인유형': _code_name_column(VERIFICATION_NAMES),
+    '가격변동상태': _code_name_column(PRICE_CHANGE_NAMES),
+    '매매/전세가': _price_column,
+    '월세': _rent_column,
+    '태그목록': _tag_column,
+    '주소': _address_column,
+}
+COLUMN_TRANSFORMS.update({name: _date_column for name in DATE_COLUMNS})
+COLUMN_TRANSFORMS.update({name: _yes_no_column for name in YN_COLUMNS})
+
+
+class ExportSpec:
+    """열 구성을 열별 변환 함수 목록으로 한 번 컴파일한 것
+
+    Excel/CSV/JSONL/Parquet 내보내기가 모두 같은 EXPORT_SPEC을 쓴다. 변환은 매물 묶음 단위로 열마다
+    한 번씩 실행하므로 (가격/월세는 numpy 배열 연산) 셀마다 열 이름을 비교하지 않는다.
+    """
+
+    def __init__(self, columns=EXPORT_COLUMNS, transforms=COLUMN_TRANSFORMS):
+        self.names = [name for name, _ in columns]
+        self.api_keys = [api_key for _, api_key in columns]
+        self.transforms = [(transforms.get(name, _plain_column), api_key) for name, api_key in columns]
+
+    def columns(self, articles, prices, rents):
+        """매물 묶음 → 열별 값 목록의 목록"""
+        return [transform(articles, api_key, prices, rents) for transform, api_key in self.transforms]
+
+    def rows(self, articles, prices, rents):
+        """매물 묶음 → 행별 값 목록의 목록"""
+        return [list(row) for row in zip(*self.columns(articles, prices, rents))]
+
+
+EXPORT_SPEC = ExportSpec()
+
+
+def export_values(article, price_won, rent_won):
+    """매물 하나를 EXPORT_COLUMNS 순서의 값 목록으로 (가격/월세는 해석된 원 단위 값 사용)"""
+    return EXPORT_SPEC.rows([article], [price_won], [rent_won])[0]
+
+
+def _text_width(value):
+    # 한글은 글자당 2, 영문/숫자는 1로 계산하여 너비 추정
+    return sum(2 if '가' <= char <= '힣' else 1 for char in str(value))
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+def _xlsxwriter_available():
+    return importlib.util.find_spec('xlsxwriter') is not None
+
+
+def _pyarrow_available():
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+class ArticleExporter:
+    """매물 목록을 한 행씩 바로 파일에 써 넣는 내보내기의 공통 부분
+
+    모든 형식이 EXPORT_SPEC 열 구성과 변환을 같이 쓴다. 파일은 '<경로>.part'에 쓰고
+    끝까지 쓰면 원래 이름으로 바꾸므로, 취소하거나 실패하면 완성되지 않은 파일이 남지 않는다.
+    run은 작업 스레드에서 호출하고 cancel은 어느 스레드에서나 호출할 수 있다.
+    api_names가 True면 열 이름으로 한글 대신 매물 API 키를 쓴다 (분석 도구용, 엑셀은 항상 한글).
+    """
+
+    PROGRESS_INTERVAL = 500
+    extension = ''
+    label = ''
+
+    def __init__(self, path, articles, prices, rents, highlights=None, api_names=False):
+        self.path = path
+        self.articles = articles
+        self.prices = prices
+        self.rents = rents
+        self.highlights = highlights
+        self.spec = EXPORT_SPEC
+        self.column_names = self.spec.api_keys if api_names else self.spec.names
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def _batch_columns(self, start, stop):
+        return self.spec.columns(self.articles[start:stop], self.prices[start:stop], self.rents[start:stop])
+
+    def _batches(self, on_progress):
+        """PROGRESS_INTERVAL 행씩 (시작 행 번호, 열별 값 목록)을 내주며 취소 확인과 진행률 보고"""
+        total = len(self.articles)
+        for start in range(0, total, self.PROGRESS_INTERVAL):
+            if self._cancel_event.is_set():
+                raise ExportCancelled()
+            stop = min(start + self.PROGRESS_INTERVAL, total)
+            yield start, self._batch_columns(start, stop)
+            if on_progress and stop < total:
+                on_progress(stop, total)
+        if self._cancel_event.is_set():
+            raise ExportCancelled()
+        if on_progress:
+            on_progress(total, total)
+
+    def _rows(self, on_progress):
+        """(행 번호, 값 목록, 강조 거래유형)을 차례로 내줌"""
+        highlights = self.highlights
+        for start, columns in self._batches(on_progress):
+            for index, values in enumerate(zip(*columns), start):
+                yield index, list(values), highlights[index] if highlights else None
+
+    def run(self, on_progress=None):
+        """파일 저장 후 저장한 행 수 반환 (취소하면 ExportCancelled)
+
+        on_progress(done, total)는 PROGRESS_INTERVAL 행마다, 그리고 저장 직전에 호출된다.
+        """
+        part_path = self.path + '.part'
+        try:
+            self._write(part_path, on_progress)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        os.replace(part_path, self.path)
+        return len(self.articles)
+
+    def _write(self, path, on_progress):
+        raise NotImplementedError
+
+
+class ExcelExporter(ArticleExporter):
+    """엑셀(xlsx) 내보내기
+
+    xlsxwriter가 있으면 constant_memory 모드로, 없으면 openpyxl write-only 워크북으로 쓴다. 어느 쪽이든 행을
+    만들자마자 임시 파일로 흘려 보내므로 매물 수와 상관없이 메모리 사용량이 거의 일정하다.
+    가격/월세는 원 단위 숫자에 천 단위 표시 형식을 지정하고, highlights[i]가 거래유형이면 그 행을
+    거래유형별 색으로 채운다.
+    """
+
+    extension = 'xlsx'
+    label = '엑셀'
+    WIDTH_SAMPLE_ROWS = 200
+    MAX_COLUMN_WIDTH = 50
+
+    def __init__(self, path, articles, prices, rents, highlights=None, sheet_name='매물목록', engine=None):
+        super().__init__(path, articles, prices, rents, highlights)
+        self.sheet_name = sheet_name
+        # 'xlsxwriter' 또는 'openpyxl' (None이면 xlsxwriter가 있을 때 xlsxwriter)
+        self.engine = engine or ('xlsxwriter' if _xlsxwriter_available() else 'openpyxl')
+
+    def _column_widths(self):
+        """스트리밍으로 쓰면 다 쓴 뒤에 너비를 잴 수 없으므로 앞쪽 행 일부로 미리 추정"""
+        sample = self._batch_columns(0, min(len(self.articles), self.WIDTH_SAMPLE_ROWS))
+        widths = [max([_text_width(name)] + [_text_width(value) for value in values if value is not None])
+                  for name, values in zip(self.spec.names, sample)]
+        return [min(width + 2, self.MAX_COLUMN_WIDTH) for width in widths]
+
+    def _write(self, path, on_progress):
+        if self.engine == 'xlsxwriter':
+            self._write_xlsxwriter(path, on_progress)
+        else:
+            self._write_openpyxl(path, on_progress)
+
+    def _write_xlsxwriter(self, path, on_progress):
+        import xlsxwriter
+
+        # 취소되면 close를 부르지 않으므로 파일은 만들어지지 않음 (행 데이터 임시 파일은 워크북과 함께 정리됨)
+        workbook = xlsxwriter.Workbook(path, {'constant_memory': True, 'nan_inf_to_errors': True})
+        sheet = workbook.add_worksheet(self.sheet_name)
+        sheet.freeze_panes(1, 0)
+        for column, width in enumerate(self._column_widths()):
+            sheet.set_column(column, column, width)
+        sheet.write_row(0, 0, self.spec.names, workbook.add_format({'bold': True}))
+
+        price_format = workbook.add_format({'num_format': PRICE_NUMBER_FORMAT})
+        fill_formats = {trade_type: (workbook.add_format({'bg_color': f'#{color}'}),
+                                     workbook.add_format({'bg_color': f'#{color}', 'num_format': PRICE_NUMBER_FORMAT}))
+                        for trade_type, color in HIGHLIGHT_FILL_COLORS.items()}
+        price_columns = {column for column, name in enumerate(self.spec.names) if name in PRICE_COLUMNS}
+
+        for index, values, highlight in self._rows(on_progress):
+            row = index + 1
+            cell_format, number_format = fill_formats.get(highlight, (None, price_format))
+            for column, value in enumerate(values):
+                if isinstance(value, bool):
+                    sheet.write_boolean(row, column, value, cell_format)
+                elif isinstance(value, (int, float)):
+                    sheet.write_number(row, column, value, number_format if column in price_columns else cell_format)
+                elif value is None:
+                    if cell_format is not None:
+                        sheet.write_blank(row, column, None, cell_format)
+                else:
+                    # write()는 '='로 시작하는 문자열을 수식으로, URL을 하이퍼링크로 바꾸므로 문자열로 씀
+                    sheet.write_string(row, column, str(value), cell_format)
+        workbook.close()
+
+    def _write_openpyxl(self, path, on_progress):
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, PatternFill
+        from openpyxl.utils import get_column_letter
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(self.sheet_name)
+        sheet.freeze_panes = 'A2'
+        for column, width in enumerate(self._column_widths(), 1):
+            sheet.column_dimensions[get_column_letter(column)].width = width
+
+        header_font = Font(bold=True)
+        header = []
+        for name in self.spec.names:
+            cell = WriteOnlyCell(sheet, value=name)
+            cell.font = header_font
+            header.append(cell)
+        sheet.append(header)
+
+        fills = {trade_type: PatternFill(start_color=color, end_color=color, fill_type='solid')
+                 for trade_type, color in HIGHLIGHT_FILL_COLORS.items()}
+        price_columns = [column for column, name in enumerate(self.spec.names) if name in PRICE_COLUMNS]
+
+        try:
+            for index, values, highlight in self._rows(on_progress):
+                fill = fills.get(highlight)
+                if fill is not None:
+                    row = []
+                    for value in values:
+                        cell = WriteOnlyCell(sheet, value=value)
+                        cell.fill = fill
+                        row.append(cell)
+                else:
+                    row = values
+                for column in price_columns:
+                    if isinstance(values[column], int):
+                        cell = row[column] if fill is not None else WriteOnlyCell(sheet, value=values[column])
+                        cell.number_format = PRICE_NUMBER_FORMAT
+                        row[column] = cell
+                sheet.append(row)
+        except ExportCancelled:
+            # 행을 쓰던 임시 파일을 닫음 (임시 파일은 openpyxl이 종료 시 정리)
+            sheet.close()
+            raise
+        workbook.save(path)
+
+
+class CsvExporter(ArticleExporter):
+    """CSV 내보내기 (엑셀에서 한글이 깨지지 않도록 BOM 포함 UTF-8)"""
+
+    extension = 'csv'
+    label = 'CSV'
+
+    def _write(self, path, on_progress):
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.column_names)
+            for _, values, _ in self._rows(on_progress):
+                writer.writerow(values)
+
+
+class JsonlExporter(ArticleExporter):
+    """JSON Lines 내보내기 (매물 하나당 한 줄의 JSON 객체)"""
+
+    extension = 'jsonl'
+    label = 'JSON Lines'
+
+    def _write(self, path, on_progress):
+        names = self.column_names
+        with open(path, 'w', encoding='utf-8') as f:
+            for _, values, _ in self._rows(on_progress):
+                f.write(json.dumps(dict(zip(names, values)), ensure_ascii=False))
+                f.write('\n')
+
+
+def _to_int(value):
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return int(number) if math.isfinite(number) else None
+
+
+def _to_float(value):
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _to_str(value):
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+class ParquetExporter(ArticleExporter):
+    """Parquet 내보내기 (pyarrow 필요)
+
+    숫자 열은 정수/실수 타입으로 저장하고 (해석할 수 없는 값은 null), ROW_GROUP_SIZE 행마다 행 그룹 하나로
+    흘려 쓰므로 전체 목록을 한 번에 열 배열로 만들지 않는다.
+    """
+
+    extension = 'parquet'
+    label = 'Parquet'
+    ROW_GROUP_SIZE = 20000
+
+    def __init__(self, path, articles, prices, rents, highlights=None, api_names=False, compression='zstd'):
+        super().__init__(path, articles, prices, rents, highlights, api_names)
+        self.compression = compression
+
+    def _write(self, path, on_progress):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet 저장에는 pyarrow가 필요합니다. (pip install pyarrow)")
+
+        types, converters = [], []
+        for name in self.spec.names:
+            if name in PARQUET_INT_COLUMNS:
+                types.append(pa.int64()); converters.append(_to_int)
+            elif name in PARQUET_FLOAT_COLUMNS:
+                types.append(pa.float64()); converters.append(_to_float)
+            else:
+                types.append(pa.string()); converters.append(_to_str)
+        schema = pa.schema(list(zip(self.column_names, types)))
+
+        # 열 단위로 변환된 묶음을 그대로 이어 붙임 (가격/월세는 해석된 원 단위 값, 해석할 수 없으면 null)
+        buffered = [[] for _ in types]
+
+        def flush():
+            if buffered[0]:
+                writer.write_batch(pa.record_batch([pa.array(values, type=column_type)
+                                                    for values, column_type in zip(buffered, types)], schema=schema))
+                for values in buffered:
+                    values.clear()
+
+        with pq.ParquetWriter(path, schema, compression=self.compression) as writer:
+            for _, columns in self._batches(on_progress):
+                for values, convert, column in zip(buffered, converters, columns):
+                    values.extend(map(convert, column))
+                if len(buffered[0]) >= self.ROW_GROUP_SIZE:
+                    flush()
+            flush()
+
+
+# Parquet는 pyarrow가 있을 때만 (화면의 파일 형식 목록과 명령줄 출력 형식에 보이지 않도록)
+EXPORTERS = {cls.extension: cls for cls in (ExcelExporter, CsvExporter, JsonlExporter, ParquetExporter)
+             if cls is not ParquetExporter or _pyarrow_available()}
+
+
+def exporter_for_path(path):
+    """파일 확장자에 맞는 내보내기 클래스 (지원하지 않는 확장자면 None)"""
+    return EXPORTERS.get(os.path.splitext(path)[1].lower().lstrip('.'))
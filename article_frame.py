@@ -0,0 +1,209 @@
+import numpy as np
+
+
+# 가격/면적 등 문자열 → 숫자 변환은 모두 이 모듈의 함수만 사용 (테이블 정렬, 평균가, 엑셀이 같은 값을 봄)
+
+def _to_number(text):
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def parse_price_won(price_str):
+    """'8억 5,000', '5,000', '1.5억' 같은 가격 문자열 → 원 단위 정수, 해석할 수 없으면 None"""
+    if isinstance(price_str, (int, float)) and not isinstance(price_str, bool):
+        return int(price_str * 10000)
+    if not isinstance(price_str, str) or price_str.strip() in ('', '-'):
+        return None
+    cleaned = price_str.replace(',', '').replace(' ', '')
+    if '억' in cleaned:
+        eok_str, _, man_str = cleaned.partition('억')
+        eok = _to_number(eok_str) if eok_str else 0.0
+        man = _to_number(man_str) if man_str else 0.0
+        if eok is None or man is None:
+            return None
+        return int(eok * 100000000 + man * 10000)
+    man = _to_number(cleaned)
+    return None if man is None else int(man * 10000)
+
+
+def parse_rent_won(rent_str):
+    """월세(만원 단위 문자열/숫자) → 원 단위 정수, 해석할 수 없으면 None"""
+    if isinstance(rent_str, (int, float)) and not isinstance(rent_str, bool):
+        return int(rent_str * 10000)
+    if not isinstance(rent_str, str) or rent_str.strip() in ('', '-'):
+        return None
+    man = _to_number(rent_str.replace(',', ''))
+    return None if man is None else int(man * 10000)
+
+
+def parse_area(area_value):
+    """면적 값 → float, 없거나 해석할 수 없으면 NaN"""
+    if isinstance(area_value, (int, float)) and not isinstance(area_value, bool):
+        return float(area_value)
+    if not isinstance(area_value, str):
+        return np.nan
+    number = _to_number(area_value)
+    return np.nan if number is None else number
+
+
+def parse_floor(floor_str):
+    """'5/25', '5층', '저/25' 같은 층 정보 → 정렬용 층 번호 (저=1, 중=5, 고=10, 모르면 -1)"""
+    if isinstance(floor_str, int) and not isinstance(floor_str, bool):
+        return floor_str
+    if not isinstance(floor_str, str):
+        return -1
+    head = floor_str.split('/')[0].strip()
+    if head.endswith('층'):
+        head = head[:-1]
+    if head.lstrip('-').isdigit():
+        return int(head)
+    if head.upper().startswith('B') and head[1:].isdigit():
+        return -int(head[1:])
+    for keyword, value in (("저", 1), ("중", 5), ("고", 10)):
+        if keyword in floor_str:
+            return value
+    return -1
+
+
+def parse_ymd(date_str):
+    """'YYYYMMDD' → numpy datetime64[D] 변환용 문자열 'YYYY-MM-DD', 형식이 다르면 'NaT'"""
+    date_str = str(date_str or '')
+    if len(date_str) == 8 and date_str.isdigit():
+        return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}"
+    return 'NaT'
+
+
+def _format_area_num(num_str):
+    if not num_str: return ''
+    try: return f"{float(num_str):.2f}".rstrip('0').rstrip('.')
+    except (ValueError, TypeError): return str(num_str)
+
+
+def area_key(article):
+    """'공급㎡ (전용㎡)' 형식의 면적 표시 문자열 (평균가 그룹 키로도 사용)"""
+    s_area_fmt = _format_area_num(article.get('area2', ''))
+    e_area_fmt = _format_area_num(article.get('area1', ''))
+    if s_area_fmt and e_area_fmt: return f"{s_area_fmt}㎡ ({e_area_fmt}㎡)"
+    elif s_area_fmt: return f"{s_area_fmt}㎡"
+    elif e_area_fmt: return f"{e_area_fmt}㎡"
+    return "-"
+
+
+def article_display_name(article):
+    return article.get('articleName', article.get('complexName', ''))
+
+
+def format_price_display(price_str, price_won):
+    """테이블 표시용 가격 (원 단위 콤마), 해석할 수 없으면 원문"""
+    if not isinstance(price_str, str) or price_str == '-': return "-"
+    if price_won is None or np.isnan(price_won): return price_str
+    if price_won > 0: return f"{int(price_won):,}"
+    cleaned = price_str.replace(',', '').strip()
+    return cleaned if cleaned == '0' else price_str
+
+
+def _memoized(parser):
+    # 같은 가격/면적 문자열이 매우 많이 반복되므로 고유 값만 한 번씩 해석
+    cache = {}
+    def parse(value):
+        try:
+            return cache[value]
+        except KeyError:
+            result = cache[value] = parser(value)
+            return result
+        except TypeError:  # 리스트 등 해시 불가 값
+            return parser(value)
+    return parse
+
+
+def _nan_if_none(parser):
+    def parse(value):
+        result = parser(value)
+        return np.nan if result is None else result
+    return parse
+
+
+class ArticleFrame:
+    """매물 목록의 열 단위 숫자 표현
+
+    매물이 도착할 때 한 번만 문자열을 해석해 numpy 배열(price_won, rent_won, area1, area2,
+    floor_num, confirm_date)과 그룹 키 배열(trade_type, name, area_key)을 만든다.
+    i번째 값은 원본 목록의 i번째 매물에 대응하며, 정렬/평균가/필터/내보내기는 이 배열을 읽는다.
+    가격/월세/면적이 없으면 NaN, 층을 모르면 -1, 날짜가 없으면 NaT.
+    """
+
+    NUMERIC_COLUMNS = ('price_won', 'rent_won', 'area1', 'area2', 'floor_num', 'confirm_date')
+
+    def __init__(self, articles=()):
+        self.price_won = np.empty(0, dtype=np.float64)
+        self.rent_won = np.empty(0, dtype=np.float64)
+        self.area1 = np.empty(0, dtype=np.float64)
+        self.area2 = np.empty(0, dtype=np.float64)
+        self.floor_num = np.empty(0, dtype=np.int32)
+        self.confirm_date = np.empty(0, dtype='datetime64[D]')
+        self.trade_type = np.empty(0, dtype=object)
+        self.name = np.empty(0, dtype=object)
+        self.area_key = np.empty(0, dtype=object)
+        self._parse_price = _memoized(_nan_if_none(parse_price_won))
+        self._parse_rent = _memoized(_nan_if_none(parse_rent_won))
+        self._parse_area = _memoized(parse_area)
+        self._parse_floor = _memoized(parse_floor)
+        self._parse_ymd = _memoized(parse_ymd)
+        self._area_keys = {}
+        if articles:
+            self.extend(articles)
+
+    def __len__(self):
+        return len(self.price_won)
+
+    def _area_key(self, article):
+        raw = (article.get('area1', ''), article.get('area2', ''))
+        try:
+            return self._area_keys[raw]
+        except KeyError:
+            result = self._area_keys[raw] = area_key(article)
+            return result
+        except TypeError:
+            return area_key(article)
+
+    def _columns_for(self, articles):
+        count = len(articles)
+        columns = {
+            'price_won': np.fromiter((self._parse_price(a.get('dealOrWarrantPrc')) for a in articles), np.float64, count),
+            'rent_won': np.fromiter((self._parse_rent(a.get('rentPrc', a.get('rentPrice'))) for a in articles), np.float64, count),
+            'area1': np.fromiter((self._parse_area(a.get('area1')) for a in articles), np.float64, count),
+            'area2': np.fromiter((self._parse_area(a.get('area2')) for a in articles), np.float64, count),
+            'floor_num': np.fromiter((self._parse_floor(a.get('floorInfo')) for a in articles), np.int32, count),
+            'confirm_date': np.array([self._parse_ymd(a.get('articleConfirmYmd')) for a in articles], dtype='datetime64[D]'),
+        }
+        for key, values in (
+            ('trade_type', [a.get('tradeTypeName', '') for a in articles]),
+            ('name', [article_display_name(a) for a in articles]),
+            ('area_key', [self._area_key(a) for a in articles]),
+        ):
+            column = np.empty(count, dtype=object)
+            column[:] = values
+            columns[key] = column
+        return columns
+
+    def extend(self, articles):
+        """새로 도착한 매물을 해석해 배열 끝에 추가"""
+        if not articles:
+            return
+        for key, values in self._columns_for(articles).items():
+            setattr(self, key, np.concatenate((getattr(self, key), values)))
+
+    def price_sort_keys(self):
+        """정렬용 가격 (없으면 0)"""
+        return np.nan_to_num(self.price_won, nan=0.0)
+
+    def rent_sort_keys(self):
+        return np.nan_to_num(self.rent_won, nan=0.0)
+
+    def area1_sort_keys(self):
+        return np.nan_to_num(self.area1, nan=0.0)
@@ -0,0 +1,300 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class ArticleStore:
+    """단지/매물/검색 결과를 저장하는 SQLite 로컬 저장소
+
+    단지(complexes)와 매물(articles)은 조회에 쓰는 컬럼을 별도로 두고 인덱스를 걸며,
+    원본 API 항목은 data 컬럼에 JSON으로 보관한다. 키워드 검색 결과처럼 통째로 보관하던
+    응답은 documents 테이블에 이름으로 저장한다.
+    """
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "naver_land_store.sqlite3")
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        # 단지 데이터가 바뀔 때마다 증가 (단지 색인 등의 캐시 무효화용)
+        self.complex_version = 0
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS complexes (
+                    complexNo TEXT PRIMARY KEY,
+                    complexName TEXT,
+                    cortarNo TEXT,
+                    cortarAddress TEXT,
+                    realEstateTypeName TEXT,
+                    latitude REAL,
+                    longitude REAL,
+                    data TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_complexes_cortarNo ON complexes(cortarNo);
+
+                CREATE TABLE IF NOT EXISTS articles (
+                    articleNo TEXT PRIMARY KEY,
+                    complexNo TEXT,
+                    cortarNo TEXT,
+                    tradeTypeCode TEXT,
+                    articleConfirmYmd TEXT,
+                    dealOrWarrantPrc TEXT,
+                    data TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_articles_complexNo ON articles(complexNo);
+                CREATE INDEX IF NOT EXISTS idx_articles_cortarNo ON articles(cortarNo);
+                CREATE INDEX IF NOT EXISTS idx_articles_tradeTypeCode ON articles(tradeTypeCode);
+                CREATE INDEX IF NOT EXISTS idx_articles_confirmYmd ON articles(articleConfirmYmd);
+
+                CREATE TABLE IF NOT EXISTS documents (
+                    name TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS crawl_items (
+                    crawl_id TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    item_key TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    data TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (crawl_id, kind, item_key)
+                );
+
+                CREATE TABLE IF NOT EXISTS page_journal (
+                    journal_key TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    is_more INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (journal_key, page)
+                );
+            """)
+
+    @staticmethod
+    def _complex_row(complex_info, now):
+        return (
+            str(complex_info.get('complexNo')),
+            complex_info.get('complexName'),
+            complex_info.get('cortarNo'),
+            complex_info.get('cortarAddress'),
+            complex_info.get('realEstateTypeName'),
+            complex_info.get('latitude'),
+            complex_info.get('longitude'),
+            json.dumps(complex_info, ensure_ascii=False),
+            now,
+        )
+
+    @staticmethod
+    def _article_row(article, now):
+        return (
+            str(article.get('articleNo')),
+            None if article.get('complexNo') is None else str(article.get('complexNo')),
+            article.get('cortarNo') or article.get('cortarNoFromComplex'),
+            article.get('tradeTypeCode'),
+            article.get('articleConfirmYmd'),
+            article.get('dealOrWarrantPrc'),
+            json.dumps(article, ensure_ascii=False),
+            now,
+        )
+
+    def upsert_complexes(self, complexes):
+        """단지 목록 일괄 저장 (complexNo 기준으로 있으면 갱신)"""
+        now = time.time()
+        rows = [self._complex_row(c, now) for c in complexes if c.get('complexNo')]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany("""
+                INSERT INTO complexes (complexNo, complexName, cortarNo, cortarAddress, realEstateTypeName, latitude, longitude, data, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(complexNo) DO UPDATE SET
+                    complexName = excluded.complexName, cortarNo = excluded.cortarNo,
+                    cortarAddress = excluded.cortarAddress, realEstateTypeName = excluded.realEstateTypeName,
+                    latitude = excluded.latitude, longitude = excluded.longitude,
+                    data = excluded.data, updated_at = excluded.updated_at
+            """, rows)
+            self.complex_version += 1
+        return len(rows)
+
+    def upsert_articles(self, articles):
+        """매물 목록 일괄 저장 (articleNo 기준으로 있으면 갱신)"""
+        now = time.time()
+        rows = [self._article_row(a, now) for a in articles if a.get('articleNo') is not None]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._upsert_article_rows(rows)
+        return len(rows)
+
+    def _upsert_article_rows(self, rows):
+        self._conn.executemany("""
+            INSERT INTO articles (articleNo, complexNo, cortarNo, tradeTypeCode, articleConfirmYmd, dealOrWarrantPrc, data, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(articleNo) DO UPDATE SET
+                complexNo = excluded.complexNo, cortarNo = excluded.cortarNo,
+                tradeTypeCode = excluded.tradeTypeCode, articleConfirmYmd = excluded.articleConfirmYmd,
+                dealOrWarrantPrc = excluded.dealOrWarrantPrc, data = excluded.data, updated_at = excluded.updated_at
+        """, rows)
+
+    def replace_complex_articles(self, complex_no, articles):
+        """단지의 매물 집합을 주어진 목록으로 교체 (목록에 없는 기존 매물은 삭제)"""
+        complex_no = str(complex_no)
+        now = time.time()
+        rows = [self._article_row(dict(a, complexNo=a.get('complexNo') or complex_no), now)
+                for a in articles if a.get('articleNo') is not None]
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS keep_articles (articleNo TEXT PRIMARY KEY)")
+            self._conn.execute("DELETE FROM keep_articles")
+            self._conn.executemany("INSERT OR IGNORE INTO keep_articles (articleNo) VALUES (?)", [(r[0],) for r in rows])
+            self._conn.execute(
+                "DELETE FROM articles WHERE complexNo = ? AND articleNo NOT IN (SELECT articleNo FROM keep_articles)",
+                (complex_no,))
+            self._upsert_article_rows(rows)
+        return len(rows)
+
+    def get_complexes(self, cortar_no=None, complex_nos=None):
+        """저장된 단지 목록 조회 (지역코드 또는 단지번호 목록으로 필터)"""
+        query, args = "SELECT data FROM complexes", []
+        if cortar_no:
+            query += " WHERE cortarNo = ?"
+            args.append(str(cortar_no))
+        elif complex_nos is not None:
+            complex_nos = [str(no) for no in complex_nos]
+            if not complex_nos:
+                return []
+            query += f" WHERE complexNo IN ({','.join('?' * len(complex_nos))})"
+            args.extend(complex_nos)
+        with self._lock:
+            rows = self._conn.execute(query, args).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def data_version(self):
+        """단지 데이터 버전 - 이 연결의 단지 변경 횟수와 다른 연결의 커밋 횟수(PRAGMA data_version)"""
+        with self._lock:
+            return (self.complex_version, self._conn.execute("PRAGMA data_version").fetchone()[0])
+
+    def count_complexes(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM complexes").fetchone()[0]
+
+    def get_complex(self, complex_no):
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM complexes WHERE complexNo = ?", (str(complex_no),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_articles(self, complex_no=None, cortar_no=None, trade_type_code=None, confirmed_since=None):
+        """저장된 매물 조회 (단지번호/지역코드/거래유형코드/확인일 이후로 필터, 최신 확인일 순)"""
+        conditions, args = [], []
+        if complex_no is not None:
+            conditions.append("complexNo = ?"); args.append(str(complex_no))
+        if cortar_no:
+            conditions.append("cortarNo = ?"); args.append(str(cortar_no))
+        if trade_type_code:
+            conditions.append("tradeTypeCode = ?"); args.append(trade_type_code)
+        if confirmed_since:
+            conditions.append("articleConfirmYmd >= ?"); args.append(str(confirmed_since))
+        query = "SELECT data FROM articles"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY articleConfirmYmd DESC"
+        with self._lock:
+            rows = self._conn.execute(query, args).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count_articles(self, complex_no):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles WHERE complexNo = ?", (str(complex_no),)).fetchone()[0]
+
+    def save_document(self, name, data):
+        """API 응답 전체를 이름으로 저장 (기존 JSON 파일 저장 대체)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents (name, data, updated_at) VALUES (?, ?, ?)",
+                (name, json.dumps(data, ensure_ascii=False), time.time()))
+
+    def load_document(self, name):
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM documents WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    # --- 수집 체크포인트 (지역 크롤러 재개용) ---
+    def add_crawl_items(self, crawl_id, kind, items):
+        """수집할 항목 등록 [(item_key, data)], 이미 있는 항목은 상태를 유지"""
+        now = time.time()
+        rows = [(crawl_id, kind, str(key), 'pending', json.dumps(data, ensure_ascii=False), now) for key, data in items]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO crawl_items (crawl_id, kind, item_key, status, data, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                rows)
+        return len(rows)
+
+    def set_crawl_status(self, crawl_id, kind, item_key, status):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE crawl_items SET status = ?, updated_at = ? WHERE crawl_id = ? AND kind = ? AND item_key = ?",
+                (status, time.time(), crawl_id, kind, str(item_key)))
+
+    def get_crawl_items(self, crawl_id, kind, statuses=None):
+        """[(item_key, status, data)] - statuses를 주면 해당 상태만"""
+        query = "SELECT item_key, status, data FROM crawl_items WHERE crawl_id = ? AND kind = ?"
+        args = [crawl_id, kind]
+        if statuses:
+            query += f" AND status IN ({','.join('?' * len(statuses))})"
+            args.extend(statuses)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY rowid", args).fetchall()
+        return [(key, status, json.loads(data) if data else None) for key, status, data in rows]
+
+    def count_crawl_items(self, crawl_id, kind):
+        """{status: 개수}"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM crawl_items WHERE crawl_id = ? AND kind = ? GROUP BY status",
+                (crawl_id, kind)).fetchall()
+        return dict(rows)
+
+    def clear_crawl(self, crawl_id):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM crawl_items WHERE crawl_id = ?", (crawl_id,))
+
+    # --- 페이지 저널 (여러 페이지 수집 재개용) ---
+    def save_journal_page(self, journal_key, page, items, is_more):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO page_journal (journal_key, page, is_more, data, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (journal_key, int(page), 1 if is_more else 0, json.dumps(items, ensure_ascii=False), time.time()))
+
+    def load_journal_pages(self, journal_key, since=None):
+        """[(page, items, is_more)] 페이지 순, since(유닉스 시각) 이후에 기록한 것만"""
+        query = "SELECT page, data, is_more FROM page_journal WHERE journal_key = ?"
+        args = [journal_key]
+        if since is not None:
+            query += " AND updated_at >= ?"
+            args.append(since)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY page", args).fetchall()
+        return [(page, json.loads(data), bool(is_more)) for page, data, is_more in rows]
+
+    def clear_journal(self, journal_key=None, before=None):
+        """저널 삭제 (journal_key가 없으면 before 시각 이전에 기록한 오래된 저널 전체)"""
+        with self._lock, self._conn:
+            if journal_key is not None:
+                self._conn.execute("DELETE FROM page_journal WHERE journal_key = ?", (journal_key,))
+            elif before is not None:
+                self._conn.execute("DELETE FROM page_journal WHERE updated_at < ?", (before,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,356 @@
+import asyncio
+import importlib.util
+import json
+import threading
+
+from response_cache import CachedResponse
+from crawl_journal import unseen_articles
+
+
+# aiohttp는 선택 의존성이고 불러오는 데 오래 걸리므로 클라이언트를 처음 만들 때 불러옴 (없으면 기존 스레드 방식 사용)
+aiohttp = None
+
+
+def is_available():
+    """비동기 클라이언트를 쓸 수 있는지 (aiohttp 설치 여부, 모듈을 불러오지 않고 확인)"""
+    return aiohttp is not None or importlib.util.find_spec('aiohttp') is not None
+
+
+def _load_aiohttp():
+    global aiohttp
+    if aiohttp is None:
+        try:
+            import aiohttp as module
+        except ImportError:
+            return None
+        aiohttp = module
+    return aiohttp
+
+
+class AsyncResponse:
+    """requests.Response와 같은 방식으로 쓰는 aiohttp 응답 본문 래퍼"""
+
+    def __init__(self, status_code, content, headers):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class AsyncLoopThread:
+    """asyncio 이벤트 루프를 돌리는 백그라운드 스레드 하나
+
+    Qt 이벤트 루프와 따로 돌며, 요청 수와 상관없이 OS 스레드는 이 하나만 쓴다.
+    결과는 submit이 돌려주는 Future의 완료 콜백(작업 스레드에서 호출)이나 Qt 시그널로 GUI에 전달한다.
+    """
+
+    def __init__(self, name="async-api"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        """코루틴을 루프에 넣고 concurrent.futures.Future 반환 (어느 스레드에서나 호출 가능)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout=None):
+        """코루틴이 끝날 때까지 기다렸다가 결과 반환 (루프 스레드 밖에서만 호출)"""
+        return self.submit(coro).result(timeout)
+
+    def stop(self):
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+
+
+class AsyncNaverLandAPI:
+    """NaverLandAPI의 엔드포인트를 asyncio(aiohttp)로 호출하는 클라이언트
+
+    헤더/쿠키/토큰, 속도 제한기, 응답 캐시, 로컬 저장소는 동기 클라이언트(api)와 공유한다.
+    모든 요청이 하나의 aiohttp 세션(연결 풀)을 쓰고, 동시에 보내는 요청 수는 세마포어(max_concurrency)로
+    제한한다. 세션과 세마포어는 처음 요청하는 이벤트 루프에서 만들어지므로 한 루프에서만 사용한다.
+    """
+
+    def __init__(self, api, max_concurrency=32):
+        if _load_aiohttp() is None:
+            raise RuntimeError("aiohttp가 설치되어 있지 않습니다. (pip install aiohttp)")
+        self.api = api
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._session = None
+        self._semaphore = None
+
+    async def open(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.api.max_connections_per_host)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.api.request_timeout),
+                headers={'connection': 'keep-alive'})
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _get(self, url, params=None, headers=None, use_cache=True):
+        """공유 세션으로 GET 요청 (캐시/속도 제한/429 재시도는 NaverLandAPI._get과 동일)"""
+        await self.open()
+        cache = self.api.response_cache if use_cache else None
+        if cache:
+            # 캐시는 SQLite라서 조회/저장은 루프를 막지 않도록 스레드에서 실행
+            try:
+                cached_body = await asyncio.to_thread(cache.get, url, params)
+                if cached_body is not None:
+                    return CachedResponse(cached_body)
+            except Exception as e:
+                print(f"캐시 조회 중 오류: {e}")
+
+        limiter = self.api.rate_limiter
+        attempt = 0
+        while True:
+            wait_time = limiter.reserve()
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+            async with self._semaphore:
+                async with self._session.get(
+                    url,
+                    params=params,
+                    headers=headers if headers is not None else self.api.headers,
+                    cookies=self.api.cookies,
+                ) as response:
+                    result = AsyncResponse(response.status, await response.read(), response.headers)
+            if result.status_code == 429 and attempt < self.api.max_retries:
+                attempt += 1
+                wait_time = limiter.on_throttled(result.headers.get('Retry-After'))
+                print(f"API 요청 제한 초과(429). {wait_time:.1f}초 후 재시도합니다... ({attempt}/{self.api.max_retries}, 현재 속도 {limiter.rate:.1f}회/초)")
+                continue
+            if result.status_code < 400:
+                limiter.on_success()
+            if cache and result.status_code == 200:
+                try:
+                    await asyncio.to_thread(cache.set, url, params, result.content)
+                except Exception as e:
+                    print(f"캐시 저장 중 오류: {e}")
+            return result
+
+    async def _refresh_token(self):
+        # 토큰 갱신은 파일을 읽는 동기 코드이므로 루프를 막지 않도록 스레드에서 실행
+        return await asyncio.to_thread(self.api._refresh_token)
+
+    # --- 단지 매물 ---
+    async def iter_complex_article_pages(self, complex_no, max_pages=None, use_cache=True, order='rank', use_journal=False):
+        """단지 매물을 페이지 단위로 내주는 비동기 제너레이터 (항목 형식, 중복 제거, 저널은 NaverLandAPI와 같음)"""
+        base_url, params = self.api._complex_article_request(complex_no, order)
+        seen = set()
+        page = 1
+        journal = self.api.page_journal
+        # 저널도 SQLite 저장소에 기록하므로 스레드에서 실행
+        run = await asyncio.to_thread(journal.begin, base_url, params) if use_journal and journal else None
+        if run and run.saved_pages:
+            for saved_page, items, is_more in run.saved_pages:
+                if max_pages is not None and saved_page > max_pages:
+                    return
+                yield {'page': saved_page, 'articleList': unseen_articles(items, seen), 'isMoreData': is_more,
+                       'requestCount': 0, 'fromJournal': True}
+            page = run.next_page
+        request_count = 0
+        refreshed_page = None  # 토큰을 갱신하고 재시도한 페이지 (페이지마다 한 번만 갱신)
+        while max_pages is None or page <= max_pages:
+            params['page'] = str(page)
+            try:
+                response = await self._get(base_url, params=params, use_cache=use_cache)
+                request_count += 1
+                if response.status_code == 200:
+                    data = response.json()
+                    page_data = {
+                        'page': page,
+                        'articleList': data.get('articleList', []),
+                        'isMoreData': data.get('isMoreData', False),
+                        'requestCount': request_count,
+                    }
+                elif response.status_code == 401 and refreshed_page != page and await self._refresh_token():
+                    refreshed_page = page
+                    print("인증 토큰이 갱신되었습니다. 요청을 재시도합니다.")
+                    continue
+                else:
+                    print(f"단지 {complex_no} 매물 API 오류: 상태 코드 {response.status_code} (페이지 {page})")
+                    page_data = {'page': page, 'articleList': [], 'isMoreData': False,
+                                 'requestCount': request_count, 'error': f"API 오류: 상태 코드 {response.status_code}"}
+            except Exception as e:
+                print(f"단지 {complex_no} 매물 API 요청 중 예외 발생: {e}")
+                page_data = {'page': page, 'articleList': [], 'isMoreData': False,
+                             'requestCount': request_count, 'error': f"API 요청 중 오류 발생: {str(e)}"}
+
+            if 'error' in page_data:
+                yield page_data
+                return
+            article_list = page_data['articleList']
+            if not article_list:
+                if run:
+                    await asyncio.to_thread(run.complete)
+                return
+            if run:
+                # 마지막 페이지면 저널을 먼저 지움 (소비자가 이 페이지에서 멈추면 yield 뒤 코드는 실행되지 않음)
+                if page_data['isMoreData']:
+                    await asyncio.to_thread(run.record, page, article_list, True)
+                else:
+                    await asyncio.to_thread(run.complete)
+            page_data['articleList'] = unseen_articles(article_list, seen)
+            yield page_data
+            if not page_data['isMoreData']:
+                return
+            page += 1
+            request_count = 0
+
+    async def search_by_complex(self, complex_no, max_pages=None, use_cache=True, order='rank', page_callback=None,
+                                use_journal=None):
+        """단지번호로 매물 검색 - 결과 형식과 부분 결과/저널 처리는 NaverLandAPI.search_by_complex와 같음"""
+        result = {'articleList': [], 'totalPages': 0, 'totalCount': 0, 'isMoreData': False, 'requestCount': 0}
+        if use_journal is None:
+            use_journal = max_pages is None and page_callback is None
+        pages = self.iter_complex_article_pages(complex_no, max_pages=max_pages, use_cache=use_cache, order=order,
+                                                use_journal=use_journal)
+        try:
+            async for page_data in pages:
+                result['requestCount'] += page_data['requestCount']
+                if 'error' in page_data:
+                    result['error'] = page_data['error']
+                    result['isPartial'] = True
+                    result['isMoreData'] = True
+                    break
+                article_list = page_data['articleList']
+                result['articleList'].extend(article_list)
+                result['isMoreData'] = page_data['isMoreData']
+                if page_data['page'] == 1:
+                    result['totalCount'] = len(article_list)
+                    result['totalPages'] = 1000 if page_data['isMoreData'] else 1
+                if page_data['isMoreData'] and page_callback and page_callback(page_data['page'], article_list):
+                    break
+        finally:
+            await pages.aclose()
+        return result
+
+    # --- 키워드 검색 ---
+    async def iter_keyword_pages(self, keyword, max_pages=None, use_cache=True):
+        """키워드 검색 응답을 페이지 단위로 내주는 비동기 제너레이터 (항목 형식은 NaverLandAPI와 같음)"""
+        url = "https://new.land.naver.com/api/search"
+        max_pages_to_search = max_pages if max_pages is not None else 1000
+        page = 1
+        refreshed_page = None  # 토큰을 갱신하고 재시도한 페이지 (페이지마다 한 번만 갱신)
+        while page <= max_pages_to_search:
+            try:
+                response = await self._get(url, params={'keyword': keyword, 'page': str(page)}, use_cache=use_cache)
+                if response.status_code == 200:
+                    data = response.json()
+                elif response.status_code == 401:
+                    if refreshed_page == page:
+                        # 갱신한 토큰도 거절됨 - 같은 페이지를 계속 재시도하지 않고 오류로 끝냄
+                        data = {'complexes': [], 'error': "인증 토큰 갱신 실패"}
+                    elif await self._refresh_token():
+                        refreshed_page = page
+                        continue
+                    else:
+                        self.api.use_test_mode = True
+                        return
+                else:
+                    data = {'complexes': [], 'error': f"API 오류: 상태 코드 {response.status_code}"}
+            except Exception as e:
+                data = {'complexes': [], 'error': f"API 요청 중 오류 발생: {str(e)}"}
+
+            if 'error' in data:
+                error = data['error']
+                if isinstance(error, dict):
+                    data = {'complexes': [], 'error': error.get('message', '알 수 없는 오류')}
+                print(f"키워드 검색 오류: {data['error']}")
+                yield data
+                return
+            if page > 1 and not data.get('complexes'):
+                return
+            yield data
+            if not data.get('isMoreData', False):
+                return
+            page += 1
+
+    async def search_by_keyword(self, keyword, max_pages=None, use_cache=True, progress_callback=None):
+        """키워드로 단지 검색 (결과 병합/저장은 NaverLandAPI와 같은 코드를 사용)"""
+        pages = []
+        async for data in self.iter_keyword_pages(keyword, max_pages=max_pages, use_cache=use_cache):
+            pages.append(data)
+            if progress_callback:
+                progress_callback(min(int((len(pages) / (max_pages or 20)) * 100), 95), f"페이지 {len(pages)} 가져옴...")
+        if progress_callback:
+            progress_callback(100, "검색 완료")
+        # 저장소(SQLite) 기록이 루프를 오래 막지 않도록 스레드에서 병합/저장
+        return await asyncio.to_thread(self.api._merge_keyword_pages, keyword, pages)
+
+    # --- 지역 ---
+    async def iter_cortar_complex_pages(self, cortarId, max_pages=1000):
+        """지역 코드의 단지 목록을 페이지 단위로 내주는 비동기 제너레이터"""
+        url = "https://new.land.naver.com/api/regions/complexes"
+        for page in range(1, max_pages + 1):
+            params = {'cortarId': cortarId, 'realEstateType': 'APT', 'order': 'rank', 'page': str(page)}
+            try:
+                response = await self._get(url, params=params)
+                if response.status_code != 200:
+                    print(f"지역 단지 목록 API 요청 실패: {response.status_code}")
+                    return
+                data = response.json()
+            except Exception as e:
+                print(f"지역 단지 목록 API 요청 중 오류 발생: {e}")
+                return
+            page_complexes = data.get('complexList', [])
+            if not page_complexes:
+                return
+            yield page_complexes
+            if not data.get('isMoreData', False):
+                return
+
+    async def get_complexes_by_cortarId(self, cortarId, max_pages=1000):
+        """특정 지역 코드로 단지 정보 검색"""
+        all_complexes = []
+        async for page_complexes in self.iter_cortar_complex_pages(cortarId, max_pages=max_pages):
+            all_complexes.extend(page_complexes)
+        result_data = {"complexes": all_complexes}
+        await asyncio.to_thread(self.api.save_response, result_data, f"cortarId_{cortarId}_complexes")
+        return result_data
+
+    async def search_region_info(self, region_code='4100000000'):
+        """지역 정보 조회 (regions/list)"""
+        try:
+            response = await self._get('https://new.land.naver.com/api/regions/list', params={'cortarNo': region_code})
+            if response.status_code == 200:
+                return response.json()
+            print(f"지역 정보 API 요청 실패: {response.status_code}")
+        except Exception as e:
+            print(f"지역 정보 API 요청 중 오류 발생: {e}")
+        return None
+
+    async def search_by_location(self, lat='37.2689669', lon='127.0057464', zoom='16'):
+        """좌표 기준 매물/단지 조회 (articles?ms=위도,경도,줌)"""
+        params = {'ms': f'{lat},{lon},{zoom}', 'a': 'APT:PRE:ABYG:JGC', 'e': 'RETAIL'}
+        try:
+            response = await self._get('https://new.land.naver.com/api/articles', params=params)
+            if response.status_code == 200:
+                return response.json()
+            print(f"위치 검색 API 요청 실패: {response.status_code}")
+        except Exception as e:
+            print(f"위치 검색 API 요청 중 오류 발생: {e}")
+        return None
@@ -0,0 +1,274 @@
+"""화면 없이 수집 작업을 실행하는 명령줄 진입점 (cron 등 예약 실행용)
+
+PySide6를 import하지 않으므로 디스플레이가 없는 서버에서도 실행된다.
+
+사용법:
+    python cli.py jobs.json [--store 저장소.sqlite3] [--output-dir 폴더] [--workers 4] [--report 결과.json]
+
+작업 파일 예시:
+    {
+        "output_dir": "exports",
+        "jobs": [
+            {"type": "keyword", "keyword": "연수동", "output": ["store", "csv"]},
+            {"type": "complex", "complexNo": "1096", "output": "parquet", "max_articles": 100},
+            {"type": "region", "regionCode": "2818510600"},
+            {"type": "area", "bbox": [37.40, 126.66, 37.43, 126.70], "zoom": 16, "output": "csv"}
+        ]
+    }
+
+- type: keyword(키워드로 찾은 모든 단지), complex(단지번호 하나 또는 complexNos 목록), region(지역 전체, 중단 후 이어 받기),
+  area(지도 영역 bbox=[남, 서, 북, 동] 또는 polygon=[[위도, 경도], ...]을 zoom 단계 타일로 훑어 찾은 모든 단지)
+- output: store(로컬 저장소, 기본값), xlsx, csv, jsonl, parquet 중 하나 또는 목록
+  (파일 열 구성은 GUI 내보내기와 같고 xlsx 외에는 열 이름으로 API 키를 씀)
+- name: 출력 파일 이름 (기본값은 type과 검색어)
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from naver_api import NaverLandAPI
+from fetch_engine import ComplexFetchEngine
+from region_crawler import RegionCrawler
+from location_sweep import LocationSweep
+from article_frame import ArticleFrame
+from article_dedup import dedupe_articles
+from article_export import EXPORTERS, ExcelExporter, exporter_for_path
+
+
+JOB_TYPES = ('keyword', 'complex', 'region', 'area')
+OUTPUT_FORMATS = ('store',) + tuple(EXPORTERS)
+
+
+def load_jobs(path):
+    """작업 파일을 읽어 (설정, 작업 목록) 반환 - 최상위가 목록이면 작업 목록으로 취급"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        data = {'jobs': data}
+    jobs = data.get('jobs') or []
+    for index, job in enumerate(jobs, 1):
+        if job.get('type') not in JOB_TYPES:
+            raise ValueError(f"작업 {index}: 알 수 없는 type '{job.get('type')}' (가능: {', '.join(JOB_TYPES)})")
+        for output in job_outputs(job):
+            if output not in OUTPUT_FORMATS:
+                raise ValueError(f"작업 {index}: 알 수 없는 output '{output}' (가능: {', '.join(OUTPUT_FORMATS)})")
+    return data, jobs
+
+
+def job_outputs(job):
+    outputs = job.get('output', 'store')
+    return [outputs] if isinstance(outputs, str) else list(outputs)
+
+
+def job_name(job):
+    if job.get('name'):
+        return job['name']
+    if job['type'] == 'area':
+        value = '_'.join(f"{float(v):g}" for v in job['bbox']) if job.get('bbox') else f"polygon{len(job.get('polygon', []))}"
+        return f"area_{value}"
+    value = job.get('keyword') or job.get('regionCode') or job.get('complexNo') or '_'.join(map(str, job.get('complexNos', [])))
+    return f"{job['type']}_{value}"
+
+
+def write_articles(articles, path):
+    """확장자에 맞는 형식으로 저장 (열 구성은 GUI 내보내기와 같고, 열 이름은 API 키)"""
+    frame = ArticleFrame()
+    frame.extend(articles)
+    exporter_class = exporter_for_path(path)
+    if exporter_class is ExcelExporter:
+        exporter = ExcelExporter(path, articles, frame.price_won, frame.rent_won)
+    else:
+        exporter = exporter_class(path, articles, frame.price_won, frame.rent_won, api_names=True)
+    return exporter.run()
+
+
+class BatchRunner:
+    """작업 파일의 작업을 차례로 실행하고 작업별 소요 시간과 결과를 기록"""
+
+    def __init__(self, api, output_dir='.', max_workers=4):
+        self.api = api
+        self.output_dir = output_dir
+        self.max_workers = max_workers
+
+    def _fetch_complexes(self, complexes, job, store_results):
+        """단지 목록의 매물 수집 (store 출력이면 단지마다 바로 저장)"""
+        engine = ComplexFetchEngine(self.api, max_workers=self.max_workers,
+                                    max_articles_per_complex=job.get('max_articles'),
+                                    max_pages_per_complex=job.get('max_pages'))
+        store = self.api.store
+        # 개수/페이지 제한이 있으면 단지 매물 일부만 받으므로 기존 매물을 지우지 않고 갱신만 함
+        # (지우면 저장소와 증분 갱신 기준이 되는 단지 매물 집합이 잘린 목록으로 바뀜)
+        limited = job.get('max_articles') is not None or job.get('max_pages') is not None
+
+        def _store_result(complex_item, articles):
+            if articles is None:
+                return
+            if limited:
+                store.upsert_articles(articles)
+            else:
+                store.replace_complex_articles(complex_item['complexNo'], articles)
+
+        save_results = store_results and store
+        if save_results:
+            store.upsert_complexes(complexes)
+        articles, names, failed = engine.run(complexes, on_result=_store_result if save_results else None)
+        return articles, {'complexes': len(complexes), 'complexesWithArticles': len(names), 'failed': failed}
+
+    def run_keyword(self, job, store_results):
+        result = self.api.search_by_keyword(job['keyword'], max_pages=job.get('max_pages'))
+        if result.get('error'):
+            raise RuntimeError(f"키워드 검색 실패: {result['error']}")
+        complexes = [c for c in result.get('complexes', []) if c.get('complexNo')]
+        return self._fetch_complexes(complexes, job, store_results)
+
+    def run_complex(self, job, store_results):
+        complex_nos = job.get('complexNos') or [job['complexNo']]
+        complexes = []
+        for complex_no in map(str, complex_nos):
+            # 저장소에 단지 정보가 있으면 이름/주소를 매물에 함께 넣음
+            stored = self.api.store.get_complex(complex_no) if self.api.store else None
+            complexes.append(dict(stored or {}, complexNo=complex_no))
+        return self._fetch_complexes(complexes, job, store_results)
+
+    def run_region(self, job, store_results):
+        if not self.api.store:
+            raise RuntimeError("지역 수집에는 로컬 저장소가 필요합니다.")
+        region_code = str(job['regionCode'])
+        crawler = RegionCrawler(self.api, max_workers=self.max_workers)
+        summary = crawler.crawl(region_code, resume=job.get('resume', True))
+        articles = []
+        if set(job_outputs(job)) - {'store'}:
+            # 지역 수집은 저장소에 바로 저장하므로 파일 출력은 저장된 매물을 다시 읽음
+            crawl_id = crawler.crawl_id(region_code)
+            for complex_no, _, _ in self.api.store.get_crawl_items(crawl_id, 'complex', ['done']):
+                articles.extend(self.api.store.get_articles(complex_no=complex_no))
+        info = {'complexes': sum(summary['complexes'].values()), 'crawlStatus': summary['complexes'],
+                'isComplete': summary['isComplete'], 'articles': summary['articlesSaved']}
+        return articles, info
+
+    def run_area(self, job, store_results):
+        sweep = LocationSweep(self.api, max_workers=self.max_workers)
+        summary = sweep.sweep(bbox=job.get('bbox'), polygon=job.get('polygon'), zoom=job.get('zoom', 16))
+        articles, info = self._fetch_complexes(summary['complexes'], job, store_results)
+        info.update(tiles=summary['tiles'], failedTiles=len(summary['failedTiles']))
+        return articles, info
+
+    def _write_outputs(self, job, articles):
+        files = []
+        outputs = [output for output in job_outputs(job) if output != 'store']
+        if not articles or not outputs:
+            return files, None
+        # 파일에는 같은 매물/같은 집 중복을 합쳐서 씀 (저장소는 매물번호 기준이라 그대로)
+        articles, dedupe_stats = dedupe_articles(articles)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        os.makedirs(self.output_dir, exist_ok=True)
+        for output in outputs:
+            path = os.path.join(self.output_dir, f"{job_name(job)}_{stamp}.{output}")
+            write_articles(articles, path)
+            files.append(path)
+        return files, dedupe_stats
+
+    def run_job(self, job):
+        """작업 하나 실행 - 실패해도 예외를 올리지 않고 결과에 error로 기록"""
+        report = {'name': job_name(job), 'type': job['type']}
+        started = time.perf_counter()
+        try:
+            store_results = 'store' in job_outputs(job)
+            articles, info = getattr(self, f"run_{job['type']}")(job, store_results)
+            report.update(info)
+            fetch_seconds = time.perf_counter() - started
+            report.setdefault('articles', len(articles))
+            report['fetchSeconds'] = round(fetch_seconds, 2)
+            report['articlesPerSecond'] = round(report['articles'] / fetch_seconds, 1) if fetch_seconds > 0 else None
+            report['files'], dedupe_stats = self._write_outputs(job, articles)
+            if dedupe_stats and dedupe_stats['output'] != dedupe_stats['input']:
+                report['duplicatesMerged'] = dedupe_stats['input'] - dedupe_stats['output']
+        except Exception as e:
+            report['error'] = str(e)
+        report['seconds'] = round(time.perf_counter() - started, 2)
+        return report
+
+    def run(self, jobs, log=print):
+        reports = []
+        for index, job in enumerate(jobs, 1):
+            log(f"[{index}/{len(jobs)}] {job_name(job)} 시작")
+            report = self.run_job(job)
+            reports.append(report)
+            log(format_report(report))
+        return reports
+
+
+def format_report(report):
+    parts = [f"{report['name']}: {report['seconds']}초"]
+    if 'articles' in report:
+        parts.append(f"매물 {report['articles']}건 ({report['articlesPerSecond']}건/초)")
+    if 'complexes' in report:
+        parts.append(f"단지 {report['complexes']}개")
+    if report.get('failedTiles'):
+        parts.append(f"실패한 타일 {report['failedTiles']}개")
+    if report.get('failed'):
+        parts.append(f"실패 {len(report['failed'])}개")
+    if report.get('isComplete') is False:
+        parts.append("미완료(다시 실행하면 이어 받음)")
+    if report.get('duplicatesMerged'):
+        parts.append(f"중복 {report['duplicatesMerged']}건 합침")
+    for path in report.get('files', []):
+        parts.append(f"→ {path}")
+    if 'error' in report:
+        parts.append(f"오류: {report['error']}")
+    return ", ".join(parts)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="네이버 부동산 매물 일괄 수집 (화면 없이 실행)")
+    parser.add_argument('job_file', help="작업 파일 (JSON)")
+    parser.add_argument('--store', help="로컬 저장소 경로 (기본: 실행 폴더의 naver_land_store.sqlite3)")
+    parser.add_argument('--output-dir', help="파일 저장 폴더 (작업 파일의 output_dir보다 우선)")
+    parser.add_argument('--workers', type=int, default=4, help="동시에 수집할 단지 수 (기본 4)")
+    parser.add_argument('--rate', type=float, default=10, help="초당 최대 요청 수 (기본 10)")
+    parser.add_argument('--no-cache', action='store_true', help="응답 캐시를 쓰지 않음")
+    parser.add_argument('--report', help="작업별 결과/소요 시간을 저장할 JSON 경로")
+    parser.add_argument('--verbose', action='store_true', help="API 진행 로그를 모두 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        settings, jobs = load_jobs(args.job_file)
+    except (OSError, ValueError) as e:
+        print(f"작업 파일을 읽을 수 없습니다: {e}", file=sys.stderr)
+        return 2
+
+    started_at = datetime.now()
+    started = time.perf_counter()
+    # API 로그(저장소/캐시 초기화, 페이지별 요청 로그)는 --verbose일 때만 보임
+    # (큰 작업은 로그가 매우 많으므로 메모리에 모으지 않고 버림)
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        api_log = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(devnull)
+        with api_log:
+            api = NaverLandAPI(max_requests_per_second=args.rate, use_cache=not args.no_cache, store_path=args.store)
+        runner = BatchRunner(api, output_dir=args.output_dir or settings.get('output_dir', '.'), max_workers=args.workers)
+
+        def log(message):
+            print(message, file=sys.__stdout__, flush=True)
+
+        with api_log:
+            reports = runner.run(jobs, log=log)
+
+    total_seconds = round(time.perf_counter() - started, 2)
+    failed_jobs = [r for r in reports if 'error' in r]
+    print(f"완료: 작업 {len(reports)}개, 실패 {len(failed_jobs)}개, 총 {total_seconds}초")
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'startedAt': started_at.isoformat(timespec='seconds'), 'seconds': total_seconds,
+                       'jobs': reports}, f, ensure_ascii=False, indent=2)
+    return 1 if failed_jobs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+from collections import defaultdict
+
+
+# 한글 음절의 초성 (유니코드 순서)
+CHOSUNG = ('ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+           'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ')
+CHOSUNG_SET = frozenset(CHOSUNG)
+
+# 검색 결과 순위: 숫자가 작을수록 위에 표시
+RANK_EXACT, RANK_PREFIX, RANK_CONTAINS, RANK_CHOSUNG_PREFIX, RANK_CHOSUNG_CONTAINS = range(5)
+
+
+def normalize_text(text):
+    """비교용 정규화 (소문자, 공백 제거)"""
+    return ''.join(str(text or '').lower().split())
+
+
+def to_chosung(text):
+    """한글 음절을 초성으로 바꾼 문자열 (예: '연수' → 'ㅇㅅ'), 한글이 아닌 글자는 그대로 둠"""
+    chars = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            chars.append(CHOSUNG[code // 588])
+        else:
+            chars.append(ch)
+    return ''.join(chars)
+
+
+def is_chosung_query(text):
+    """초성만으로 이루어진 검색어인지 확인"""
+    return bool(text) and all(ch in CHOSUNG_SET for ch in text)
+
+
+def _grams(text):
+    """색인용 1글자/2글자 조각"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+class _GramIndex:
+    """정규화한 문자열에 대한 1~2글자 조각 색인 (부분 문자열 후보를 빠르게 찾음)"""
+
+    def __init__(self):
+        self.texts = []
+        self.postings = defaultdict(set)
+
+    def add(self, position, text):
+        self.texts.append(text)
+        for gram in _grams(text):
+            self.postings[gram].add(position)
+
+    def candidates(self, query):
+        """query를 부분 문자열로 포함하는 항목 위치 집합"""
+        if len(query) == 1:
+            keys = [query]
+        else:
+            keys = [query[i:i + 2] for i in range(len(query) - 1)]
+        postings = sorted((self.postings.get(key, ()) for key in set(keys)), key=len)
+        if not postings or not postings[0]:
+            return set()
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        if len(query) > 2:
+            result = {pos for pos in result if query in self.texts[pos]}
+        return result
+
+
+class ComplexIndex:
+    """단지 목록의 메모리 색인
+
+    단지명 정확 일치는 해시 조회로, 부분 일치는 1~2글자 조각 색인으로 후보를 좁혀 찾는다.
+    초성만 입력하면(예: 'ㅇㅅ') 단지명의 초성으로 찾는다. 결과는 정확 일치 → 앞부분 일치 →
+    부분 일치 → 초성 일치 순으로, 같은 순위에서는 일치 위치가 앞이고 이름이 짧은 단지가 먼저 온다.
+    """
+
+    def __init__(self, complexes):
+        self.complexes = list(complexes)
+        self._exact_names = defaultdict(list)
+        self._names = _GramIndex()
+        self._chosung_names = _GramIndex()
+        self._addresses = _GramIndex()
+        for position, complex_info in enumerate(self.complexes):
+            name = normalize_text(complex_info.get('complexName'))
+            self._exact_names[name].append(position)
+            self._names.add(position, name)
+            self._chosung_names.add(position, to_chosung(name))
+            self._addresses.add(position, normalize_text(complex_info.get('cortarAddress')))
+
+    def __len__(self):
+        return len(self.complexes)
+
+    def _ranked(self, scored, limit):
+        ranked = sorted(scored.items(), key=lambda item: item[1])
+        if limit:
+            ranked = ranked[:limit]
+        return [self.complexes[position] for position, _ in ranked]
+
+    def search_name(self, query, limit=20):
+        """단지명(또는 초성)으로 검색한 순위별 단지 목록"""
+        query = normalize_text(query)
+        if not query:
+            return []
+        scored = {}
+        for position in self._exact_names.get(query, ()):
+            scored[position] = (RANK_EXACT, 0, len(query))
+
+        if is_chosung_query(query):
+            texts = self._chosung_names.texts
+            for position in self._chosung_names.candidates(query):
+                offset = texts[position].find(query)
+                rank = RANK_CHOSUNG_PREFIX if offset == 0 else RANK_CHOSUNG_CONTAINS
+                scored.setdefault(position, (rank, offset, len(texts[position])))
+        else:
+            texts = self._names.texts
+            for position in self._names.candidates(query):
+                offset = texts[position].find(query)
+                rank = RANK_PREFIX if offset == 0 else RANK_CONTAINS
+                scored.setdefault(position, (rank, offset, len(texts[position])))
+        return self._ranked(scored, limit)
+
+    def search_address(self, query, limit=20):
+        """주소 부분 일치로 검색한 단지 목록 (일치 위치가 앞인 순)"""
+        query = normalize_text(query)
+        if not query:
+            return []
+        texts = self._addresses.texts
+        scored = {}
+        for position in self._addresses.candidates(query):
+            offset = texts[position].find(query)
+            scored[position] = (RANK_PREFIX if offset == 0 else RANK_CONTAINS, offset, position)
+        return self._ranked(scored, limit)
@@ -0,0 +1,74 @@
+import time
+
+from response_cache import make_cache_key
+
+
+# 이보다 오래된 저널 페이지는 매물이 많이 바뀌었을 수 있으므로 이어 받지 않음
+DEFAULT_MAX_AGE = 6 * 60 * 60
+
+
+class PageJournal:
+    """(엔드포인트, 파라미터)별로 끝까지 받은 페이지를 기록하는 체크포인트 저널
+
+    여러 페이지를 받는 도중 오류가 나도 받은 페이지는 저장소(page_journal 테이블)에 남고, 같은 요청을 다시
+    하면 기록된 첫 페이지부터 연속된 페이지는 요청 없이 재생하고 처음 빠진 페이지부터 이어서 받는다.
+    마지막 페이지까지 받으면 그 요청의 저널은 지운다.
+    """
+
+    def __init__(self, store, max_age=DEFAULT_MAX_AGE):
+        self.store = store
+        self.max_age = max_age
+
+    @staticmethod
+    def journal_key(url, params):
+        """페이지 번호를 뺀 URL/파라미터로 만든 키"""
+        return make_cache_key(url, {k: v for k, v in (params or {}).items() if k != 'page'})
+
+    def begin(self, url, params):
+        """요청 하나의 저널 시작 - 재생할 페이지와 이어 받을 페이지 번호를 가진 JournalRun 반환"""
+        return JournalRun(self, self.journal_key(url, params))
+
+    def purge_expired(self):
+        self.store.clear_journal(before=time.time() - self.max_age)
+
+
+class JournalRun:
+    """요청 하나에 대한 저널 (saved_pages: 재생할 [(page, items, is_more)], next_page: 이어서 요청할 페이지)"""
+
+    def __init__(self, journal, key):
+        self.journal = journal
+        self.key = key
+        self.saved_pages = []
+        for page, items, is_more in journal.store.load_journal_pages(key, since=time.time() - journal.max_age):
+            # 1페이지부터 빠짐없이 이어진 페이지만 재생 (마지막 페이지는 기록하지 않고 저널을 지우므로 항상 뒤에 더 있음)
+            if page != len(self.saved_pages) + 1 or not is_more:
+                break
+            self.saved_pages.append((page, items, is_more))
+        self.next_page = len(self.saved_pages) + 1
+
+    def record(self, page, items, is_more=True):
+        try:
+            self.journal.store.save_journal_page(self.key, page, items, is_more)
+        except Exception as e:
+            print(f"페이지 저널 기록 중 오류: {e}")
+
+    def complete(self):
+        """마지막 페이지까지 받았으므로 저널 삭제"""
+        try:
+            self.journal.store.clear_journal(self.key)
+        except Exception as e:
+            print(f"페이지 저널 삭제 중 오류: {e}")
+
+
+def unseen_articles(article_list, seen):
+    """seen(articleNo 집합)에 없는 매물만 반환하고 seen을 갱신 (수집 중 매물이 추가돼 페이지가 밀리면 겹치는 매물 제거)"""
+    fresh = []
+    for article in article_list:
+        article_no = article.get('articleNo')
+        if article_no is not None:
+            article_no = str(article_no)
+            if article_no in seen:
+                continue
+            seen.add(article_no)
+        fresh.append(article)
+    return fresh
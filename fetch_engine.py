@@ -0,0 +1,275 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+def build_complex_context(complex_item):
+    """단지 목록 항목에서 각 매물에 주입할 단지 정보 추출"""
+    return {
+        'complexName': complex_item.get('complexName', 'N/A'),
+        'complexNo': complex_item.get('complexNo'),
+        'cortarAddressFromComplex': complex_item.get('cortarAddress', ''),
+        'cortarNoFromComplex': complex_item.get('cortarNo', ''),
+        'totalDongCountFromComplex': complex_item.get('totalDongCount', ''),
+        'totalHouseholdCountFromComplex': complex_item.get('totalHouseholdCount', ''),
+        'useApproveYmdFromComplex': complex_item.get('useApproveYmd', ''),
+        'highFloorFromComplex': complex_item.get('highFloor', ''),
+        'lowFloorFromComplex': complex_item.get('lowFloor', ''),
+        'maxSupplyAreaFromComplex': complex_item.get('maxSupplyArea', ''),
+        'maxTotalAreaFromComplex': complex_item.get('maxTotalArea', ''),
+        'minSupplyAreaFromComplex': complex_item.get('minSupplyArea', ''),
+        'minTotalAreaFromComplex': complex_item.get('minTotalArea', ''),
+        'useYnFromComplex': complex_item.get('useYn', '')
+    }
+
+
+class ComplexFetchEngine:
+    """여러 단지의 매물을 제한된 동시성으로 병렬 수집하는 엔진
+
+    전체 요청 속도 제한은 NaverLandAPI가 담당하므로, 워커 수를 늘려도
+    초당 요청 수 상한(max_requests_per_second)은 넘지 않는다.
+    refresher(IncrementalRefresher)를 주면 단지마다 바뀐 매물만 증분 갱신한다.
+    """
+
+    def __init__(self, api, max_workers=4, refresher=None, max_articles_per_complex=None, max_pages_per_complex=None):
+        self.api = api
+        self.max_workers = max(1, int(max_workers))
+        self.refresher = refresher
+        # 단지마다 이 개수(또는 페이지 수)만큼 받으면 남은 페이지는 요청하지 않음 (None이면 전부)
+        self.max_articles_per_complex = max_articles_per_complex
+        self.max_pages_per_complex = max_pages_per_complex
+        self._cancel_event = threading.Event()
+        self._delta_lock = threading.Lock()
+        self.delta_summary = {}
+
+    def cancel(self):
+        """진행 중인 수집 취소 (아직 시작하지 않은 단지와 남은 페이지는 건너뜀)"""
+        self._cancel_event.set()
+
+    def _fetch_pages(self, complex_item, complex_context, on_page):
+        """단지 매물을 페이지 단위로 받아 도착할 때마다 on_page로 넘김
+
+        남은 페이지가 있는데 취소되면 None (실패와 같이 처리, 받은 페이지는 저널에 남음)
+        """
+        limit = self.max_articles_per_complex
+        articles = []
+        # 개수/페이지 제한 없이 끝까지 받을 때만 저널을 씀 (중단된 단지는 다음 실행에서 이어 받음)
+        use_journal = limit is None and self.max_pages_per_complex is None
+        pages = self.api.iter_complex_article_pages(complex_item.get('complexNo'), max_pages=self.max_pages_per_complex,
+                                                    use_journal=use_journal)
+        try:
+            for page_data in pages:
+                if 'error' in page_data:
+                    # 실패로 처리 (받은 페이지는 저널에 남아 다시 검색하면 이어 받음)
+                    return None
+                page_articles = page_data['articleList']
+                if limit is not None:
+                    page_articles = page_articles[:limit - len(articles)]
+                for art in page_articles:
+                    art.update(complex_context)
+                articles.extend(page_articles)
+                if on_page and page_articles:
+                    on_page(complex_item, page_articles)
+                if limit is not None and len(articles) >= limit:
+                    break
+                if self._cancel_event.is_set() and page_data['isMoreData']:
+                    # 중간에 취소하면 일부 매물만 받은 것이므로 결과로 쓰지 않음 (저장/완료 표시하지 않도록)
+                    return None
+        finally:
+            pages.close()
+        return articles
+
+    def _fetch_one(self, complex_item, on_page=None):
+        if self._cancel_event.is_set():
+            return None
+        complex_context = build_complex_context(complex_item)
+        if not self.refresher:
+            return self._fetch_pages(complex_item, complex_context, on_page)
+        # 증분 갱신은 단지의 전체 매물 집합이 있어야 하므로 단지 단위로 받음
+        api_result = self.refresher.refresh(complex_item.get('complexNo'))
+        return self._refreshed_articles(complex_item, complex_context, api_result, on_page)
+
+    def _refreshed_articles(self, complex_item, complex_context, api_result, on_page):
+        """증분 갱신 결과에서 변경 건수를 집계하고 단지 정보를 덧붙인 매물 목록 반환"""
+        if not api_result or not isinstance(api_result, dict):
+            return None
+        if 'added' in api_result:
+            with self._delta_lock:
+                self.delta_summary['added'] += len(api_result['added'])
+                self.delta_summary['removed'] += len(api_result['removed'])
+                self.delta_summary['priceChanged'] += len(api_result['priceChanged'])
+                self.delta_summary['requests'] += api_result.get('requestCount', 0)
+        articles = api_result.get('articleList', [])
+        for art in articles:
+            art.update(complex_context)
+        if on_page and articles:
+            on_page(complex_item, articles)
+        return articles
+
+    def _start_run(self):
+        self._cancel_event.clear()
+        self.delta_summary = {'added': 0, 'removed': 0, 'priceChanged': 0, 'requests': 0}
+
+    def _record_done(self, complex_item, index, articles, error, results, failed_complex_searches, on_complex_done,
+                     on_result=None, keep_results=True):
+        """단지 하나의 결과를 results/실패 목록에 반영"""
+        c_name = complex_item.get('complexName', 'N/A')
+        if error is not None:
+            failed_complex_searches.append(f"{c_name}(에러:{str(error)[:30]})")
+            print(f"개별 단지({c_name}) 매물 검색 오류: {error}")
+            articles = None
+
+        if articles is None:
+            if error is None and not self._cancel_event.is_set():
+                failed_complex_searches.append(f"{c_name}(API오류)")
+        elif not articles:
+            failed_complex_searches.append(f"{c_name}(매물X)")
+        else:
+            if keep_results:
+                results[index] = articles
+            if on_complex_done:
+                on_complex_done(complex_item, articles)
+        if on_result:
+            on_result(complex_item, articles)
+
+    @staticmethod
+    def _combine(complexes, results):
+        all_found_articles, names_of_complexes_with_articles = [], []
+        for index in sorted(results):
+            all_found_articles.extend(results[index])
+            c_name = complexes[index].get('complexName', 'N/A')
+            if c_name not in names_of_complexes_with_articles:
+                names_of_complexes_with_articles.append(c_name)
+        return all_found_articles, names_of_complexes_with_articles
+
+    def run(self, complexes, on_complex_done=None, on_progress=None, on_page=None, on_result=None, keep_results=True):
+        """단지 목록을 병렬로 검색
+
+        on_page(complex_item, articles)는 매물 페이지가 도착할 때마다 작업 스레드에서 호출되고
+        (증분 갱신 시에는 단지당 한 번), on_complex_done(complex_item, articles)는 매물이 있는 단지가 끝날 때마다,
+        on_result(complex_item, articles)는 모든 단지가 끝날 때마다(실패하면 articles가 None),
+        on_progress(done, total, complex_name)는 진행률 표시용으로 호출된다.
+        keep_results가 False면 매물을 모아 두지 않는다 (대량 수집 시 콜백에서 바로 저장할 때).
+        반환값: (입력 순서대로 합친 매물 목록, 매물이 있는 단지명 목록, 실패 단지 목록)
+        """
+        self._start_run()
+        results = {}
+        failed_complex_searches = []
+        total = len(complexes)
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="complex-fetch") as executor:
+            futures = {}
+            for index, complex_item in enumerate(complexes):
+                c_name = complex_item.get('complexName', 'N/A')
+                if not complex_item.get('complexNo'):
+                    failed_complex_searches.append(f"{c_name}(번호없음)")
+                    continue
+                futures[executor.submit(self._fetch_one, complex_item, on_page)] = index
+
+            for future in as_completed(futures):
+                index = futures[future]
+                complex_item = complexes[index]
+                done += 1
+                articles, error = None, None
+                try:
+                    articles = future.result()
+                except Exception as e:
+                    error = e
+                self._record_done(complex_item, index, articles, error, results, failed_complex_searches, on_complex_done,
+                                  on_result, keep_results)
+
+                if on_progress:
+                    on_progress(done, total, complex_item.get('complexName', 'N/A'))
+
+        all_found_articles, names_of_complexes_with_articles = self._combine(complexes, results)
+        return all_found_articles, names_of_complexes_with_articles, failed_complex_searches
+
+
+class AsyncComplexFetchEngine(ComplexFetchEngine):
+    """ComplexFetchEngine과 같은 방식으로 쓰는 비동기 수집 엔진
+
+    단지마다 스레드를 쓰는 대신 AsyncNaverLandAPI의 이벤트 루프(AsyncLoopThread 하나)에서 모든 단지를
+    동시에 요청한다. 동시에 보내는 요청 수는 클라이언트의 세마포어가, 초당 요청 수는 공유 속도 제한기가 제한한다.
+    run은 호출한 스레드에서 끝날 때까지 기다리며, 콜백은 루프 스레드에서 호출된다.
+    """
+
+    def __init__(self, client, loop_thread, refresher=None, max_articles_per_complex=None, max_pages_per_complex=None):
+        super().__init__(client.api, max_workers=client.max_concurrency, refresher=refresher,
+                         max_articles_per_complex=max_articles_per_complex, max_pages_per_complex=max_pages_per_complex)
+        self.client = client
+        self.loop_thread = loop_thread
+
+    async def _fetch_pages_async(self, complex_item, complex_context, on_page):
+        limit = self.max_articles_per_complex
+        articles = []
+        use_journal = limit is None and self.max_pages_per_complex is None
+        pages = self.client.iter_complex_article_pages(complex_item.get('complexNo'), max_pages=self.max_pages_per_complex,
+                                                       use_journal=use_journal)
+        try:
+            async for page_data in pages:
+                if 'error' in page_data:
+                    return None
+                page_articles = page_data['articleList']
+                if limit is not None:
+                    page_articles = page_articles[:limit - len(articles)]
+                for art in page_articles:
+                    art.update(complex_context)
+                articles.extend(page_articles)
+                if on_page and page_articles:
+                    on_page(complex_item, page_articles)
+                if limit is not None and len(articles) >= limit:
+                    break
+                if self._cancel_event.is_set() and page_data['isMoreData']:
+                    # 중간에 취소하면 일부 매물만 받은 것이므로 결과로 쓰지 않음 (저장/완료 표시하지 않도록)
+                    return None
+        finally:
+            await pages.aclose()
+        return articles
+
+    async def _fetch_one_async(self, complex_item, on_page):
+        if self._cancel_event.is_set():
+            return None
+        complex_context = build_complex_context(complex_item)
+        if not self.refresher:
+            return await self._fetch_pages_async(complex_item, complex_context, on_page)
+        api_result = await self.refresher.refresh_async(complex_item.get('complexNo'), self.client)
+        return self._refreshed_articles(complex_item, complex_context, api_result, on_page)
+
+    async def run_async(self, complexes, on_complex_done=None, on_progress=None, on_page=None, on_result=None, keep_results=True):
+        """run의 코루틴 버전 (반환값 형식도 같음)"""
+        self._start_run()
+        results = {}
+        failed_complex_searches = []
+        total = len(complexes)
+        done = 0
+
+        tasks = {}
+        for index, complex_item in enumerate(complexes):
+            if not complex_item.get('complexNo'):
+                failed_complex_searches.append(f"{complex_item.get('complexName', 'N/A')}(번호없음)")
+                continue
+            tasks[asyncio.ensure_future(self._fetch_one_async(complex_item, on_page))] = index
+
+        pending = set(tasks)
+        while pending:
+            finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                index = tasks[task]
+                complex_item = complexes[index]
+                done += 1
+                articles, error = None, None
+                try:
+                    articles = task.result()
+                except Exception as e:
+                    error = e
+                self._record_done(complex_item, index, articles, error, results, failed_complex_searches, on_complex_done,
+                                  on_result, keep_results)
+                if on_progress:
+                    on_progress(done, total, complex_item.get('complexName', 'N/A'))
+
+        all_found_articles, names_of_complexes_with_articles = self._combine(complexes, results)
+        return all_found_articles, names_of_complexes_with_articles, failed_complex_searches
+
+    def run(self, complexes, on_complex_done=None, on_progress=None, on_page=None, on_result=None, keep_results=True):
+        return self.loop_thread.run(self.run_async(complexes, on_complex_done, on_progress, on_page, on_result, keep_results))
@@ -0,0 +1,235 @@
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from fetch_engine import ComplexFetchEngine
+
+
+# 타일 하나가 덮는 지도 화면 크기(px) - 위치 검색 응답이 화면 중심 주변만 담으므로 작게 잡음
+DEFAULT_TILE_PIXELS = 512
+# 이웃 타일과 겹치는 비율 (경계에 걸친 단지가 빠지지 않도록, 중복은 단지번호로 제거)
+DEFAULT_OVERLAP = 0.1
+# 한 번에 요청할 수 있는 최대 타일 수 (줌을 너무 크게 잡거나 영역이 넓으면 오류)
+MAX_TILES = 5000
+
+
+def tile_span(zoom, lat, tile_pixels=DEFAULT_TILE_PIXELS):
+    """줌 단계에서 tile_pixels 크기 화면이 덮는 (위도 폭, 경도 폭) - 웹 메르카토르 기준"""
+    lon_span = 360.0 / (256 * 2 ** int(zoom)) * tile_pixels
+    return lon_span * math.cos(math.radians(lat)), lon_span
+
+
+def point_in_polygon(lat, lon, polygon):
+    """(lat, lon)이 [(위도, 경도), ...] 다각형 안(경계 포함)에 있는지"""
+    inside = False
+    count = len(polygon)
+    for i in range(count):
+        lat1, lon1 = polygon[i]
+        lat2, lon2 = polygon[(i + 1) % count]
+        if (lat1 > lat) != (lat2 > lat):
+            crossing_lon = lon1 + (lat - lat1) * (lon2 - lon1) / (lat2 - lat1)
+            if lon == crossing_lon:
+                return True
+            if lon < crossing_lon:
+                inside = not inside
+    return inside
+
+
+def _segments_cross(p1, p2, q1, q2):
+    def orientation(a, b, c):
+        value = (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+        return (value > 0) - (value < 0)
+    return (orientation(p1, p2, q1) != orientation(p1, p2, q2)
+            and orientation(q1, q2, p1) != orientation(q1, q2, p2))
+
+
+def _tile_touches_polygon(south, west, north, east, polygon):
+    corners = [(south, west), (south, east), (north, east), (north, west)]
+    center = ((south + north) / 2, (west + east) / 2)
+    if any(point_in_polygon(lat, lon, polygon) for lat, lon in corners + [center]):
+        return True
+    if any(south <= lat <= north and west <= lon <= east for lat, lon in polygon):
+        return True
+    edges = list(zip(corners, corners[1:] + corners[:1]))
+    return any(_segments_cross(a, b, c, d) for a, b in edges
+               for c, d in zip(polygon, polygon[1:] + polygon[:1]))
+
+
+def plan_tiles(bbox=None, polygon=None, zoom=16, tile_pixels=DEFAULT_TILE_PIXELS, overlap=DEFAULT_OVERLAP):
+    """영역을 덮는 타일 중심 좌표 [(위도, 경도), ...]
+
+    bbox는 (남, 서, 북, 동), polygon은 [(위도, 경도), ...]. polygon을 주면 다각형에 걸치는 타일만 남긴다.
+    """
+    if polygon:
+        polygon = [(float(lat), float(lon)) for lat, lon in polygon]
+        if len(polygon) < 3:
+            raise ValueError("다각형은 꼭짓점이 3개 이상이어야 합니다.")
+        latitudes = [lat for lat, _ in polygon]
+        longitudes = [lon for _, lon in polygon]
+        bbox = (min(latitudes), min(longitudes), max(latitudes), max(longitudes))
+    if not bbox:
+        raise ValueError("bbox 또는 polygon이 필요합니다.")
+    south, west, north, east = map(float, bbox)
+    if south > north or west > east:
+        raise ValueError(f"잘못된 영역입니다: {bbox}")
+
+    # 위도 폭은 영역에서 가장 적도에서 먼 위도 기준 (타일이 가장 좁아지는 곳)
+    lat_span, lon_span = tile_span(zoom, max(abs(south), abs(north)), tile_pixels)
+    step = 1 - min(max(overlap, 0.0), 0.9)
+    lat_step, lon_step = lat_span * step, lon_span * step
+    rows = max(1, math.ceil((north - south) / lat_step))
+    cols = max(1, math.ceil((east - west) / lon_step))
+    if rows * cols > MAX_TILES:
+        raise ValueError(f"타일이 너무 많습니다 ({rows * cols}개 > {MAX_TILES}개). 줌을 낮추거나 영역을 줄이세요.")
+
+    tiles = []
+    for row in range(rows):
+        lat = south + lat_step * (row + 0.5) if rows > 1 else (south + north) / 2
+        for col in range(cols):
+            lon = west + lon_step * (col + 0.5) if cols > 1 else (west + east) / 2
+            if polygon and not _tile_touches_polygon(lat - lat_span / 2, lon - lon_span / 2,
+                                                     lat + lat_span / 2, lon + lon_span / 2, polygon):
+                continue
+            tiles.append((round(lat, 7), round(lon, 7)))
+    return tiles
+
+
+def complexes_from_tile(data):
+    """위치 검색 응답에서 단지 목록 추출 (complexes가 없으면 매물의 단지 정보로 만듦)"""
+    complexes = [c for c in (data.get('complexes') or []) if c.get('complexNo')]
+    if complexes:
+        return complexes
+    found = {}
+    for article in data.get('articleList') or []:
+        complex_no = article.get('complexNo')
+        if complex_no and complex_no not in found:
+            found[complex_no] = {
+                'complexNo': str(complex_no),
+                'complexName': article.get('complexName') or article.get('articleName', ''),
+                'latitude': article.get('latitude'),
+                'longitude': article.get('longitude'),
+                'cortarNo': article.get('cortarNo', ''),
+                'realEstateTypeName': article.get('realEstateTypeName', ''),
+            }
+    return list(found.values())
+
+
+class LocationSweep:
+    """지도 영역(사각형 또는 다각형)을 타일로 나눠 위치 검색을 모두 요청하고 단지를 모으는 수집기
+
+    타일 요청은 max_workers개씩 동시에 보내고 (속도 제한은 NaverLandAPI가 담당), 겹치는 타일에서 나온
+    단지는 단지번호로 한 번만 남긴다. 다각형을 주면 좌표가 다각형 밖인 단지는 뺀다.
+    fetch_articles=True면 모은 단지의 매물까지 ComplexFetchEngine으로 받는다.
+    """
+
+    def __init__(self, api, engine=None, max_workers=4):
+        self.api = api
+        self.max_workers = max(1, int(max_workers))
+        self.engine = engine or ComplexFetchEngine(api, max_workers=max_workers)
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """수집 중단 (보낸 타일 요청은 끝까지 받고 남은 타일과 매물 수집은 건너뜀)"""
+        self._cancel_event.set()
+        self.engine.cancel()
+
+    def _fetch_tile(self, lat, lon, zoom):
+        if self._cancel_event.is_set():
+            return None
+        return self.api.get_location_tile(lat, lon, zoom)
+
+    def collect_complexes(self, tiles, zoom=16, polygon=None, on_progress=None):
+        """타일마다 위치 검색 후 단지번호로 중복을 없앤 단지 목록과 실패한 타일 목록 반환"""
+        complexes, failed_tiles = {}, []
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="location-tile") as executor:
+            futures = {executor.submit(self._fetch_tile, lat, lon, zoom): (lat, lon) for lat, lon in tiles}
+            for future in as_completed(futures):
+                tile = futures[future]
+                done += 1
+                try:
+                    data = future.result()
+                except Exception as e:
+                    print(f"타일 {tile} 위치 검색 오류: {e}")
+                    data = None
+                if data is None:
+                    if not self._cancel_event.is_set():
+                        failed_tiles.append(tile)
+                else:
+                    for complex_info in complexes_from_tile(data):
+                        complex_no = str(complex_info['complexNo'])
+                        if complex_no in complexes:
+                            # 같은 단지가 여러 타일에 나오면 처음 것을 두고 빠진 항목만 채움
+                            for key, value in complex_info.items():
+                                complexes[complex_no].setdefault(key, value)
+                        else:
+                            complexes[complex_no] = dict(complex_info, complexNo=complex_no)
+                if on_progress:
+                    on_progress(done, len(tiles), f"타일 {done}/{len(tiles)} (단지 {len(complexes)}개)")
+
+        result = list(complexes.values())
+        if polygon:
+            result = [c for c in result if not self._has_coordinates(c)
+                      or point_in_polygon(float(c['latitude']), float(c['longitude']), polygon)]
+        return result, failed_tiles
+
+    @staticmethod
+    def _has_coordinates(complex_info):
+        try:
+            float(complex_info.get('latitude')), float(complex_info.get('longitude'))
+        except (TypeError, ValueError):
+            return False
+        return True
+
+    def sweep(self, bbox=None, polygon=None, zoom=16, fetch_articles=False, tile_pixels=DEFAULT_TILE_PIXELS,
+              overlap=DEFAULT_OVERLAP, on_progress=None, keep_articles=True):
+        """영역 전체 수집
+
+        on_progress(done, total, message)는 타일이 끝날 때마다, 매물 수집 중에는 단지가 끝날 때마다 호출된다.
+        저장소가 있으면 모은 단지는 저장소에 넣고, 매물은 단지마다 끝나는 즉시 저장한다 (취소되면 저장하지 않음).
+        keep_articles가 False면 매물을 결과에 모아 두지 않는다 (저장소에만 저장할 때).
+        반환값: 요약 dict (tiles, failedTiles, complexes, articles, failedComplexes, elapsed, cancelled)
+        """
+        started = time.time()
+        self._cancel_event.clear()
+        if polygon:
+            polygon = [(float(lat), float(lon)) for lat, lon in polygon]
+        tiles = plan_tiles(bbox, polygon, zoom, tile_pixels, overlap)
+        print(f"위치 수집: 타일 {len(tiles)}개 (줌 {zoom})")
+        complexes, failed_tiles = self.collect_complexes(tiles, zoom, polygon, on_progress)
+        store = self.api.store
+        if store is not None and complexes:
+            store.upsert_complexes(complexes)
+        print(f"위치 수집: 단지 {len(complexes)}개, 실패한 타일 {len(failed_tiles)}개")
+
+        articles, failed_complexes = [], []
+        if fetch_articles and complexes and not self._cancel_event.is_set():
+            # 단지마다 개수/페이지 제한이 있으면 일부 매물만 받으므로 기존 매물을 지우지 않고 갱신만 함
+            limited = (self.engine.max_articles_per_complex is not None
+                       or self.engine.max_pages_per_complex is not None)
+
+            def on_result(complex_item, found):
+                # 실패했거나 취소 중에 끝난 단지는 저장하지 않음 (일부만 받았을 수 있음)
+                if store is None or found is None or self._cancel_event.is_set():
+                    return
+                if limited:
+                    store.upsert_articles(found)
+                else:
+                    store.replace_complex_articles(complex_item['complexNo'], found)
+
+            def on_complex_progress(done, total, complex_name):
+                if on_progress:
+                    on_progress(done, total, f"{complex_name} 매물 수집 완료 ({done}/{total})")
+
+            articles, _, failed_complexes = self.engine.run(complexes, on_progress=on_complex_progress,
+                                                            on_result=on_result, keep_results=keep_articles)
+        return {
+            'tiles': len(tiles),
+            'failedTiles': failed_tiles,
+            'complexes': complexes,
+            'articles': articles,
+            'failedComplexes': failed_complexes,
+            'elapsed': round(time.time() - started, 1),
+            'cancelled': self._cancel_event.is_set(),
+        }
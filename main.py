@@ -9,8 +9,6 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.append(current_dir)
 
-from main_window import MainWindow
-
 def get_app_data_path(filename=""):
     # QApplication 인스턴스 생성 후, QCoreApplication 이름들이 설정된 후 호출되어야 함
     org_name = QCoreApplication.organizationName()
@@ -54,6 +52,8 @@ if __name__ == "__main__":
     print(f"애플리케이션 데이터 기본 경로: {get_app_data_path()}")
 
     try:
+        # 메인 창 모듈(API/테이블 등)은 QApplication을 만든 뒤에 불러옴
+        from main_window import MainWindow
         window = MainWindow(None)
         window.show()
         sys.exit(app.exec())
@@ -4,27 +4,54 @@ from PySide6.QtWidgets import (
     QComboBox, QFrame, QMessageBox, QCheckBox, QRadioButton, QButtonGroup,
     QFileDialog, QProgressBar, QSplitter, QStatusBar, QStyle, QMenu, QToolBar, QProgressDialog
 )
-from PySide6.QtCore import Qt, Signal, Slot, QSize, QMetaObject, QDateTime, QTimer, QObject, Q_ARG
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QMetaObject, QDateTime, QTimer, QObject, Q_ARG, QRunnable, QThreadPool
 from PySide6.QtGui import QPixmap, QIcon, QAction, QFont, QCursor
 from property_table import PropertyTable
-from property_detail import PropertyDetailWidget
 from naver_api import NaverLandAPI
+from fetch_engine import ComplexFetchEngine, AsyncComplexFetchEngine
+import async_api
+from article_delta import IncrementalRefresher
+from price_stats import PriceStats
+from article_frame import area_key
+from article_export import EXPORTERS, ExcelExporter, ExportCancelled, exporter_for_path
 from loading_dialog import LoadingDialog
+from search_history import SearchHistory
+from article_dedup import dedupe_articles
 import re
 import os
 import json
-import pandas as pd
 from datetime import datetime
 import time
-import copy
-from openpyxl.styles import PatternFill # 엑셀 스타일링을 위해 추가
 
 class ProgressSignal(QObject):
     progress_updated = Signal(int, str)
     search_completed = Signal(dict)
     search_failed = Signal(str)
-    articles_found = Signal(object, list, int)
+    articles_found = Signal(object, list, int, object)
+    complex_articles_fetched = Signal(object, str)
     show_warning = Signal(int, int, str)
+    export_progress = Signal(int, int)
+    export_finished = Signal(object, str)
+
+
+class ExportTask(QRunnable):
+    """내보내기 한 건을 스레드 풀에서 실행하고 진행/결과를 시그널로 알림"""
+
+    def __init__(self, exporter, signals):
+        super().__init__()
+        self.exporter = exporter
+        self.signals = signals
+
+    def run(self):
+        try:
+            rows = self.exporter.run(on_progress=self.signals.export_progress.emit)
+            self.signals.export_finished.emit(rows, self.exporter.path)
+        except ExportCancelled:
+            self.signals.export_finished.emit(None, "")
+        except Exception as e:
+            import traceback; traceback.print_exc()
+            self.signals.export_finished.emit(None, str(e))
+
 
 class MainWindow(QMainWindow):
     def __init__(self, data=None):
@@ -39,25 +66,44 @@ class MainWindow(QMainWindow):
         
         self.average_prices = {} # 그룹별 평균가 저장
         self.overall_average_prices = {} # 전체 평균가 저장
+        self.price_stats = None # (단지, 거래유형, 면적) 그룹 통계 캐시
 
-        self.search_history = []
+        self.search_history = SearchHistory(max_entries=10)
         self.current_search_keyword = ""
 
+        # 선택 단지 병렬 검색 시 동시에 수집할 단지 수
+        self.max_parallel_complexes = 4
+        self.fetch_engine = None
+        # 이전에 검색한 단지는 바뀐 매물만 받아오는 증분 갱신 사용
+        self.use_incremental_refresh = True
+        self.incremental_refresher = IncrementalRefresher(self.api)
+        # 선택 단지 검색 결과는 같은 매물/같은 집(여러 중개사) 중복을 합친 뒤 표시하고 평균가 계산
+        self.merge_duplicate_articles = True
+        self.merged_duplicate_count = 0  # 현재 매물 목록에서 합친 중복 수 (라벨 표시용)
+        # aiohttp가 있으면 모든 요청을 이벤트 루프 스레드 하나에서 동시에 처리 (없으면 스레드 풀 사용)
+        self.use_async_client = async_api.is_available()
+        self.max_async_requests = 32
+        self.async_loop = None
+        self.async_client = None
+
         self.progress_signal = ProgressSignal()
         self.progress_signal.progress_updated.connect(self.update_progress)
         self.progress_signal.search_completed.connect(self.on_search_completed)
         self.progress_signal.search_failed.connect(self.on_search_failed)
         self.progress_signal.articles_found.connect(self.update_article_table)
+        self.progress_signal.complex_articles_fetched.connect(self.append_fetched_articles)
         self.progress_signal.show_warning.connect(self.show_warning_dialog)
+        self.progress_signal.export_progress.connect(self.on_export_progress)
+        self.progress_signal.export_finished.connect(self.on_export_finished)
 
         if data:
             if 'complexes' in data:
                 self.articles = data.get('complexes', [])
             elif 'articleList' in data: 
                 self.complex_articles = data.get('articleList', [])
-                self.original_complex_articles = self.complex_articles.copy()
+                self.original_complex_articles = self.complex_articles
             if self.articles:
-                self.original_articles = self.articles.copy()
+                self.original_articles = self.articles
             else:
                 self.original_articles = []
 
@@ -67,19 +113,15 @@ class MainWindow(QMainWindow):
         
         self.detail_window_instance = None 
         self.loading_dialog = None
+        self.active_exporter = None
+        self.export_progress_dialog = None
+        self.export_started_at = None
+        # 내보내기는 한 번에 하나씩 전용 스레드 풀에서 실행
+        self.export_pool = QThreadPool(self)
+        self.export_pool.setMaxThreadCount(1)
 
         self.apply_modern_style()
         self.init_ui()
-        
-        self.desired_excel_columns_korean = [
-            '매물명', '부동산유형', '매물부동산유형', '거래유형', '확인유형', '층정보', '가격변동상태',
-            '매매/전세가', '월세', '면적명', '전용면적', '공급면적', '방향', '매물확인일',
-            '매물특징', '태그목록', '동이름', '동일주소매물수', '동일주소최고가', '동일주소최저가',
-            '위도', '경도', '부동산중개사명', '소유자확인거래', '직거래여부', '관심여부',
-            '단지여부', '상세주소', '안심임대인여부', '단지명', '단지번호', '주소',
-            '지역코드', '링크', '최고층', '최저층', '최대공급면적', '최대전체면적',
-            '최소공급면적', '최소전체면적', '총동수', '총세대수', '사용승인일', '사용여부'
-        ]
 
     def apply_modern_style(self):
         primary_color = "#0077b6"; secondary_color = "#00b4d8"; accent_color = "#48cae4"
@@ -210,256 +252,21 @@ class MainWindow(QMainWindow):
         self.summary_widget.setVisible(True)
 
     def _get_area_key(self, article):
-        supply_area_str = article.get('area2', '')
-        exclusive_area_str = article.get('area1', '')
-        
-        def _format_num(num_str):
-            if not num_str: return ''
-            try: return f"{float(num_str):.2f}".rstrip('0').rstrip('.')
-            except (ValueError, TypeError): return str(num_str)
-
-        s_area_fmt = _format_num(supply_area_str)
-        e_area_fmt = _format_num(exclusive_area_str)
-
-        if s_area_fmt and e_area_fmt: return f"{s_area_fmt}㎡ ({e_area_fmt}㎡)"
-        elif s_area_fmt: return f"{s_area_fmt}㎡"
-        elif e_area_fmt: return f"{e_area_fmt}㎡"
-        return "-"
-        
-    def _calculate_and_store_average_prices(self, articles):
-        if not articles:
-            self.average_prices = {}
-            self.overall_average_prices = {}
-            return
-
-        price_groups = {}
-        overall_prices = {'매매': [], '전세': [], '월세': []}
-
-        for article in articles:
-            area_key = self._get_area_key(article)
-            trade_type = article.get('tradeTypeName', '')
-            
-            key = (
-                article.get('articleName', article.get('complexName', '')),
-                trade_type,
-                area_key
-            )
-            price = self._get_excel_numeric_price(article.get('dealOrWarrantPrc'))
-
-            if price is not None and price > 0:
-                if key not in price_groups: price_groups[key] = []
-                price_groups[key].append(price)
-                
-                if trade_type in overall_prices:
-                    overall_prices[trade_type].append(price)
-        
-        self.average_prices = {key: sum(prices) / len(prices) for key, prices in price_groups.items() if prices}
-        
-        self.overall_average_prices = {}
-        for trade_type, prices in overall_prices.items():
-            if prices:
-                self.overall_average_prices[trade_type] = sum(prices) / len(prices)
+        return area_key(article)
         
+    def _update_price_stats(self, trade_type=None):
+        """테이블에 표시된 매물로 그룹 통계를 새로 계산하고 강조 색상/요약을 갱신"""
+        frame = self.property_table.frame
+        self.price_stats = PriceStats(frame) if len(frame) else None
+        self.average_prices = self.price_stats.average_prices() if self.price_stats else {}
+        self.property_table.set_average_prices(self.average_prices)
+        self._apply_overall_average_prices(trade_type)
+
+    def _apply_overall_average_prices(self, trade_type=None):
+        """거래유형 필터에 맞는 전체 평균가 - 캐시된 그룹 부분합으로만 계산 (매물 재집계 없음)"""
+        self.overall_average_prices = self.price_stats.overall_by_trade_type(trade_type) if self.price_stats else {}
         self._update_average_price_display()
 
-    @Slot(object, list, int)
-    def update_article_table(self, articles, complex_names_found, original_checked_count):
-        try:
-            if self.loading_dialog: self.loading_dialog.close()
-            self.hide_progress_bar()
-            self.restore_search_checked_button()
-            self.complex_articles = articles if articles else []
-            self.original_complex_articles = self.complex_articles.copy()
-
-            if not self.complex_articles:
-                self.property_table.load_data([])
-                if hasattr(self, 'article_label'): self.article_label.setText("선택된 단지의 매물이 없습니다.")
-                self.statusBar().showMessage("선택한 단지에서 매물을 찾지 못했습니다.")
-                self._update_filter_radios(self.article_filter_layout, self.article_type_group, [], 'tradeTypeName', self.filter_articles_by_trade_type)
-                self.summary_widget.setVisible(False)
-                return
-
-            self._calculate_and_store_average_prices(self.complex_articles)
-            self.property_table.load_data(self.complex_articles, self.average_prices)
-            
-            total_articles_found = len(self.complex_articles)
-            num_complexes_with_articles = len(complex_names_found)
-            display_name_str = f"{original_checked_count}개 단지"
-            if num_complexes_with_articles > 0:
-                display_name_str = f"{complex_names_found[0]} 등 {num_complexes_with_articles}곳" if num_complexes_with_articles > 1 else complex_names_found[0]
-            
-            if hasattr(self, 'article_label'): self.article_label.setText(f"{display_name_str} 매물: {total_articles_found}건")
-            self._update_filter_radios(self.article_filter_layout, self.article_type_group, self.original_complex_articles, 'tradeTypeName', self.filter_articles_by_trade_type)
-            if hasattr(self, 'download_button'):
-                self.download_button.setEnabled(True); self.download_button.setText(f"엑셀 다운로드 ({total_articles_found}건)"); self.download_button.setStyleSheet(self.primary_button_style)
-            self.statusBar().showMessage(f"{display_name_str}에서 {total_articles_found}개의 매물을 찾았습니다.")
-        except Exception as e: 
-            import traceback
-            traceback.print_exc()
-            self.statusBar().showMessage(f"매물 표시 오류: {e}")
-
-    def download_to_excel(self):
-        articles_to_process = []
-        is_selection_download = False
-        
-        if hasattr(self, 'complex_articles') and self.complex_articles:
-            checked_article_indices = self.property_table.get_checked_items()
-            if checked_article_indices:
-                articles_to_process = [self.complex_articles[i] for i in checked_article_indices if 0 <= i < len(self.complex_articles)]
-                is_selection_download = True
-            else:
-                articles_to_process = self.complex_articles
-        else:
-            self.statusBar().showMessage("다운로드할 매물 데이터가 없습니다."); return
-
-        if not articles_to_process: self.statusBar().showMessage("다운로드할 데이터가 없습니다."); return
-
-        now = datetime.now().strftime("%Y%m%d_%H%M%S")
-        default_filename = f"매물목록_{len(articles_to_process)}건_{now}.xlsx"
-        file_path, _ = QFileDialog.getSaveFileName(self, "엑셀 파일 저장", default_filename, "Excel Files (*.xlsx)")
-        if not file_path: return
-
-        self.statusBar().showMessage(f"엑셀 파일 생성 중...")
-        
-        # 엑셀 데이터 생성 및 평균가 비교를 위한 준비
-        excel_data_rows = []
-        # 그룹별 평균가는 self.average_prices 에 이미 계산되어 있음
-        
-        for article_data in articles_to_process:
-            # (기존 로직과 동일하게 엑셀 행 데이터 생성)
-            excel_row = self._create_excel_row(article_data)
-            excel_data_rows.append(excel_row)
-
-        df = pd.DataFrame(excel_data_rows)
-        if not self.desired_excel_columns_korean in df.columns:
-             df = df.reindex(columns=self.desired_excel_columns_korean)
-
-        try:
-            # 스타일 적용을 위해 ExcelWriter 사용
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='매물목록')
-                worksheet = writer.sheets['매물목록']
-
-                # 색상 채우기 스타일 정의
-                sale_fill = PatternFill(start_color='FFE4E1', end_color='FFE4E1', fill_type='solid') # 선홍색
-                lease_fill = PatternFill(start_color='E9F5E9', end_color='E9F5E9', fill_type='solid') # 연녹색
-                rent_fill = PatternFill(start_color='E0F7FA', end_color='E0F7FA', fill_type='solid') # 하늘색
-
-                # 각 행을 순회하며 조건부 서식 적용
-                for index, article in enumerate(articles_to_process):
-                    excel_row_num = index + 2  # 엑셀은 1-based, 헤더 포함
-                    
-                    key = (
-                        article.get('articleName', article.get('complexName', '')),
-                        article.get('tradeTypeName', ''),
-                        self._get_area_key(article)
-                    )
-                    avg_price = self.average_prices.get(key)
-                    price = self._get_excel_numeric_price(article.get('dealOrWarrantPrc'))
-                    
-                    if avg_price and price and price < avg_price:
-                        trade_type = article.get('tradeTypeName', '')
-                        fill_to_apply = None
-                        if trade_type == '매매': fill_to_apply = sale_fill
-                        elif trade_type == '전세': fill_to_apply = lease_fill
-                        elif trade_type == '월세': fill_to_apply = rent_fill
-                        
-                        if fill_to_apply:
-                            for col_num in range(1, len(df.columns) + 1):
-                                worksheet.cell(row=excel_row_num, column=col_num).fill = fill_to_apply
-                
-                # 컬럼 너비 자동 조정
-                for column_cells in worksheet.columns:
-                    try:
-                        max_length = 0
-                        column = column_cells[0].column_letter
-                        for cell in column_cells:
-                            if cell.value:
-                                # 한글은 글자당 2, 영문/숫자는 1로 계산하여 너비 추정
-                                length = sum(2 if '\uac00' <= char <= '\ud7a3' else 1 for char in str(cell.value))
-                                if length > max_length:
-                                    max_length = length
-                        adjusted_width = max_length + 2
-                        worksheet.column_dimensions[column].width = adjusted_width
-                    except:
-                        pass
-
-            self.statusBar().showMessage(f"엑셀 파일 저장 완료: {file_path} ({len(df)}건)")
-        except Exception as e:
-            self.statusBar().showMessage(f"엑셀 파일 저장 오류: {e}")
-            QMessageBox.critical(self, "엑셀 저장 오류", f"엑셀 파일 저장 중 오류가 발생했습니다:\n{str(e)}")
-            import traceback; traceback.print_exc()
-
-    def _create_excel_row(self, article_data):
-        # 엑셀 행 생성을 위한 헬퍼 함수
-        excel_column_api_map = {
-            '매물명': 'articleName', '부동산유형': 'realEstateTypeName', '매물부동산유형': 'articleRealEstateTypeName',
-            '거래유형': 'tradeTypeName', '확인유형': 'verificationTypeCode', '층정보': 'floorInfo', '가격변동상태': 'priceChangeState',
-            '매매/전세가': 'dealOrWarrantPrc', '월세': 'rentPrc', '면적명': 'areaName', '전용면적': 'area1', '공급면적': 'area2',
-            '방향': 'direction', '매물확인일': 'articleConfirmYmd', '매물특징': 'articleFeatureDesc', '태그목록': 'tagList',
-            '동이름': 'buildingName', '동일주소매물수': 'sameAddrCnt', '동일주소최고가': 'sameAddrMaxPrc', '동일주소최저가': 'sameAddrMinPrc',
-            '위도': 'latitude', '경도': 'longitude', '부동산중개사명': 'realtorName', '소유자확인거래': 'tradeCheckedByOwner',
-            '직거래여부': 'isDirectTrade', '관심여부': 'isInterest', '단지여부': 'isComplex', '상세주소': 'detailAddress',
-            '안심임대인여부': 'isSafeLessorOfHug', '단지명': 'complexName', '단지번호': 'complexNo', '주소': 'cortarAddressFromComplex',
-            '지역코드': 'cortarNoFromComplex', '링크': 'cpPcArticleUrl', '최고층': 'highFloorFromComplex', '최저층': 'lowFloorFromComplex',
-            '최대공급면적': 'maxSupplyAreaFromComplex', '최대전체면적': 'maxTotalAreaFromComplex', '최소공급면적': 'minSupplyAreaFromComplex',
-            '최소전체면적': 'minTotalAreaFromComplex', '총동수': 'totalDongCountFromComplex', '총세대수': 'totalHouseholdCountFromComplex',
-            '사용승인일': 'useApproveYmdFromComplex', '사용여부': 'useYnFromComplex'
-        }
-        verification_mapping = {'NONE': '없음', 'OWNER': '소유자확인', 'REALTOR': '중개사확인', 'LESSOR': '임대인확인', 'S_VR': 'VR확인', 'SITE': '현장확인', 'NDOC1': '서류확인1', 'DOC': '서류확인', 'DOCV2': '서류확인V2', 'MOBL': '모바일확인', 'NDOC2': '서류확인2'}
-        price_change_mapping = {'SAME': '변동없음', 'DOWN': '하락', 'UP': '상승', 'DECREASE': '감소', 'INCREASE': '증가', 'NEW': '신규'}
-
-        excel_row = {}
-        for korean_col_name in self.desired_excel_columns_korean:
-            api_key = excel_column_api_map.get(korean_col_name)
-            raw_value = article_data.get(api_key, '-') if api_key else '-'
-
-            if korean_col_name == '매매/전세가': excel_row[korean_col_name] = self._get_excel_numeric_price(article_data.get('dealOrWarrantPrc'))
-            elif korean_col_name == '월세': excel_row[korean_col_name] = self._get_excel_numeric_rent(article_data.get('rentPrc'))
-            elif korean_col_name in ['매물확인일', '사용승인일']: excel_row[korean_col_name] = self._format_excel_date(raw_value if isinstance(raw_value, str) else str(raw_value))
-            elif korean_col_name == '태그목록': excel_row[korean_col_name] = ', '.join(raw_value) if isinstance(raw_value, list) else raw_value
-            elif korean_col_name == '확인유형': excel_row[korean_col_name] = verification_mapping.get(str(raw_value).upper(), raw_value)
-            elif korean_col_name == '가격변동상태': excel_row[korean_col_name] = price_change_mapping.get(str(raw_value).upper(), raw_value)
-            elif korean_col_name in ['소유자확인거래', '직거래여부', '관심여부', '단지여부', '안심임대인여부', '사용여부']: excel_row[korean_col_name] = 'Y' if raw_value is True or str(raw_value).upper() == 'Y' else ('N' if raw_value is False or str(raw_value).upper() == 'N' else raw_value)
-            elif korean_col_name == '주소':
-                full_addr_parts = [p for p in [article_data.get('cortarAddressFromComplex', ''), article_data.get('buildingName', ''), article_data.get('detailAddress', '')] if p]
-                excel_row[korean_col_name] = " ".join(full_addr_parts).strip() or '-'
-            elif korean_col_name == '매물명': excel_row[korean_col_name] = article_data.get('articleName', article_data.get('complexName', '-'))
-            else: excel_row[korean_col_name] = raw_value if raw_value is not None else "-"
-        return excel_row
-        
-    @Slot()
-    def filter_articles_by_trade_type(self, button=None):
-        if not button or not hasattr(self, 'original_complex_articles'): 
-            if hasattr(self, 'property_table'): self.property_table.load_data([])
-            if hasattr(self, 'article_label'): self.article_label.setText("매물 목록: 0건")
-            self._update_filter_radios(self.article_filter_layout, self.article_type_group, [], 'tradeTypeName', self.filter_articles_by_trade_type)
-            self.summary_widget.setVisible(False)
-            return
-
-        selected_type = button.text()
-        if selected_type == "전체": self.complex_articles = self.original_complex_articles.copy()
-        else: self.complex_articles = [a for a in self.original_complex_articles if a.get('tradeTypeName') == selected_type]
-        
-        self._calculate_and_store_average_prices(self.complex_articles)
-        self.property_table.load_data(self.complex_articles, self.average_prices)
-
-        total_articles = len(self.complex_articles)
-        if hasattr(self, 'download_button'): self.download_button.setText(f"엑셀 다운로드 ({total_articles}건)")
-        self.on_article_checkbox_toggled(-1, False)
-
-    # ... (기존의 다른 메서드들은 변경 없이 유지)
-    # fetch_from_api, on_search_completed, on_search_failed, hide_progress_bar, hide_loading_dialog,
-    # add_to_history, search_checked_complexes, search_multiple_complexes, on_complex_checkbox_toggled,
-    # restore_search_checked_button, show_warning_dialog, on_article_detail_clicked, show_property_detail_from_data,
-    # on_article_checkbox_toggled, enable_search_button, create_menus, create_toolbar, 
-    # _get_excel_numeric_price, _get_excel_numeric_rent, _format_excel_date, filter_complexes_by_type
-    
-    # ... (생략된 기존 코드는 이전 답변과 동일)
-    
-    # 이전에 제공된 전체 코드를 여기에 붙여넣으시면 됩니다. 
-    # 이 답변에서는 새로 추가되거나 핵심적으로 수정된 부분 위주로 보여드렸습니다.
-    # 아래는 생략된 부분의 시작입니다.
     def _update_filter_radios(self, layout, button_group, data, key, callback):
         for btn in button_group.buttons(): button_group.removeButton(btn); layout.removeWidget(btn); btn.deleteLater()
         all_radio = QRadioButton("전체"); all_radio.setChecked(True); button_group.addButton(all_radio); layout.addWidget(all_radio)
@@ -489,6 +296,12 @@ class MainWindow(QMainWindow):
         self.search_button.setEnabled(False)
         keyword = search_input
         self.current_search_keyword = f"키워드: {keyword}"
+        client = self._get_async_client()
+        if client:
+            self.progress_signal.progress_updated.emit(10, f"키워드 '{keyword}'로 검색 시작...")
+            future = self.async_loop.submit(client.search_by_keyword(keyword, max_pages=None, progress_callback=self.update_search_progress))
+            future.add_done_callback(self._on_keyword_search_done)
+            return
         import threading
         def search_thread():
             try:
@@ -502,6 +315,29 @@ class MainWindow(QMainWindow):
         thread.daemon = True
         thread.start()
 
+    def _get_async_client(self):
+        """비동기 클라이언트 (처음 쓸 때 루프 스레드와 함께 생성, 사용할 수 없으면 None)"""
+        if not self.use_async_client:
+            return None
+        if self.async_client is None:
+            try:
+                self.async_loop = async_api.AsyncLoopThread()
+                self.async_client = async_api.AsyncNaverLandAPI(self.api, max_concurrency=self.max_async_requests)
+            except Exception as e:
+                print(f"비동기 클라이언트 초기화 실패 (스레드 방식 사용): {e}")
+                self.use_async_client = False
+                return None
+        return self.async_client
+
+    def _on_keyword_search_done(self, future):
+        # 루프 스레드에서 호출되므로 결과는 시그널로만 전달
+        try:
+            result = future.result()
+            if result: self.progress_signal.search_completed.emit(result)
+            else: self.progress_signal.search_failed.emit("API 응답을 가져올 수 없습니다.")
+        except Exception as e:
+            self.progress_signal.search_failed.emit(f"검색 중 오류 발생: {str(e)}")
+
     def update_search_progress(self, progress, message, status=None):
         self.progress_signal.progress_updated.emit(progress, message)
 
@@ -528,7 +364,7 @@ class MainWindow(QMainWindow):
         complexes_data = self.data.get('complexes', self.data.get('list', []))
         self.articles = complexes_data
         if self.articles:
-             self.original_articles = self.articles.copy()
+             self.original_articles = self.articles
         else:
              self.articles = []
              self.original_articles = []
@@ -537,7 +373,6 @@ class MainWindow(QMainWindow):
 
         if total_complexes > 0:
             msg = f"API에서 {total_complexes}개의 단지 정보를 가져왔습니다."
-            self.add_to_history(f"[단지] {self.current_search_keyword} ({total_complexes}개)")
             self.complex_table.load_data(self.articles)
             self._update_filter_radios(self.complex_filter_layout, self.complex_type_group, self.original_articles, 'realEstateTypeName', self.filter_complexes_by_type)
             if hasattr(self, 'complex_label'): self.complex_label.setText(f"단지 목록: {total_complexes}개")
@@ -545,6 +380,7 @@ class MainWindow(QMainWindow):
             self.complex_articles = []
             self.original_complex_articles = []
             if hasattr(self, 'article_label'): self.article_label.setText("선택된 단지의 매물 목록: 0개")
+            self.add_to_history(f"[단지] {self.current_search_keyword} ({total_complexes}개)")
             self._update_filter_radios(self.article_filter_layout, self.article_type_group, [], 'tradeTypeName', self.filter_articles_by_trade_type)
             self.statusBar().showMessage(msg)
             QMessageBox.information(self, "검색 완료", f"키워드 '{self.search_input.text().strip()}'로 {total_complexes}개의 단지를 찾았습니다.\n\n1. 단지 목록에서 단지를 선택(체크)하고 '선택 단지 검색'을 누르세요.\n2. 매물 목록에서 '상세보기'를 누르세요.")
@@ -581,12 +417,44 @@ class MainWindow(QMainWindow):
             self.loading_dialog.close()
 
     def add_to_history(self, label):
-        history_item = {'label': label, 'data': copy.deepcopy(self.data), 
-                        'articles': copy.deepcopy(self.articles), 
-                        'complex_articles': copy.deepcopy(self.complex_articles),
-                        'keyword': self.current_search_keyword}
-        self.search_history.insert(0, history_item)
-        if len(self.search_history) > 10: self.search_history = self.search_history[:10]
+        # 결과를 복사하지 않고 참조만 묶은 스냅샷으로 기록 (기록 수와 관계없이 매물 dict는 한 벌)
+        self.search_history.record(label, self.current_search_keyword, self.data,
+                                   self.original_articles, self.original_complex_articles)
+        if hasattr(self, 'history_menu'): self._rebuild_history_menu()
+
+    def _rebuild_history_menu(self):
+        self.history_menu.clear()
+        if not len(self.search_history):
+            empty_action = self.history_menu.addAction("(검색 기록 없음)")
+            empty_action.setEnabled(False)
+            return
+        for index, snapshot in enumerate(self.search_history):
+            stamp = datetime.fromtimestamp(snapshot.created_at).strftime('%H:%M')
+            action = self.history_menu.addAction(f"{stamp}  {snapshot.label}")
+            action.triggered.connect(lambda checked=False, s=snapshot: self.restore_history(s))
+
+    def restore_history(self, snapshot):
+        """검색 기록 스냅샷을 다시 화면에 표시 (네트워크 요청 없음)"""
+        self.current_search_keyword = snapshot.keyword
+        if hasattr(self, 'search_input'): self.search_input.setText(snapshot.keyword)
+        self.data = snapshot.data
+        self.articles = list(snapshot.complexes)
+        self.original_articles = self.articles
+        self.complex_articles = list(snapshot.articles)
+        self.original_complex_articles = self.complex_articles
+        self.merged_duplicate_count = 0
+
+        self.complex_table.load_data(self.articles)
+        self._update_filter_radios(self.complex_filter_layout, self.complex_type_group, self.original_articles, 'realEstateTypeName', self.filter_complexes_by_type)
+        if hasattr(self, 'complex_label'): self.complex_label.setText(f"단지 목록: {len(self.articles)}개")
+        self.property_table.load_data(self.complex_articles)
+        self._update_filter_radios(self.article_filter_layout, self.article_type_group, self.original_complex_articles, 'tradeTypeName', self.filter_articles_by_trade_type)
+        self._update_price_stats()
+        if hasattr(self, 'article_label'): self.article_label.setText(f"선택된 단지의 매물 목록: {len(self.complex_articles)}개")
+        if hasattr(self, 'download_button'):
+            self.download_button.setEnabled(bool(self.complex_articles))
+            self.download_button.setText(f"엑셀 다운로드 ({len(self.complex_articles)}건)" if self.complex_articles else "엑셀 다운로드")
+        self.statusBar().showMessage(f"검색 기록 복원: {snapshot.label}")
 
     @Slot(int, int)
     def on_complex_cell_clicked_improved(self, row, column):
@@ -623,52 +491,38 @@ class MainWindow(QMainWindow):
         self.loading_dialog.show()
 
         import threading
+        refresher = self.incremental_refresher if self.use_incremental_refresh else None
+        client = self._get_async_client()
+        if client:
+            self.fetch_engine = AsyncComplexFetchEngine(client, self.async_loop, refresher=refresher)
+        else:
+            self.fetch_engine = ComplexFetchEngine(self.api, max_workers=self.max_parallel_complexes, refresher=refresher)
         def search_thread_worker():
-            all_found_articles, names_of_complexes_with_articles, failed_complex_searches = [], [], []
             try:
-                self.api.set_progress_callback(self.update_search_progress)
-                for i, complex_item in enumerate(complexes_to_search):
-                    complex_no = complex_item.get('complexNo')
-                    c_name = complex_item.get('complexName', 'N/A')
-                    complex_level_data_to_inject = {
-                        'complexName': c_name,
-                        'complexNo': complex_no,
-                        'cortarAddressFromComplex': complex_item.get('cortarAddress', ''),
-                        'cortarNoFromComplex': complex_item.get('cortarNo', ''),
-                        'totalDongCountFromComplex': complex_item.get('totalDongCount', ''),
-                        'totalHouseholdCountFromComplex': complex_item.get('totalHouseholdCount', ''),
-                        'useApproveYmdFromComplex': complex_item.get('useApproveYmd', ''),
-                        'highFloorFromComplex': complex_item.get('highFloor', ''),
-                        'lowFloorFromComplex': complex_item.get('lowFloor', ''),
-                        'maxSupplyAreaFromComplex': complex_item.get('maxSupplyArea', ''),
-                        'maxTotalAreaFromComplex': complex_item.get('maxTotalArea', ''),
-                        'minSupplyAreaFromComplex': complex_item.get('minSupplyArea', ''),
-                        'minTotalAreaFromComplex': complex_item.get('minTotalArea', ''),
-                        'useYnFromComplex': complex_item.get('useYn', '')
-                    }
-
-                    if not complex_no: 
-                        failed_complex_searches.append(f"{c_name}(번호없음)")
-                        continue
-                    
-                    self.progress_signal.progress_updated.emit(int((i / len(complexes_to_search)) * 100), f"{c_name} 검색중 ({i+1}/{len(complexes_to_search)})")
-                    try:
-                        api_result = self.api.search_by_complex(complex_no=complex_no)
-                        if api_result and isinstance(api_result, dict):
-                            current_complex_articles = api_result.get('articleList', [])
-                            if current_complex_articles:
-                                for art in current_complex_articles: 
-                                    art.update(complex_level_data_to_inject)
-                                all_found_articles.extend(current_complex_articles)
-                                if c_name not in names_of_complexes_with_articles: names_of_complexes_with_articles.append(c_name)
-                            else: failed_complex_searches.append(f"{c_name}(매물X)")
-                        else: failed_complex_searches.append(f"{c_name}(API오류)")
-                    except Exception as e_inner: 
-                        failed_complex_searches.append(f"{c_name}(에러:{str(e_inner)[:30]})")
-                        print(f"개별 단지({c_name}) 매물 검색 오류: {e_inner}")
-                
+                # 여러 단지를 동시에 검색하므로 단지별 페이지 진행률 대신 전체 진행률만 표시
+                self.api.set_progress_callback(None)
+                total = len(complexes_to_search)
+                self.progress_signal.progress_updated.emit(0, f"{total}개 단지 병렬 검색 시작...")
+
+                def on_page(complex_item, articles):
+                    # 매물 페이지가 도착하는 대로 테이블에 추가
+                    self.progress_signal.complex_articles_fetched.emit(articles, complex_item.get('complexName', 'N/A'))
+
+                def on_progress(done, total_count, c_name):
+                    self.progress_signal.progress_updated.emit(int((done / total_count) * 100), f"{c_name} 검색 완료 ({done}/{total_count})")
+
+                all_found_articles, names_of_complexes_with_articles, failed_complex_searches = self.fetch_engine.run(
+                    complexes_to_search, on_page=on_page, on_progress=on_progress)
+
                 if all_found_articles:
-                    self.progress_signal.articles_found.emit(all_found_articles, names_of_complexes_with_articles, len(complexes_to_search))
+                    # 중복 합치기는 작업 스레드에서 (화면 스레드는 표시만)
+                    dedupe_stats = None
+                    if self.merge_duplicate_articles:
+                        all_found_articles, dedupe_stats = dedupe_articles(all_found_articles)
+                    self.progress_signal.articles_found.emit(all_found_articles, names_of_complexes_with_articles, len(complexes_to_search), dedupe_stats)
+                    if refresher:
+                        delta = self.fetch_engine.delta_summary
+                        self.progress_signal.progress_updated.emit(100, f"{len(all_found_articles)}개 매물 (증분 갱신: 신규 {delta['added']}건, 삭제 {delta['removed']}건, 가격변동 {delta['priceChanged']}건, 요청 {delta['requests']}회)")
                 else:
                     self.progress_signal.search_failed.emit(f"선택 단지 매물 없음. 실패: {', '.join(failed_complex_searches)}")
             except Exception as e_outer: 
@@ -683,21 +537,23 @@ class MainWindow(QMainWindow):
         thread.daemon = True
         thread.start()
 
-    @Slot(object, list, int)
-    def update_article_table(self, articles, complex_names_found, original_checked_count):
+    @Slot(object, list, int, object)
+    def update_article_table(self, articles, complex_names_found, original_checked_count, dedupe_stats=None):
         try:
             if self.loading_dialog:
                 self.loading_dialog.close()
             self.hide_progress_bar()
             self.restore_search_checked_button()
             self.complex_articles = articles if articles else []
-            self.original_complex_articles = self.complex_articles.copy()
+            self.original_complex_articles = self.complex_articles
+            self.merged_duplicate_count = dedupe_stats['input'] - dedupe_stats['output'] if dedupe_stats else 0
 
             if not self.complex_articles:
                 self.property_table.load_data([])
                 if hasattr(self, 'article_label'): self.article_label.setText("선택된 단지의 매물이 없습니다.")
                 self.statusBar().showMessage("선택한 단지에서 매물을 찾지 못했습니다.")
                 self._update_filter_radios(self.article_filter_layout, self.article_type_group, [], 'tradeTypeName', self.filter_articles_by_trade_type)
+                self._update_price_stats()
                 return
 
             total_articles_found = len(self.complex_articles)
@@ -706,19 +562,36 @@ class MainWindow(QMainWindow):
             if num_complexes_with_articles > 0:
                 display_name_str = f"{complex_names_found[0]} 등 {num_complexes_with_articles}곳" if num_complexes_with_articles > 1 else complex_names_found[0]
             
-            if hasattr(self, 'article_label'): self.article_label.setText(f"{display_name_str} 매물: {total_articles_found}건")
+            if hasattr(self, 'article_label'): self.article_label.setText(f"{display_name_str} 매물: {total_articles_found}건{self._merged_duplicates_text()}")
             self._update_filter_radios(self.article_filter_layout, self.article_type_group, self.original_complex_articles, 'tradeTypeName', self.filter_articles_by_trade_type)
             self.property_table.load_data(self.complex_articles)
+            self._update_price_stats()
+            self.add_to_history(f"[매물] {display_name_str} ({total_articles_found}건)")
             if hasattr(self, 'download_button'):
                 self.download_button.setEnabled(True)
                 self.download_button.setText(f"엑셀 다운로드 ({total_articles_found}건)")
                 self.download_button.setStyleSheet(self.primary_button_style)
-            self.statusBar().showMessage(f"{display_name_str}에서 {total_articles_found}개의 매물을 찾았습니다.")
+            message = f"{display_name_str}에서 {total_articles_found}개의 매물을 찾았습니다."
+            if self.merged_duplicate_count:
+                message += f" (중복 {self.merged_duplicate_count}건 합침: 같은 매물 {dedupe_stats['sameArticle']}건, 같은 집 {dedupe_stats['sameUnit']}건)"
+            self.statusBar().showMessage(message)
         except Exception as e: 
             import traceback
             traceback.print_exc()
             self.statusBar().showMessage(f"매물 표시 오류: {e}")
 
+    def _merged_duplicates_text(self):
+        return f" (중복 {self.merged_duplicate_count}건 합침)" if self.merged_duplicate_count else ""
+
+    @Slot(object, str)
+    def append_fetched_articles(self, articles, complex_name):
+        """매물 페이지가 도착할 때마다 테이블에 바로 추가"""
+        if not articles: return
+        if self.loading_dialog: self.loading_dialog.close()
+        self.property_table.append_data(articles)
+        shown_count = len(self.property_table.data)
+        if hasattr(self, 'article_label'): self.article_label.setText(f"매물 수집 중: {shown_count}건 ({complex_name} 추가)")
+
     @Slot(int, bool)
     def on_complex_checkbox_toggled(self, row, checked):
         checked_count = len(self.complex_table.get_checked_items())
@@ -773,7 +646,9 @@ class MainWindow(QMainWindow):
                 self.detail_window_instance.update_property_details(property_data)
                 self.detail_window_instance.activateWindow()
                 return
-            self.detail_window_instance = PropertyDetailWidget(self) 
+            # 상세 위젯은 처음 열 때 불러옴 (시작 시간 단축)
+            from property_detail import PropertyDetailWidget
+            self.detail_window_instance = PropertyDetailWidget(self)
             self.detail_window_instance.update_property_details(property_data)
             self.detail_window_instance.show()
         except Exception as e: 
@@ -810,7 +685,7 @@ class MainWindow(QMainWindow):
         exit_action.setShortcut("Ctrl+Q")
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
-        export_action = QAction("엑셀로 내보내기(&E)", self)
+        export_action = QAction("내보내기 (엑셀/CSV/JSONL/Parquet)(&E)", self)
         export_action.setShortcut("Ctrl+E")
         export_action.triggered.connect(self.download_to_excel)
         file_menu.addAction(export_action)
@@ -819,6 +694,8 @@ class MainWindow(QMainWindow):
         keyword_search_action.setShortcut("Ctrl+K")
         keyword_search_action.triggered.connect(self.fetch_from_api)
         search_menu.addAction(keyword_search_action)
+        self.history_menu = search_menu.addMenu("검색 기록(&R)")
+        self._rebuild_history_menu()
         help_menu = self.menubar.addMenu("도움말(&H)")
         about_action = QAction("프로그램 정보(&A)", self)
         about_action.triggered.connect(lambda: QMessageBox.about(self, "프로그램 정보", "네이버 부동산 데이터 뷰어 v1.0.3\n\n부동산 매물 정보를 조회하고 관리합니다."))
@@ -835,54 +712,30 @@ class MainWindow(QMainWindow):
         self.article_label = QLabel("선택된 단지의 매물 목록: 0개")
         self.toolbar.addWidget(self.article_label)
 
-    def _get_excel_numeric_price(self, price_str):
-        if not isinstance(price_str, str) or price_str == '-': return None
-        try:
-            price_str_cleaned = price_str.replace(',', '').strip()
-            total_won = 0
-            if '억' in price_str_cleaned:
-                parts = price_str_cleaned.split('억')
-                eok_val_str = parts[0].strip()
-                if eok_val_str and eok_val_str.replace('.', '', 1).isdigit(): total_won += float(eok_val_str) * 100000000
-                man_val_str = ""
-                if len(parts) > 1 and parts[1].strip(): man_val_str = parts[1].strip()
-                if man_val_str and man_val_str.replace('.', '', 1).isdigit(): total_won += float(man_val_str) * 10000
-            elif price_str_cleaned.replace('.', '', 1).isdigit(): total_won += float(price_str_cleaned) * 10000
-            else: return price_str 
-            return int(total_won)
-        except (ValueError, TypeError): return price_str
-
-    def _get_excel_numeric_rent(self, rent_str):
-        if rent_str is None or rent_str == '-': return None
-        if isinstance(rent_str, (int, float)): return int(rent_str * 10000)
-        if isinstance(rent_str, str) and rent_str.strip().replace('.', '', 1).isdigit():
-            try: return int(float(rent_str.strip()) * 10000)
-            except ValueError: return rent_str 
-        return rent_str 
-        
-    def _format_excel_date(self, date_str):
-        if not date_str or not isinstance(date_str, str) or len(date_str) != 8: return date_str
-        try: return f"{date_str[:4]}.{date_str[4:6]}.{date_str[6:]}"
-        except: return date_str
-
     def download_to_excel(self):
+        if self.active_exporter:
+            self.statusBar().showMessage(f"{self.active_exporter.label} 내보내기가 진행 중입니다. 끝나거나 취소한 뒤 다시 시도하세요.")
+            if self.export_progress_dialog: self.export_progress_dialog.show()
+            return
         articles_to_process = []
         is_selection_download = False
         
         if hasattr(self, 'complex_articles') and self.complex_articles:
             checked_article_indices = self.property_table.get_checked_items()
             if checked_article_indices:
-                articles_to_process = [self.complex_articles[i] for i in checked_article_indices if 0 <= i < len(self.complex_articles)]
+                export_indices = checked_article_indices
                 is_selection_download = True
-                if not articles_to_process:
-                     self.statusBar().showMessage("선택된 항목을 찾을 수 없습니다. 필터를 확인해주세요.")
-                     return
             else:
                 reply = QMessageBox.question(self, "다운로드 확인",
                     f"선택된 항목이 없습니다. 현재 목록에 있는 {len(self.complex_articles)}개의 매물을 모두 다운로드하시겠습니까?",
                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
-                if reply == QMessageBox.StandardButton.Yes: articles_to_process = self.complex_articles
+                if reply == QMessageBox.StandardButton.Yes: export_indices = self.property_table.visible_indices()
                 else: self.statusBar().showMessage("다운로드가 취소되었습니다."); return
+            # 가격/월세는 테이블이 매물 도착 시 해석해 둔 ArticleFrame 값을 그대로 사용
+            table_rows = self.property_table.data
+            articles_to_process = [table_rows[i] for i in export_indices]
+            export_prices = self.property_table.frame.price_won[export_indices]
+            export_rents = self.property_table.frame.rent_won[export_indices]
         else: self.statusBar().showMessage("다운로드할 매물 데이터가 없습니다."); return
 
         if not articles_to_process: 
@@ -897,111 +750,86 @@ class MainWindow(QMainWindow):
         count_str = f"_{len(articles_to_process)}건"
         if is_selection_download: count_str = f"_선택항목{count_str}"
         default_filename = f"{base_name}{count_str}_{now}.xlsx"
-        file_path, _ = QFileDialog.getSaveFileName(self, "엑셀 파일 저장", default_filename, "Excel Files (*.xlsx)")
+        file_filters = ";;".join(f"{cls.label} (*.{ext})" for ext, cls in EXPORTERS.items())
+        file_path, selected_filter = QFileDialog.getSaveFileName(self, "매물 목록 저장", default_filename, file_filters)
         if not file_path: return
+        exporter_class = exporter_for_path(file_path)
+        if exporter_class is None:
+            # 확장자 없이 입력하면 고른 파일 형식의 확장자를 붙임
+            exporter_class = next((cls for cls in EXPORTERS.values() if selected_filter.startswith(cls.label)), ExcelExporter)
+            file_path = f"{file_path}.{exporter_class.extension}"
+
+        if exporter_class is ExcelExporter:
+            # 행마다 강조 여부(평균가보다 싼 매물)는 테이블과 같은 기준으로 미리 구해 둠
+            highlights = self.property_table.highlighted_trade_types(export_indices)
+            exporter = ExcelExporter(file_path, articles_to_process, export_prices, export_rents, highlights)
+        else:
+            exporter = exporter_class(file_path, articles_to_process, export_prices, export_rents)
+        self._start_export(exporter)
+
+    def _start_export(self, exporter):
+        """스레드 풀에서 파일을 쓰고 진행률 대화상자로 진행/남은 시간/취소 표시
+
+        대화상자는 모달이 아니므로 내보내는 동안에도 필터 변경 등 다른 작업을 계속할 수 있다.
+        (내보낼 행과 가격 배열은 시작 전에 따로 뽑아 두었으므로 테이블이 바뀌어도 영향 없음)
+        """
+        total = len(exporter.articles)
+        self.active_exporter = exporter
+        self.export_started_at = time.perf_counter()
+        self.export_progress_dialog = QProgressDialog(f"{exporter.label} 파일 생성 중... (0/{total:,})", "취소", 0, total, self)
+        self.export_progress_dialog.setWindowTitle(f"{exporter.label} 내보내기")
+        self.export_progress_dialog.setWindowModality(Qt.WindowModality.NonModal)
+        self.export_progress_dialog.setAutoClose(False)
+        self.export_progress_dialog.setAutoReset(False)
+        self.export_progress_dialog.setMinimumDuration(300)
+        self.export_progress_dialog.canceled.connect(exporter.cancel)
+        self.statusBar().showMessage(f"{exporter.label} 파일 생성 중...")
+        self.export_pool.start(ExportTask(exporter, self.progress_signal))
+
+    @staticmethod
+    def _format_eta(seconds):
+        if seconds < 60: return f"{max(1, round(seconds))}초"
+        return f"{int(seconds // 60)}분 {int(seconds % 60)}초"
 
-        self.statusBar().showMessage(f"엑셀 파일 생성 중...")
-        
-        excel_data_rows = []
-        
-        excel_column_api_map = {
-            '매물명': 'articleName', 
-            '부동산유형': 'realEstateTypeName',
-            '매물부동산유형': 'articleRealEstateTypeName',
-            '거래유형': 'tradeTypeName',
-            '확인유형': 'verificationTypeCode',
-            '층정보': 'floorInfo',
-            '가격변동상태': 'priceChangeState',
-            '매매/전세가': 'dealOrWarrantPrc',
-            '월세': 'rentPrc',
-            '면적명': 'areaName',
-            '전용면적': 'area1', # 수정됨
-            '공급면적': 'area2', # 수정됨
-            '방향': 'direction',
-            '매물확인일': 'articleConfirmYmd', 
-            '매물특징': 'articleFeatureDesc',
-            '태그목록': 'tagList', 
-            '동이름': 'buildingName',
-            '동일주소매물수': 'sameAddrCnt',
-            '동일주소최고가': 'sameAddrMaxPrc', 
-            '동일주소최저가': 'sameAddrMinPrc', 
-            '위도': 'latitude',
-            '경도': 'longitude',
-            '부동산중개사명': 'realtorName',
-            '소유자확인거래': 'tradeCheckedByOwner', 
-            '직거래여부': 'isDirectTrade', 
-            '관심여부': 'isInterest', 
-            '단지여부': 'isComplex', 
-            '상세주소': 'detailAddress', 
-            '안심임대인여부': 'isSafeLessorOfHug', 
-            '단지명': 'complexName', 
-            '단지번호': 'complexNo', 
-            '주소': 'cortarAddressFromComplex',
-            '지역코드': 'cortarNoFromComplex',
-            '링크': 'cpPcArticleUrl', 
-            '최고층': 'highFloorFromComplex',
-            '최저층': 'lowFloorFromComplex',
-            '최대공급면적': 'maxSupplyAreaFromComplex',
-            '최대전체면적': 'maxTotalAreaFromComplex',
-            '최소공급면적': 'minSupplyAreaFromComplex',
-            '최소전체면적': 'minTotalAreaFromComplex',
-            '총동수': 'totalDongCountFromComplex',
-            '총세대수': 'totalHouseholdCountFromComplex',
-            '사용승인일': 'useApproveYmdFromComplex', 
-            '사용여부': 'useYnFromComplex' 
-        }
-        
-        verification_mapping = {'NONE': '없음', 'OWNER': '소유자확인', 'REALTOR': '중개사확인', 'LESSOR': '임대인확인', 'S_VR': 'VR확인', 'SITE': '현장확인', 'NDOC1': '서류확인1', 'DOC': '서류확인', 'DOCV2': '서류확인V2', 'MOBL': '모바일확인', 'NDOC2': '서류확인2'}
-        price_change_mapping = {'SAME': '변동없음', 'DOWN': '하락', 'UP': '상승', 'DECREASE': '감소', 'INCREASE': '증가', 'NEW': '신규'}
-
-        for article_data in articles_to_process:
-            excel_row = {}
-            for korean_col_name in self.desired_excel_columns_korean:
-                api_key = excel_column_api_map.get(korean_col_name)
-                raw_value = article_data.get(api_key, '-') if api_key else '-'
-
-                if korean_col_name == '매매/전세가':
-                    excel_row[korean_col_name] = self._get_excel_numeric_price(article_data.get('dealOrWarrantPrc'))
-                elif korean_col_name == '월세':
-                    excel_row[korean_col_name] = self._get_excel_numeric_rent(article_data.get('rentPrc'))
-                elif korean_col_name == '확인일' or korean_col_name == '사용승인일':
-                    excel_row[korean_col_name] = self._format_excel_date(raw_value if isinstance(raw_value, str) else str(raw_value))
-                elif korean_col_name == '태그목록':
-                    excel_row[korean_col_name] = ', '.join(raw_value) if isinstance(raw_value, list) else raw_value
-                elif korean_col_name == '확인유형':
-                    excel_row[korean_col_name] = verification_mapping.get(str(raw_value).upper(), raw_value)
-                elif korean_col_name == '가격변동상태':
-                    excel_row[korean_col_name] = price_change_mapping.get(str(raw_value).upper(), raw_value)
-                elif korean_col_name in ['소유자확인거래', '직거래여부', '관심여부', '단지여부', '안심임대인여부', '사용여부']:
-                    excel_row[korean_col_name] = 'Y' if raw_value is True or str(raw_value).upper() == 'Y' else ('N' if raw_value is False or str(raw_value).upper() == 'N' else raw_value)
-                elif korean_col_name == '주소':
-                    addr_str = article_data.get('cortarAddressFromComplex', '') 
-                    bldg_name = article_data.get('buildingName', '')
-                    detail_addr = article_data.get('detailAddress', '')
-                    
-                    full_addr_parts = []
-                    if addr_str : full_addr_parts.append(addr_str)
-                    if bldg_name : full_addr_parts.append(bldg_name)
-                    if detail_addr : full_addr_parts.append(detail_addr)
-                    excel_row[korean_col_name] = " ".join(full_addr_parts).strip() if full_addr_parts else '-'
-                elif korean_col_name == '매물명':
-                    excel_row[korean_col_name] = article_data.get('articleName', article_data.get('complexName', '-'))
-                else:
-                    excel_row[korean_col_name] = raw_value if raw_value is not None else "-"
-            
-            excel_data_rows.append(excel_row)
-            
-        df = pd.DataFrame(excel_data_rows)
-        df = df[self.desired_excel_columns_korean]
+    @Slot(int, int)
+    def on_export_progress(self, done, total):
+        if not self.export_progress_dialog or not self.active_exporter: return
+        message = f"{self.active_exporter.label} 파일 생성 중... ({done:,}/{total:,})"
+        elapsed = time.perf_counter() - self.export_started_at
+        if done >= total:
+            message = f"{self.active_exporter.label} 파일 저장 중... ({total:,}건)"
+        elif done > 0 and elapsed > 0.5:
+            # 지금까지의 평균 속도로 남은 시간 추정
+            eta = self._format_eta(elapsed / done * (total - done))
+            message += f"\n남은 시간 약 {eta}"
+            self.statusBar().showMessage(f"{self.active_exporter.label} 파일 생성 중... {done * 100 // total}% (남은 시간 약 {eta})")
+        self.export_progress_dialog.setValue(done)
+        self.export_progress_dialog.setLabelText(message)
+
+    @Slot(object, str)
+    def on_export_finished(self, rows, message):
+        if self.export_progress_dialog:
+            self.export_progress_dialog.canceled.disconnect()
+            self.export_progress_dialog.close()
+            self.export_progress_dialog = None
+        label = self.active_exporter.label
+        seconds = time.perf_counter() - self.export_started_at
+        self.active_exporter = None
+        if rows is not None:
+            self.statusBar().showMessage(f"{label} 파일 저장 완료: {message} ({rows}건, {seconds:.1f}초)")
+        elif not message:
+            self.statusBar().showMessage(f"{label} 내보내기가 취소되었습니다.")
+        else:
+            self.statusBar().showMessage(f"{label} 파일 저장 오류: {message}")
+            QMessageBox.critical(self, f"{label} 저장 오류", f"{label} 파일 저장 중 오류가 발생했습니다:\n{message}")
 
-        try:
-            df.to_excel(file_path, index=False, engine='openpyxl')
-            self.statusBar().showMessage(f"엑셀 파일 저장 완료: {file_path} ({len(df)}건)")
-        except Exception as e:
-            self.statusBar().showMessage(f"엑셀 파일 저장 오류: {e}")
-            QMessageBox.critical(self, "엑셀 저장 오류", f"엑셀 파일 저장 중 오류가 발생했습니다:\n{str(e)}")
-            import traceback; traceback.print_exc()
 
+    def closeEvent(self, event):
+        # 내보내는 중에 창을 닫으면 취소하고 임시 파일이 지워질 때까지 잠시 기다림
+        if self.active_exporter:
+            self.active_exporter.cancel()
+            self.export_pool.waitForDone(5000)
+        super().closeEvent(event)
 
     @Slot()
     def filter_articles_by_trade_type(self, button=None):
@@ -1009,12 +837,15 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'property_table'): self.property_table.load_data([])
             if hasattr(self, 'article_label'): self.article_label.setText("매물 목록: 0건")
             self._update_filter_radios(self.article_filter_layout, self.article_type_group, [], 'tradeTypeName', self.filter_articles_by_trade_type)
+            self._update_price_stats()
             return
 
         selected_type = button.text()
-        if selected_type == "전체": self.complex_articles = self.original_complex_articles.copy()
-        else: self.complex_articles = [a for a in self.original_complex_articles if a.get('tradeTypeName') == selected_type]
-        self.property_table.load_data(self.complex_articles)
+        # 테이블은 원본 목록을 그대로 두고 거래유형별 인덱스로 표시 행만 바꿈 (복사/재적재 없음)
+        self.property_table.filter_by('tradeTypeName', None if selected_type == "전체" else selected_type)
+        self.complex_articles = self.property_table.visible_data()
+        # 그룹 키에 거래유형이 있으므로 그룹 평균은 그대로, 요약 평균만 캐시된 부분합으로 다시 계산
+        self._apply_overall_average_prices(None if selected_type == "전체" else selected_type)
         total_articles = len(self.complex_articles)
         if hasattr(self, 'article_label'):
             active_complex_names = list(set(art.get('complexName', '') for art in self.original_complex_articles if art.get('complexName'))) 
@@ -1024,7 +855,7 @@ class MainWindow(QMainWindow):
             name_prefix = "선택 단지" 
             if num_active_complexes == 1: name_prefix = active_complex_names[0]
             elif num_active_complexes > 1: name_prefix = f"{active_complex_names[0]} 등 {num_active_complexes}곳"
-            self.article_label.setText(f"{name_prefix} ({selected_type}) 매물: {total_articles}건")
+            self.article_label.setText(f"{name_prefix} ({selected_type}) 매물: {total_articles}건{self._merged_duplicates_text()}")
         self.statusBar().showMessage(f"'{selected_type}' 필터 적용: {total_articles}개 매물 표시")
         if hasattr(self, 'download_button'):
             self.download_button.setText(f"엑셀 다운로드 ({total_articles}건)")
@@ -1038,8 +869,7 @@ class MainWindow(QMainWindow):
             self._update_filter_radios(self.complex_filter_layout, self.complex_type_group, [], 'realEstateTypeName', self.filter_complexes_by_type)
             return
         selected_type_text = button.text()
-        if selected_type_text == "전체": self.articles = self.original_articles.copy()
-        else: self.articles = [c for c in self.original_articles if c.get('realEstateTypeName', '') == selected_type_text]
-        self.complex_table.load_data(self.articles)
+        self.complex_table.filter_by('realEstateTypeName', None if selected_type_text == "전체" else selected_type_text)
+        self.articles = self.complex_table.visible_data()
         if hasattr(self, 'complex_label'): self.complex_label.setText(f"단지 목록: {len(self.articles)}개")
         self.statusBar().showMessage(f"'{selected_type_text}' 필터 적용: {len(self.articles)}개 단지 표시")
\ No newline at end of file
@@ -1,13 +1,24 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import os
 from datetime import datetime
 from urllib.parse import quote
 import random
+import threading
+from rate_limiter import TokenBucketRateLimiter
+from response_cache import ResponseCache, CachedResponse
+from article_store import ArticleStore
+from complex_index import ComplexIndex
+from spatial_index import SpatialIndex
+from fetch_engine import ComplexFetchEngine
+from crawl_journal import PageJournal, unseen_articles
 
 class NaverLandAPI:
-    def __init__(self):
+    def __init__(self, pool_size=10, max_connections_per_host=10, request_timeout=15,
+                 max_requests_per_second=10, max_retries=5, use_cache=True, cache_path=None,
+                 store_path=None):
         # 최신 쿠키 값으로 업데이트 (naver.py에서 가져옴)
         self.cookies = {
             'NNB': 'PUHJ62F5IYOWQ',
@@ -54,7 +65,8 @@ class NaverLandAPI:
         
         # 기본적으로 테스트 모드는 사용하지 않음
         self.use_test_mode = False  # 실제 API 호출로 변경
-        self.test_data_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "naver_land_data.json")
+        # 테스트 데이터로 쓸 저장소 문서 이름 (마지막으로 저장한 응답)
+        self.test_data_name = "naver_land_data"
         
         # 지역 코드 정보 (대표적인 지역)
         self.region_codes = {
@@ -81,10 +93,49 @@ class NaverLandAPI:
         self.default_complex_no = "128305"
 
         self.base_url = "https://new.land.naver.com/api"
-        self._session = requests.Session()
+        # 연결 풀 설정: 모든 API 호출이 하나의 세션을 공유하여 keep-alive 연결을 재사용
+        self.pool_size = pool_size
+        self.max_connections_per_host = max_connections_per_host
+        self.request_timeout = request_timeout
+        self._session = self._create_session()
         self.progress_callback = None
         self.progress = 0
         self.progress_message = ""
+
+        # 모든 API 호출이 공유하는 속도 제한기 (초당 요청 수 상한: max_requests_per_second)
+        # 429 응답 시 속도를 낮추고 재시도하며, 연속 성공 시 상한까지 다시 속도를 올림
+        self.max_retries = max_retries
+        self.rate_limiter = TokenBucketRateLimiter(rate=max(1.0, max_requests_per_second / 2), max_rate=max_requests_per_second)
+
+        # 디스크 응답 캐시 (엔드포인트별 TTL 내 반복 검색은 네트워크 없이 응답)
+        self.response_cache = None
+        if use_cache:
+            try:
+                self.response_cache = ResponseCache(cache_path)
+            except Exception as e:
+                print(f"응답 캐시 초기화 실패 (캐시 없이 진행): {e}")
+
+        # 단지 검색/좌표 색인 (저장소 버전 또는 파일 수정 시각이 바뀌면 다시 만듦)
+        self._complex_index_lock = threading.Lock()
+        self._complex_indexes = {}
+
+        # 로컬 저장소 (단지/매물/검색 결과 저장은 모두 이곳을 거침)
+        self.store = None
+        try:
+            self.store = ArticleStore(store_path)
+            if self.store.count_complexes() == 0:
+                self._import_legacy_complex_files()
+        except Exception as e:
+            print(f"로컬 저장소 초기화 실패 (저장 없이 진행): {e}")
+        
+        # 여러 페이지 수집 체크포인트 (중단된 요청을 처음 빠진 페이지부터 이어 받음)
+        self.page_journal = None
+        if self.store is not None:
+            self.page_journal = PageJournal(self.store)
+            try:
+                self.page_journal.purge_expired()
+            except Exception as e:
+                print(f"페이지 저널 정리 중 오류: {e}")
         
         # 토큰 만료 여부 확인
         self._check_token_expiry()
@@ -115,6 +166,62 @@ class NaverLandAPI:
             remaining_time = self.token_expiry - current_time
             # 모든 경고 메시지 제거
 
+    def _create_session(self):
+        """연결 풀, 호스트별 연결 수 제한, 응답 압축이 설정된 세션 생성"""
+        session = requests.Session()
+        # pool_connections: 캐시할 호스트별 풀 개수, pool_maxsize: 호스트당 최대 연결 수
+        # pool_block=True 이면 호스트당 연결 수가 상한을 넘지 않도록 빈 연결을 기다림
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.max_connections_per_host, pool_block=True)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        accept_encoding = 'gzip, deflate'
+        try:
+            import brotli  # noqa: F401 (urllib3가 brotli 응답을 해제할 수 있을 때만 요청)
+            accept_encoding += ', br'
+        except ImportError:
+            pass
+        session.headers.update({'accept-encoding': accept_encoding, 'connection': 'keep-alive'})
+        return session
+
+    def _get(self, url, params=None, headers=None, cookies=None, use_cache=True):
+        """공유 세션을 통해 GET 요청 수행 (모든 API 엔드포인트가 이 경로를 사용)
+
+        use_cache가 True면 유효한 캐시 응답을 먼저 돌려주고, 200 응답은 캐시에 저장한다.
+        요청마다 속도 제한기의 토큰을 받고, 429 응답은 Retry-After/백오프 후 최대 max_retries번 재시도한다.
+        """
+        cache = self.response_cache if use_cache else None
+        if cache:
+            try:
+                cached_body = cache.get(url, params)
+                if cached_body is not None:
+                    return CachedResponse(cached_body)
+            except Exception as e:
+                print(f"캐시 조회 중 오류: {e}")
+
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            response = self._session.get(
+                url,
+                params=params,
+                headers=headers if headers is not None else self.headers,
+                cookies=cookies if cookies is not None else self.cookies,
+                timeout=self.request_timeout
+            )
+            if response.status_code == 429 and attempt < self.max_retries:
+                attempt += 1
+                wait_time = self.rate_limiter.on_throttled(response.headers.get('Retry-After'))
+                print(f"API 요청 제한 초과(429). {wait_time:.1f}초 후 재시도합니다... ({attempt}/{self.max_retries}, 현재 속도 {self.rate_limiter.rate:.1f}회/초)")
+                continue
+            if response.status_code < 400:
+                self.rate_limiter.on_success()
+            if cache and response.status_code == 200:
+                try:
+                    cache.set(url, params, response.content)
+                except Exception as e:
+                    print(f"캐시 저장 중 오류: {e}")
+            return response
+
     def set_progress_callback(self, callback):
         """진행 상태 업데이트 콜백 설정"""
         self.progress_callback = callback
@@ -132,32 +239,12 @@ class NaverLandAPI:
             else:
                 self.progress_callback(progress, message)
 
-    def search_by_complex(self, complex_no, max_pages=None, check_total_only=False):
-        """단지번호로 매물 검색"""
-        import time
-        
-        print(f"단지번호 {complex_no}로 매물 검색 시작")
-        
-        # 진행 상태 초기화
-        self.progress = 0
-        self.update_progress(0, "검색 시작...")
-        
-        # 결과 저장 딕셔너리
-        result = {
-            'articleList': [],
-            'totalPages': 0,
-            'totalCount': 0
-        }
-        
-        # 최신 헤더와 쿠키 사용
-        updated_headers = self.headers.copy()
-        updated_cookies = self.cookies.copy()
-        
+    @staticmethod
+    def _complex_article_request(complex_no, order='rank'):
+        """단지 매물 목록 API의 URL과 파라미터 (동기/비동기 클라이언트 공용)"""
         # 새로운 API 엔드포인트 사용 (2023년 변경됨)
         # 네이버 부동산 API 형식: https://new.land.naver.com/api/articles/complex/1096
         base_url = f"https://new.land.naver.com/api/articles/complex/{complex_no}"
-        print(f"API 엔드포인트 URL: {base_url}")
-        
         # 새로운 API 파라미터 형식 사용
         params = {
             'realEstateType': 'APT:ABYG:JGC:PRE',
@@ -178,145 +265,197 @@ class NaverLandAPI:
             'buildingNos': '',
             'areaNos': '',
             'type': 'list',
-            'order': 'rank'
+            'order': order
         }
+        return base_url, params
+
+    def iter_complex_article_pages(self, complex_no, max_pages=None, use_cache=True, order='rank', use_journal=False):
+        """단지 매물을 페이지 단위로 하나씩 내주는 제너레이터
+
+        다음 페이지는 호출 측이 앞 페이지를 받아 간 뒤에야 요청하므로, 도중에 멈추면(break/close)
+        남은 페이지는 요청하지 않는다. 각 항목은 {'page', 'articleList', 'isMoreData', 'requestCount'}이고,
+        요청이 실패하면 'error'가 담긴 빈 페이지를 마지막으로 내주고 끝난다.
+        앞 페이지와 겹치는 매물(articleNo 기준)은 빼고 내준다.
+        use_journal이 True면 받은 페이지를 저널에 기록하고, 이전에 중단된 같은 요청이 있으면 기록된 페이지를
+        먼저 재생('fromJournal': True)한 뒤 처음 빠진 페이지부터 이어서 받는다.
+        """
+        # 최신 헤더와 쿠키 사용
+        updated_headers = self.headers.copy()
+        updated_cookies = self.cookies.copy()
+        
+        base_url, params = self._complex_article_request(complex_no, order)
+        print(f"API 엔드포인트 URL: {base_url}")
         
-        # 페이지 순회
+        seen = set()
         page = 1
-        total_pages = 1  # 초기값
+        run = self.page_journal.begin(base_url, params) if use_journal and self.page_journal else None
+        if run and run.saved_pages:
+            for saved_page, items, is_more in run.saved_pages:
+                if max_pages is not None and saved_page > max_pages:
+                    return
+                yield {'page': saved_page, 'articleList': unseen_articles(items, seen), 'isMoreData': is_more,
+                       'requestCount': 0, 'fromJournal': True}
+            page = run.next_page
+            print(f"저널에서 {len(run.saved_pages)}페이지를 재생했습니다. {page}페이지부터 이어서 받습니다.")
         
-        while page <= total_pages and (max_pages is None or page <= max_pages):
-            # 페이지 파라미터 업데이트
+        request_count = 0
+        refreshed_page = None  # 토큰을 갱신하고 재시도한 페이지
+        while max_pages is None or page <= max_pages:
             params['page'] = str(page)
-            
             print(f"매물 API 요청: {base_url} (페이지 {page})")
             
             try:
                 # 최신 헤더와 쿠키 사용 - params 매개변수 사용하여 자동 URL 인코딩 적용
-                response = requests.get(base_url, params=params, headers=updated_headers, cookies=updated_cookies)
+                response = self._get(base_url, params=params, headers=updated_headers, cookies=updated_cookies, use_cache=use_cache)
                 status_code = response.status_code
+                request_count += 1
                 print(f"매물 API 응답 상태 코드: {status_code} (페이지 {page})")
                 
-                # 응답 확인
                 if status_code == 200:
                     data = response.json()
                     print(f"매물 API 응답 데이터 키: {data.keys() if data else 'None'}")
-                    
-                    # 매물 목록 추가
-                    article_list = data.get('articleList', [])
-                    if article_list:
-                        result['articleList'].extend(article_list)
-                        print(f"페이지 {page}: {len(article_list)}개 매물 추가됨")
-                        
-                        # 첫 페이지에서 총 매물 수 확인
-                        if page == 1:
-                            # isMoreData가 false면 더 이상 페이지가 없음
-                            is_more_data = data.get('isMoreData', False)
-                            total_count = len(article_list)
-                            if not is_more_data:
-                                total_pages = 1
-                            else:
-                                # 예상 페이지 수 (페이지당 10개 매물 기준)
-                                total_pages = 1000  # 기본값, 실제로는 더 많을 수 있음
-                            
-                            result['totalCount'] = total_count
-                            result['totalPages'] = total_pages
-                            
-                            print(f"총 매물 수: {total_count}, 총 페이지 수: {total_pages}")
-                            
-                            # 매물이 없는 경우
-                            if total_count == 0:
-                                print("매물이 없습니다.")
-                                break
-                            
-                            # 총 페이지 수만 확인하는 경우
-                            if check_total_only:
-                                break
-                        
-                        # isMoreData가 false면 더 이상 페이지가 없음
-                        if not data.get('isMoreData', False):
-                            print(f"더 이상 페이지가 없습니다. (isMoreData: false)")
-                            break
-                    else:
-                        print(f"페이지 {page}: 매물 없음")
-                        # 페이지에 매물이 없으면 중단
-                        break
-                    
-                    # 진행 상태 업데이트
-                    progress_percent = min(int((page / min(total_pages, max_pages or float('inf'))) * 100), 100)
-                    self.update_progress(progress_percent, f"매물 검색 중... ({page}페이지)")
-                    
+                    page_data = {
+                        'page': page,
+                        'articleList': data.get('articleList', []),
+                        'isMoreData': data.get('isMoreData', False),
+                        'requestCount': request_count,
+                    }
                 elif status_code == 401:
-                    # 인증 토큰 만료
+                    # 인증 토큰 만료 (갱신한 토큰도 거절되면 같은 페이지를 계속 재시도하지 않도록 페이지마다 한 번만 갱신)
                     print("API 인증 토큰이 만료되었습니다. 토큰을 업데이트합니다.")
-                    
-                    # 토큰 갱신 시도
-                    if self._refresh_token():
-                        # 갱신된 토큰으로 헤더 업데이트
+                    if refreshed_page != page and self._refresh_token():
+                        # 갱신된 토큰으로 헤더 업데이트 후 같은 페이지 재시도
+                        refreshed_page = page
                         updated_headers = self.headers.copy()
                         print("인증 토큰이 갱신되었습니다. 요청을 재시도합니다.")
-                        # 같은 페이지 재시도
                         continue
-                    else:
-                        print("토큰 갱신 실패. 검색을 중단합니다.")
-                        # 테스트 모드로 전환
-                        self.use_test_mode = True
-                        print("테스트 모드로 전환합니다.")
-                        
-                        # 테스트 데이터 로드
-                        test_data = self._load_test_data()
-                        if test_data:
-                            print("테스트 데이터 로드 성공")
-                            return test_data
-                        break
-                    
-                elif status_code == 429:
-                    # 요청 제한 초과
-                    print("API 요청 제한을 초과했습니다. 잠시 후 다시 시도합니다.")
-                    # 지수 백오프 전략 적용 (페이지에 따라 대기 시간 증가)
-                    wait_time = min(3 * (1 ** (page % 5)), 3)  # 최대 60초 대기
-                    print(f"{wait_time}초 대기 후 재시도합니다...")
-                    time.sleep(wait_time)
-                    continue  # 같은 페이지 재시도
-                    
+                    print("토큰 갱신 실패. 검색을 중단합니다.")
+                    page_data = {'page': page, 'articleList': [], 'isMoreData': False,
+                                 'requestCount': request_count, 'error': "인증 토큰 갱신 실패"}
                 else:
                     # 기타 오류
                     print(f"API 오류: 상태 코드 {status_code}")
                     print(f"응답 내용: {response.text[:200]}")
-                    
-                    # 테스트 모드로 전환
-                    print("테스트 모드로 전환합니다.")
-                    self.use_test_mode = True
-                    
-                    # 테스트 데이터 로드
-                    test_data = self._load_test_data()
-                    if test_data:
-                        print("테스트 데이터 로드 성공")
-                        return test_data
-                    break
-                
+                    page_data = {'page': page, 'articleList': [], 'isMoreData': False,
+                                 'requestCount': request_count, 'error': f"API 오류: 상태 코드 {status_code}"}
             except Exception as e:
                 print(f"API 요청 중 예외 발생: {str(e)}")
                 import traceback
                 traceback.print_exc()
+                page_data = {'page': page, 'articleList': [], 'isMoreData': False,
+                             'requestCount': request_count, 'error': f"API 요청 중 오류 발생: {str(e)}"}
+            
+            if 'error' in page_data:
+                # 받은 페이지는 저널에 남겨 두어 다음 요청에서 이어 받음
+                yield page_data
+                return
+            article_list = page_data['articleList']
+            if not article_list:
+                # 페이지에 매물이 없으면 중단
+                print(f"페이지 {page}: 매물 없음")
+                if run:
+                    run.complete()
+                return
+            if run:
+                # 마지막 페이지면 저널을 먼저 지움 (소비자가 이 페이지에서 멈추면 yield 뒤 코드는 실행되지 않음)
+                if page_data['isMoreData']:
+                    run.record(page, article_list, True)
+                else:
+                    run.complete()
+            page_data['articleList'] = unseen_articles(article_list, seen)
+            print(f"페이지 {page}: {len(page_data['articleList'])}개 매물 추가됨")
+            yield page_data
+            # isMoreData가 false면 더 이상 페이지가 없음
+            if not page_data['isMoreData']:
+                print(f"더 이상 페이지가 없습니다. (isMoreData: false)")
+                return
+            
+            # 다음 페이지로 이동 (요청 간격은 _get의 속도 제한기가 조절)
+            page += 1
+            request_count = 0
+
+    def iter_complex_articles(self, complex_no, limit=None, **kwargs):
+        """단지 매물을 하나씩 내주는 제너레이터 (limit개를 내주면 남은 페이지는 요청하지 않음)"""
+        if limit is not None and limit <= 0:
+            return
+        count = 0
+        for page_data in self.iter_complex_article_pages(complex_no, **kwargs):
+            for article in page_data['articleList']:
+                yield article
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+    def search_by_complex(self, complex_no, max_pages=None, check_total_only=False, use_cache=True,
+                          order='rank', page_callback=None, use_journal=None):
+        """단지번호로 매물 검색 (use_cache=False면 캐시를 건너뛰고 새로 조회)
+
+        page_callback(page, article_list)가 True를 반환하면 그 페이지까지만 수집하고 멈춘다.
+        결과의 isMoreData가 True면 마지막 페이지까지 가지 않고 멈춘 것이다.
+        도중에 요청이 실패하면 받은 매물까지 담고 'error'와 isPartial=True를 넣어 반환한다 (테스트 데이터로 바꾸지 않음).
+        끝까지 받는 검색(max_pages/page_callback/check_total_only 없음)은 기본으로 페이지 저널을 써서
+        다시 검색하면 처음 빠진 페이지부터 이어 받는다.
+        페이지가 도착하는 대로 받아야 하면 iter_complex_article_pages를 사용한다.
+        """
+        print(f"단지번호 {complex_no}로 매물 검색 시작")
+        
+        # 진행 상태 초기화
+        self.progress = 0
+        self.update_progress(0, "검색 시작...")
+        
+        # 결과 저장 딕셔너리
+        result = {
+            'articleList': [],
+            'totalPages': 0,
+            'totalCount': 0,
+            'isMoreData': False,
+            'requestCount': 0
+        }
+        total_pages = 1
+        if use_journal is None:
+            use_journal = max_pages is None and page_callback is None and not check_total_only
+        
+        pages = self.iter_complex_article_pages(complex_no, max_pages=max_pages, use_cache=use_cache, order=order,
+                                                use_journal=use_journal)
+        for page_data in pages:
+            page = page_data['page']
+            result['requestCount'] += page_data['requestCount']
+            if 'error' in page_data:
+                # 받은 매물은 그대로 두고 부분 결과로 반환 (저널에 남은 페이지는 다음 검색에서 이어 받음)
+                print(f"{page}페이지에서 오류가 발생했습니다. 받은 {len(result['articleList'])}개 매물로 부분 결과를 반환합니다.")
+                result['error'] = page_data['error']
+                result['isPartial'] = True
+                result['isMoreData'] = True
+                break
+            
+            article_list = page_data['articleList']
+            result['articleList'].extend(article_list)
+            result['isMoreData'] = page_data['isMoreData']
+            
+            # 첫 페이지에서 총 매물 수 확인
+            if page == 1:
+                # 예상 페이지 수 (isMoreData가 true면 페이지 수를 알 수 없으므로 기본값 사용)
+                total_pages = 1000 if page_data['isMoreData'] else 1
+                result['totalCount'] = len(article_list)
+                result['totalPages'] = total_pages
+                print(f"총 매물 수: {len(article_list)}, 총 페이지 수: {total_pages}")
                 
-                # 테스트 모드로 전환
-                print("테스트 모드로 전환합니다.")
-                self.use_test_mode = True
-                
-                # 테스트 데이터 로드
-                test_data = self._load_test_data()
-                if test_data:
-                    print("테스트 데이터 로드 성공")
-                    return test_data
+                # 총 페이지 수만 확인하는 경우
+                if check_total_only:
+                    break
+            
+            if not page_data['isMoreData']:
                 break
             
-            # 다음 페이지로 이동
-            page += 1
+            # 호출 측에서 더 볼 필요가 없다고 판단하면 중단 (증분 갱신 등)
+            if page_callback and page_callback(page, article_list):
+                print(f"페이지 {page}에서 수집을 중단합니다. (page_callback)")
+                break
             
-            # 페이지 간 지연 시간 추가 (API 요청 제한 방지)
-            delay = 0.2 if page < 5 else (0.5 if page < 10 else 1)
-            time.sleep(delay)
+            # 진행 상태 업데이트
+            progress_percent = min(int((page / min(total_pages, max_pages or float('inf'))) * 100), 100)
+            self.update_progress(progress_percent, f"매물 검색 중... ({page}페이지)")
+        pages.close()
         
         # 최종 진행 상태 업데이트
         self.update_progress(100, f"검색 완료: {len(result['articleList'])}개 매물")
@@ -341,12 +480,7 @@ class NaverLandAPI:
         print(f"API 요청: {url} (위치 검색, 좌표: {lat},{lon})")
         
         try:
-            response = requests.get(
-                url,
-                params=params,
-                cookies=self.cookies,
-                headers=self.headers
-            )
+            response = self._get(url, params=params)
             
             print(f"API 응답 상태 코드: {response.status_code}")
             
@@ -360,7 +494,7 @@ class NaverLandAPI:
                     complex_no = data['complexes'][0].get('complexNo')
                     if complex_no:
                         print(f"위치 검색에서 찾은 첫 번째 단지({complex_no})의 모든 매물을 검색합니다.")
-                        return self.search_by_complex(complex_no=complex_no, fetch_all_pages=True)
+                        return self.search_by_complex(complex_no=complex_no)
                 
                 return data
             else:
@@ -378,70 +512,76 @@ class NaverLandAPI:
             print(f"API 요청 중 오류 발생: {e}")
             return self._load_test_data()  # 오류 발생 시 테스트 데이터 사용
 
-    def search_by_region(self, region_code='4100000000', fetch_all_pages=False):
-        """특정 지역 코드로 매물 검색 - 이 방식은 실제로 기존 파일과 다르게 작동할 수 있음"""
+    def get_location_tile(self, lat, lon, zoom=16):
+        """좌표 한 곳(지도 화면 하나)의 매물/단지 응답 (articles?ms=위도,경도,줌), 요청이 실패하면 None
+
+        search_by_location과 달리 실패해도 테스트 데이터로 바꾸지 않으므로 여러 타일을 훑는 수집에 쓴다.
+        """
+        params = {'ms': f'{lat},{lon},{zoom}', 'a': 'APT:PRE:ABYG:JGC', 'e': 'RETAIL'}
+        try:
+            response = self._get('https://new.land.naver.com/api/articles', params=params)
+            if response.status_code == 200:
+                return response.json()
+            print(f"위치 검색 API 요청 실패: {response.status_code} ({lat},{lon})")
+        except Exception as e:
+            print(f"위치 검색 API 요청 중 오류 발생: {e} ({lat},{lon})")
+        return None
+
+    def get_region_complexes(self, region_code):
+        """지역 코드(cortarNo)에 속한 단지 목록 (regions/complexes), 요청이 실패하면 None"""
+        complexes_url = 'https://new.land.naver.com/api/regions/complexes'
+        complex_params = {
+            'cortarNo': region_code,
+            'realEstateType': 'APT:PRE:ABYG:JGC',
+            'order': 'rank',
+            'showR0': 'false'
+        }
+        
+        print(f"단지 리스트 API 요청: {complexes_url} (지역코드: {region_code})")
+        try:
+            complex_response = self._get(complexes_url, params=complex_params)
+            print(f"단지 리스트 API 응답 상태 코드: {complex_response.status_code}")
+            if complex_response.status_code == 200:
+                return complex_response.json().get('complexList', [])
+            print(f"단지 리스트 API 요청 실패: {complex_response.status_code}")
+            print(f"응답: {complex_response.text[:200]}")
+            # 인증 토큰 만료되었을 경우
+            if complex_response.status_code == 401:
+                print("인증 토큰이 만료되었을 수 있습니다.")
+        except Exception as e:
+            print(f"단지 리스트 API 요청 중 오류 발생: {e}")
+        return None
+
+    def search_by_region(self, region_code='4100000000', fetch_all_pages=False, max_workers=4):
+        """지역 코드에 속한 모든 단지의 매물 검색 (fetch_all_pages가 False면 단지마다 첫 페이지만)
+
+        하위 지역(읍면동)까지 내려가며 체크포인트를 남기는 대량 수집은 region_crawler.RegionCrawler를 사용한다.
+        """
         # 테스트 모드인 경우 테스트 데이터 반환
         if self.use_test_mode:
             print("테스트 모드: 샘플 데이터를 사용합니다.")
             return self._load_test_data()
         
-        # 지역 코드와 가장 근접한 API 호출 방식:
-        # 지역코드(cortarNo)로 단지 리스트를 먼저 가져온 후, 
-        # 그 단지 중 첫번째 단지 번호로 매물 검색
+        max_pages = None if fetch_all_pages else 1
         try:
             # 1. 지역의 단지 리스트 가져오기
-            complexes_url = 'https://new.land.naver.com/api/regions/complexes'
-            complex_params = {
-                'cortarNo': region_code,
-                'realEstateType': 'APT:PRE:ABYG:JGC',
-                'order': 'rank',
-                'showR0': 'false'
-            }
+            complex_list = self.get_region_complexes(region_code)
+            if not complex_list:
+                print(f"지역코드 {region_code}에 해당하는 단지를 가져오지 못했습니다.")
+                # 단지 목록이 없으면 기본 단지(수원) 매물로 대체
+                return self.search_by_complex(self.default_complex_no, max_pages=max_pages)
             
-            print(f"단지 리스트 API 요청: {complexes_url} (지역코드: {region_code})")
-            
-            complex_response = requests.get(
-                complexes_url,
-                params=complex_params,
-                cookies=self.cookies,
-                headers=self.headers
-            )
-            
-            print(f"단지 리스트 API 응답 상태 코드: {complex_response.status_code}")
-            
-            if complex_response.status_code == 200:
-                complex_data = complex_response.json()
-                
-                # API 응답 형식에 따라 단지 리스트 추출
-                complex_list = complex_data.get('complexList', [])
-                if not complex_list:
-                    print(f"지역코드 {region_code}에 해당하는 단지가 없습니다.")
-                    # 경기도(4100000000) 지역에 단지가 없으면 수원시 단지 정보 사용
-                    return self.search_by_complex(self.default_complex_no, fetch_all_pages=fetch_all_pages)
-                
-                # 2. 첫번째 단지 번호로 해당 단지의 매물 검색
-                first_complex = complex_list[0]
-                complex_no = first_complex.get('complexNo')
-                
-                print(f"검색된 첫 번째 단지 번호: {complex_no}")
-                
-                if complex_no:
-                    # 단지 번호로 검색 API 호출
-                    return self.search_by_complex(complex_no=complex_no, fetch_all_pages=fetch_all_pages)
-                else:
-                    print("단지 번호를 찾을 수 없습니다.")
-                    return self._load_test_data()
-            else:
-                print(f"단지 리스트 API 요청 실패: {complex_response.status_code}")
-                print(f"응답: {complex_response.text[:200]}")
-                
-                # 인증 토큰 만료되었을 경우
-                if complex_response.status_code == 401:
-                    print("인증 토큰이 만료되었을 수 있습니다. 테스트 데이터로 전환합니다.")
-                
-                # 기본 단지 번호로 대체 검색
-                return self.search_by_complex(self.default_complex_no, fetch_all_pages=fetch_all_pages)
-                
+            # 2. 모든 단지의 매물을 제한된 동시성으로 검색
+            print(f"지역코드 {region_code}: {len(complex_list)}개 단지의 매물을 검색합니다.")
+            engine = ComplexFetchEngine(self, max_workers=max_workers, max_pages_per_complex=max_pages)
+            articles, _, failed = engine.run(complex_list)
+            return {
+                'articleList': articles,
+                'complexes': complex_list,
+                'totalCount': len(articles),
+                'isMoreData': False,
+                'failedComplexes': failed,
+            }
         except Exception as e:
             print(f"지역 검색 중 오류 발생: {e}")
             # 오류 발생 시 테스트 데이터 사용
@@ -462,12 +602,7 @@ class NaverLandAPI:
         print(f"지역 정보 요청: {url} (지역코드: {region_code})")
         
         try:
-            response = requests.get(
-                url,
-                params=params,
-                cookies=self.cookies,
-                headers=self.headers
-            )
+            response = self._get(url, params=params)
             
             print(f"API 응답 상태 코드: {response.status_code}")
             
@@ -481,17 +616,12 @@ class NaverLandAPI:
             print(f"API 요청 중 오류 발생: {e}")
             return None
     
-    def search_by_keyword(self, keyword, max_pages=None):
-        """키워드로 단지 검색"""
-        import time
-        
-        # 검색 결과 저장 변수
-        all_data = None
-        all_complexes = []
-        
-        # 진행 상태 초기화
-        self.update_progress(0, f"키워드 '{keyword}'로 단지 검색을 시작합니다...")
-        
+    def iter_keyword_pages(self, keyword, max_pages=None, use_cache=True):
+        """키워드 검색 응답을 페이지 단위로 하나씩 내주는 제너레이터
+
+        각 항목은 페이지의 API 응답 그대로이며(첫 페이지는 전체 구조 포함), 다음 페이지는 호출 측이
+        앞 페이지를 받아 간 뒤에야 요청한다. 오류가 나면 {'complexes': [], 'error': ...}를 내주고 끝난다.
+        """
         # 토큰 만료 여부 확인
         self._check_token_expiry()
         
@@ -501,116 +631,115 @@ class NaverLandAPI:
         
         # max_pages가 None인 경우 큰 숫자로 설정하여 모든 페이지 검색
         max_pages_to_search = max_pages if max_pages is not None else 1000
+        url = "https://new.land.naver.com/api/search"
         
-        for page in range(1, max_pages_to_search + 1):
+        page = 1
+        refreshed_page = None  # 토큰을 갱신하고 재시도한 페이지
+        while page <= max_pages_to_search:
+            params = {
+                'keyword': keyword,
+                'page': str(page),
+            }
+            print(f"API 요청: {url} (페이지 {page}, 키워드: {keyword})")
+            
             try:
-                # 진행 상태 업데이트
-                if max_pages:
-                    progress = min(int((page / max_pages) * 100), 95)
-                else:
-                    progress = min(int((page / 20) * 100), 95)  # 페이지 수를 모를 때는 20페이지를 기준으로 진행 상황 표시
-                self.update_progress(progress, f"페이지 {page} 가져오는 중...")
-                
-                # API 엔드포인트 및 파라미터 설정
-                params = {
-                    'keyword': keyword,
-                    'page': str(page),
-                }
-                
-                url = "https://new.land.naver.com/api/search"
-                
-                print(f"API 요청: {url} (페이지 {page}, 키워드: {keyword})")
-                
                 # API 요청 수행 - params 매개변수 사용하여 자동 URL 인코딩 적용
-                response = requests.get(url, params=params, headers=updated_headers, cookies=updated_cookies)
+                response = self._get(url, params=params, headers=updated_headers, cookies=updated_cookies, use_cache=use_cache)
                 print(f"API 응답 상태 코드: {response.status_code}")
                 
-                # 응답 처리
                 if response.status_code == 200:
                     data = response.json()
-                    
-                    # API 응답 디버깅
                     print(f"API 응답 데이터 키: {data.keys() if data else 'None'}")
-                    
-                    # 에러 응답 확인
-                    if 'error' in data:
-                        error_code = data.get('error', {}).get('code', 'unknown')
-                        error_msg = data.get('error', {}).get('message', '알 수 없는 오류')
-                        print(f"API 에러 응답: {error_code} - {error_msg}")
-                        
-                        # 에러 정보 저장
-                        if all_data is None:
-                            all_data = {'complexes': [], 'error': error_msg}
-                        break
-                    
-                    # 첫 페이지인 경우 전체 데이터 구조 저장
-                    if all_data is None:
-                        all_data = data
-                        all_complexes = data.get('complexes', [])
-                        print(f"첫 페이지 데이터: {len(all_complexes)}개 단지 발견")
-                    else:
-                        # 이후 페이지의 complexes만 추가
-                        page_complexes = data.get('complexes', [])
-                        if page_complexes:
-                            all_complexes.extend(page_complexes)
-                            print(f"페이지 {page}에서 {len(page_complexes)}개 단지 추가")
-                        else:
-                            # 더 이상 데이터가 없으면 종료
-                            print(f"페이지 {page}에 더 이상 데이터가 없습니다. 종료합니다.")
-                            break
-                            
-                    # 더 이상 데이터가 없으면 종료
-                    if not data.get('isMoreData', False):
-                        print("더 이상 데이터가 없습니다. 검색을 종료합니다.")
-                        break
-                            
-                    # API 요청 간에 짧은 딜레이 추가
-                    time.sleep(0.5)
                 elif response.status_code == 401:
-                    # 인증 토큰 만료 - 토큰 갱신 시도
+                    # 인증 토큰 만료 - 토큰 갱신 시도 (페이지마다 한 번만)
                     print("인증 토큰이 만료되었습니다. 갱신을 시도합니다.")
-                    
-                    # 토큰 갱신 시도
-                    if self._refresh_token():
-                        # 갱신된 토큰으로 헤더 업데이트
+                    if refreshed_page == page:
+                        # 갱신한 토큰도 거절됨 - 같은 페이지를 계속 재시도하지 않고 오류로 끝냄
+                        print("갱신한 토큰으로도 인증에 실패했습니다. 검색을 중단합니다.")
+                        data = {'complexes': [], 'error': "인증 토큰 갱신 실패"}
+                    elif self._refresh_token():
+                        # 갱신된 토큰으로 헤더 업데이트 후 같은 페이지 재시도
+                        refreshed_page = page
                         updated_headers = self.headers.copy()
                         print("인증 토큰이 갱신되었습니다. 요청을 재시도합니다.")
-                        page -= 1  # 같은 페이지 재시도
                         continue
                     else:
                         print("토큰 갱신 실패. 검색을 중단합니다.")
                         # 테스트 모드로 전환
                         self.use_test_mode = True
                         print("테스트 모드로 전환합니다.")
-                        break
+                        return
                 else:
                     print(f"API 요청 실패: {response.status_code}")
-                    if response.status_code == 429:
-                        print("요청 제한 초과. 잠시 후 다시 시도합니다.")
-                        # 지수 백오프 전략 적용
-                        wait_time = min(5 * (2 ** (page % 5)), 60)  # 최대 60초 대기
-                        print(f"{wait_time}초 대기 후 재시도합니다...")
-                        time.sleep(wait_time)
-                        page -= 1  # 같은 페이지 재시도
-                        continue
-                    else:
-                        # 기타 오류
-                        print(f"API 오류: {response.text[:200]}")
-                        # 오류 정보 저장
-                        all_data = all_data or {'complexes': []}
-                        all_data['error'] = f"API 오류: 상태 코드 {response.status_code}"
-                        break
+                    # 429 재시도는 _get에서 처리하므로 여기까지 온 경우는 모두 오류로 처리
+                    print(f"API 오류: {response.text[:200]}")
+                    data = {'complexes': [], 'error': f"API 오류: 상태 코드 {response.status_code}"}
             except Exception as e:
                 print(f"API 요청 중 오류 발생: {e}")
                 import traceback
                 traceback.print_exc()
-                # 예외 정보 저장
-                all_data = all_data or {'complexes': []}
-                all_data['error'] = f"API 요청 중 오류 발생: {str(e)}"
-                break
+                data = {'complexes': [], 'error': f"API 요청 중 오류 발생: {str(e)}"}
+            
+            # 에러 응답 확인
+            if 'error' in data:
+                error = data['error']
+                if isinstance(error, dict):
+                    print(f"API 에러 응답: {error.get('code', 'unknown')} - {error.get('message', '알 수 없는 오류')}")
+                    data = {'complexes': [], 'error': error.get('message', '알 수 없는 오류')}
+                yield data
+                return
+            
+            if page > 1 and not data.get('complexes'):
+                # 더 이상 데이터가 없으면 종료
+                print(f"페이지 {page}에 더 이상 데이터가 없습니다. 종료합니다.")
+                return
+            yield data
+            
+            # 더 이상 데이터가 없으면 종료
+            if not data.get('isMoreData', False):
+                print("더 이상 데이터가 없습니다. 검색을 종료합니다.")
+                return
+            page += 1
+
+    def search_by_keyword(self, keyword, max_pages=None, use_cache=True):
+        """키워드로 단지 검색 (use_cache=False면 캐시를 건너뛰고 새로 조회)"""
+        # 진행 상태 초기화
+        self.update_progress(0, f"키워드 '{keyword}'로 단지 검색을 시작합니다...")
+        
+        pages = []
+        for page, data in enumerate(self.iter_keyword_pages(keyword, max_pages=max_pages, use_cache=use_cache), 1):
+            pages.append(data)
+            # 진행 상태 업데이트 (페이지 수를 모를 때는 20페이지를 기준으로 진행 상황 표시)
+            progress = min(int((page / (max_pages or 20)) * 100), 95)
+            self.update_progress(progress, f"페이지 {page} 가져옴...")
         
         # 진행 상황 업데이트 완료 (100%)
         self.update_progress(100, "검색 완료")
+        return self._merge_keyword_pages(keyword, pages)
+    
+    def _merge_keyword_pages(self, keyword, pages):
+        """키워드 검색 페이지 응답들을 하나의 결과로 합치고 저장 (동기/비동기 클라이언트 공용)"""
+        # 검색 결과 저장 변수
+        all_data = None
+        all_complexes = []
+        
+        for page, data in enumerate(pages, 1):
+            if 'error' in data:
+                # 오류 정보 저장 (앞 페이지까지의 결과는 유지)
+                all_data = all_data or {'complexes': []}
+                all_data['error'] = data['error']
+                break
+            
+            # 첫 페이지인 경우 전체 데이터 구조 저장
+            if all_data is None:
+                all_data = data
+                all_complexes = list(data.get('complexes', []))
+                print(f"첫 페이지 데이터: {len(all_complexes)}개 단지 발견")
+            else:
+                # 이후 페이지의 complexes만 추가
+                page_complexes = data.get('complexes', [])
+                all_complexes.extend(page_complexes)
+                print(f"페이지 {page}에서 {len(page_complexes)}개 단지 추가")
         
         # 모든 complexes 데이터를 병합
         if all_data:
@@ -621,8 +750,7 @@ class NaverLandAPI:
                 print(f"총 {len(all_complexes)}개 단지 정보를 가져왔습니다.")
             
             # 검색 결과를 파일로 저장
-            file_path = self.save_response_to_file(all_data, f"{keyword}_complexes.json")
-            print(f"검색 결과가 {file_path} 파일에 저장되었습니다.")
+            self.save_response(all_data, f"{keyword}_complexes")
             
             return all_data
         
@@ -692,148 +820,215 @@ class NaverLandAPI:
         """테스트용 데이터 로드"""
         try:
             print("테스트 데이터 로드 시도...")
-            # 현재 디렉토리에서 테스트 데이터 파일 찾기
-            if os.path.exists(self.test_data_file):
-                print(f"테스트 데이터 파일 발견: {self.test_data_file}")
-                with open(self.test_data_file, 'r', encoding='utf-8') as f:
+            data = self.store.load_document(self.test_data_name) if self.store else None
+            if data:
+                print(f"테스트 데이터 로드 완료: {data.keys()}")
+                return data
+
+            # 이전 버전에서 JSON 파일로 저장한 테스트 데이터가 있으면 저장소로 옮김
+            legacy_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "naver_land_data.json")
+            if os.path.exists(legacy_file):
+                print(f"이전 테스트 데이터 파일 발견: {legacy_file}")
+                with open(legacy_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    print(f"테스트 데이터 로드 완료: {data.keys() if data else 'None'}")
-                    return data
-            else:
-                print(f"테스트 데이터 파일을 찾을 수 없습니다: {self.test_data_file}")
-                
-                # 프로젝트 루트의 naver_land_data.json 확인
-                root_file = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "naver_land_data.json")
-                print(f"프로젝트 루트에서 데이터 파일 확인: {root_file}")
-                
-                if os.path.exists(root_file):
-                    print(f"프로젝트 루트에서 데이터 파일 발견: {root_file}")
-                    with open(root_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        print(f"데이터 로드 완료: {data.keys() if data else 'None'}")
-                        return data
-                else:
-                    print(f"프로젝트 루트에서도 데이터 파일을 찾을 수 없습니다: {root_file}")
-                    
-                    # 테스트 데이터 파일이 없으면 기본 데이터 생성
-                    print("테스트 데이터 파일이 없어 기본 데이터를 생성합니다.")
-                    default_data = {
-                        "articleList": [
-                            {
-                                "articleNo": "2311234567",
-                                "complexNo": "128305",
-                                "complexName": "테스트 아파트",
-                                "tradeTypeName": "매매",
-                                "floorInfo": "5층",
-                                "areaNormal": 84.56,
-                                "supplyArea": 110.24,
-                                "direction": "남향",
-                                "priceString": "8억 5,000",
-                                "checkDate": "2023-11-01"
-                            },
-                            {
-                                "articleNo": "2311234568",
-                                "complexNo": "128305",
-                                "complexName": "테스트 아파트",
-                                "tradeTypeName": "전세",
-                                "floorInfo": "10층",
-                                "areaNormal": 59.23,
-                                "supplyArea": 84.12,
-                                "direction": "동향",
-                                "priceString": "3억 8,000",
-                                "checkDate": "2023-11-02"
-                            }
-                        ],
-                        "totalCount": 2,
-                        "totalPages": 1
+                self.save_response(data, self.test_data_name)
+                return data
+
+            # 테스트 데이터가 없으면 기본 데이터 생성
+            print("테스트 데이터가 없어 기본 데이터를 생성합니다.")
+            default_data = {
+                "articleList": [
+                    {
+                        "articleNo": "2311234567",
+                        "complexNo": "128305",
+                        "complexName": "테스트 아파트",
+                        "tradeTypeName": "매매",
+                        "floorInfo": "5층",
+                        "areaNormal": 84.56,
+                        "supplyArea": 110.24,
+                        "direction": "남향",
+                        "priceString": "8억 5,000",
+                        "checkDate": "2023-11-01"
+                    },
+                    {
+                        "articleNo": "2311234568",
+                        "complexNo": "128305",
+                        "complexName": "테스트 아파트",
+                        "tradeTypeName": "전세",
+                        "floorInfo": "10층",
+                        "areaNormal": 59.23,
+                        "supplyArea": 84.12,
+                        "direction": "동향",
+                        "priceString": "3억 8,000",
+                        "checkDate": "2023-11-02"
                     }
-                    
-                    # 테스트 데이터 파일 저장
-                    self.save_response_to_file(default_data)
-                    print("기본 테스트 데이터를 생성하고 파일로 저장했습니다.")
-                    return default_data
-                
-                return {"articleList": [], "message": "테스트 데이터 없음"}
+                ],
+                "totalCount": 2,
+                "totalPages": 1
+            }
+            self.save_response(default_data, "naver_land_data")
+            return default_data
         except Exception as e:
             print(f"테스트 데이터 로드 중 오류 발생: {e}")
             return {"articleList": [], "message": f"테스트 데이터 로드 오류: {str(e)}"}
 
-    def save_response_to_file(self, data, filename='naver_land_data.json'):
-        """API 응답 데이터를 파일로 저장"""
-        if data:
-            try:
-                # 상대 경로 대신 절대 경로 사용
-                current_dir = os.path.dirname(os.path.abspath(__file__))
-                file_path = os.path.join(current_dir, filename)
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=4)
-                print(f"데이터가 {file_path} 파일로 저장되었습니다.")
-                
-                # 테스트 데이터 파일 경로 업데이트
-                self.test_data_file = file_path
-                return file_path
-            except Exception as e:
-                print(f"파일 저장 중 오류 발생: {e}")
-                return None
-        return None
+    def save_response(self, data, name='naver_land_data'):
+        """API 응답 데이터를 로컬 저장소에 저장 (단지 목록은 단지 테이블에도 일괄 반영)"""
+        if not data or self.store is None:
+            return None
+        try:
+            self.store.save_document(name, data)
+            complexes = data.get('complexes') if isinstance(data, dict) else None
+            if complexes:
+                self.store.upsert_complexes(complexes)
+            print(f"데이터가 저장소에 '{name}' 이름으로 저장되었습니다.")
 
-    def load_complex_data(self, file_path=None):
-        """특정 JSON 파일에서 단지 정보 불러오기"""
+            # 테스트 데이터 이름 업데이트
+            self.test_data_name = name
+            return name
+        except Exception as e:
+            print(f"저장소 저장 중 오류 발생: {e}")
+            return None
+
+    def import_complex_file(self, file_path):
+        """이전 버전의 단지 정보 JSON 파일을 저장소로 가져오기"""
         try:
-            if file_path is None:
-                # 기본 경로 사용
-                current_dir = os.path.dirname(os.path.abspath(__file__))
-                file_path = os.path.join(current_dir, "청담동_complexes.json")
-            
-            print(f"단지 정보 파일 로드 시도: {file_path}")
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    print(f"단지 정보 로드 완료: {len(data.get('complexes', []))}개 단지 정보")
-                    return data
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            count = self.store.upsert_complexes(data.get('complexes', [])) if self.store else 0
+            print(f"단지 정보 파일 가져오기 완료: {file_path} ({count}개 단지)")
+            return data
+        except Exception as e:
+            print(f"단지 정보 파일 가져오기 중 오류 발생: {e}")
+            return None
+
+    def _import_legacy_complex_files(self):
+        """저장소가 비어 있을 때 이전 버전이 남긴 *_complexes.json 파일들을 한 번 가져오기"""
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        for filename in sorted(os.listdir(current_dir)):
+            if filename.endswith('_complexes.json'):
+                self.import_complex_file(os.path.join(current_dir, filename))
+
+    def load_complex_data(self, file_path=None, cortar_no=None):
+        """저장소에서 단지 정보 불러오기 (file_path를 주면 해당 JSON 파일을 저장소로 가져와서 사용)"""
+        if file_path is not None:
+            return self.import_complex_file(file_path) if os.path.exists(file_path) else None
+        if self.store is None:
+            return None
+        try:
+            complexes = self.store.get_complexes(cortar_no=cortar_no)
+            return {'complexes': complexes}
+        except Exception as e:
+            print(f"단지 정보 로드 중 오류 발생: {e}")
+            return None
+
+    def _get_cached_index(self, index_class, label, file_path=None):
+        """저장소 또는 지정한 JSON 파일 기준 단지 색인 (바뀌지 않았으면 재사용)"""
+        try:
+            if file_path is not None:
+                if not os.path.exists(file_path):
+                    return None
+                key, version = (index_class, file_path), os.path.getmtime(file_path)
+            elif self.store is not None:
+                key, version = (index_class, None), self.store.data_version()
             else:
-                print(f"단지 정보 파일을 찾을 수 없습니다: {file_path}")
                 return None
+
+            with self._complex_index_lock:
+                cached = self._complex_indexes.get(key)
+                if cached and cached[0] == version:
+                    return cached[1]
+                data = self.load_complex_data(file_path)
+                if not data:
+                    return None
+                if file_path is None:
+                    # 조회 자체가 버전을 바꾸지 않도록 불러온 뒤의 버전으로 기록
+                    version = self.store.data_version()
+                index = index_class(data.get('complexes', []))
+                self._complex_indexes[key] = (version, index)
+                print(f"{label} 생성: {len(index)}개 단지")
+                return index
         except Exception as e:
-            print(f"단지 정보 로드 중 오류 발생: {e}")
+            print(f"{label} 생성 중 오류 발생: {e}")
             return None
 
+    def get_complex_index(self, file_path=None):
+        """단지 검색 색인 반환 (저장소 또는 지정한 JSON 파일 기준, 바뀌지 않았으면 재사용)"""
+        return self._get_cached_index(ComplexIndex, "단지 검색 색인", file_path)
+
+    def get_spatial_index(self, file_path=None):
+        """단지 좌표 색인 반환 (저장소 또는 지정한 JSON 파일 기준, 바뀌지 않았으면 재사용)"""
+        return self._get_cached_index(SpatialIndex, "단지 좌표 색인", file_path)
+
+    def find_complexes_near(self, lat, lon, radius_km=1.0, limit=None, file_path=None):
+        """좌표에서 radius_km 안의 저장된 단지를 가까운 순으로 [(단지, 거리 km), ...] (네트워크 요청 없음)"""
+        index = self.get_spatial_index(file_path)
+        return index.within_radius(float(lat), float(lon), radius_km, limit) if index else []
+
+    def find_nearest_complexes(self, lat, lon, k=10, file_path=None):
+        """좌표에서 가장 가까운 저장된 단지 k개 [(단지, 거리 km), ...] (네트워크 요청 없음)"""
+        index = self.get_spatial_index(file_path)
+        return index.nearest(float(lat), float(lon), k) if index else []
+
+    def find_complexes_in_bounds(self, south, west, north, east, limit=None, file_path=None):
+        """위도/경도 사각형 안의 저장된 단지 목록 (지도 화면 영역 조회용, 네트워크 요청 없음)"""
+        index = self.get_spatial_index(file_path)
+        return index.in_bbox(float(south), float(west), float(north), float(east), limit) if index else []
+
+    def find_complexes(self, query, limit=20, by='name', file_path=None):
+        """단지명(초성 포함) 또는 주소로 검색한 순위별 단지 목록 (by: 'name' 또는 'address')"""
+        index = self.get_complex_index(file_path)
+        if index is None:
+            return []
+        if by == 'address':
+            return index.search_address(query, limit)
+        return index.search_name(query, limit)
+
     def find_complex_by_name(self, name, file_path=None):
-        """단지명으로 단지 정보 검색"""
-        data = self.load_complex_data(file_path)
-        if not data or 'complexes' not in data:
-            return None
-            
-        complexes = data['complexes']
-        # 정확히 일치하는 단지명 찾기
-        for complex_info in complexes:
-            if complex_info.get('complexName') == name:
-                return complex_info
-                
-        # 부분 일치하는 단지 찾기
-        matching_complexes = []
-        for complex_info in complexes:
-            if name.lower() in complex_info.get('complexName', '').lower():
-                matching_complexes.append(complex_info)
-                
-        return matching_complexes[0] if matching_complexes else None
-        
+        """단지명으로 단지 정보 검색 (가장 잘 맞는 단지 하나)"""
+        matches = self.find_complexes(name, limit=1, file_path=file_path)
+        return matches[0] if matches else None
+
     def find_complex_by_address(self, address, file_path=None):
-        """주소로 단지 정보 검색"""
-        data = self.load_complex_data(file_path)
-        if not data or 'complexes' not in data:
-            return None
+        """주소로 단지 정보 검색 (가장 잘 맞는 단지 하나)"""
+        matches = self.find_complexes(address, limit=1, by='address', file_path=file_path)
+        return matches[0] if matches else None
+
+    def iter_cortar_complex_pages(self, cortarId, max_pages=1000):
+        """지역 코드의 단지 목록을 페이지 단위로 하나씩 내주는 제너레이터 (오류가 나면 그 자리에서 끝남)"""
+        url = "https://new.land.naver.com/api/regions/complexes"
+        for page in range(1, max_pages + 1):
+            print(f"페이지 {page} 가져오는 중...")
+            params = {
+                'cortarId': cortarId,
+                'realEstateType': 'APT',
+                'order': 'rank',
+                'page': str(page)
+            }
             
-        complexes = data['complexes']
-        matching_complexes = []
-        
-        # 주소 기반 검색
-        for complex_info in complexes:
-            if address.lower() in complex_info.get('cortarAddress', '').lower():
-                matching_complexes.append(complex_info)
-                
-        return matching_complexes[0] if matching_complexes else None
+            try:
+                response = self._get(url, params=params)
+                print(f"API 응답 상태 코드: {response.status_code} (페이지 {page})")
+                if response.status_code != 200:
+                    print(f"API 요청 실패: {response.status_code}")
+                    return
+                data = response.json()
+            except Exception as e:
+                print(f"API 요청 중 오류 발생: {e}")
+                return
+            
+            page_complexes = data.get('complexList', [])
+            if not page_complexes:
+                # 더 이상 데이터가 없으면 종료
+                print(f"페이지 {page}에 더 이상 데이터가 없습니다. 종료합니다.")
+                return
+            print(f"페이지 {page}에서 {len(page_complexes)}개 단지 추가")
+            yield page_complexes
+            
+            # 다음 페이지가 없으면 종료
+            if not data.get('isMoreData', False):
+                print("더 이상 데이터가 없습니다. 종료합니다.")
+                return
 
     def get_complexes_by_cortarId(self, cortarId, max_pages=1000):
         """특정 지역 코드로 단지 정보 검색"""
@@ -848,56 +1043,11 @@ class NaverLandAPI:
         # 진행 상황 업데이트 초기화
         self.update_progress(0, "검색 시작")
         
-        for page in range(1, max_pages + 1):
-            print(f"페이지 {page} 가져오는 중...")
-            
+        for page, page_complexes in enumerate(self.iter_cortar_complex_pages(cortarId, max_pages=max_pages), 1):
+            all_complexes.extend(page_complexes)
             # 진행 상황 업데이트
             progress = min(int((page / max_pages) * 100), 95)
             self.update_progress(progress, f"페이지 {page} 검색 중")
-            
-            url = "https://new.land.naver.com/api/regions/complexes"
-            params = {
-                'cortarId': cortarId,
-                'realEstateType': 'APT',
-                'order': 'rank',
-                'page': str(page)
-            }
-            
-            try:
-                response = requests.get(
-                    url,
-                    params=params,
-                    cookies=self.cookies,
-                    headers=self.headers
-                )
-                
-                print(f"API 응답 상태 코드: {response.status_code} (페이지 {page})")
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    page_complexes = data.get('complexList', [])
-                    
-                    if page_complexes:
-                        all_complexes.extend(page_complexes)
-                        print(f"페이지 {page}에서 {len(page_complexes)}개 단지 추가")
-                    else:
-                        # 더 이상 데이터가 없으면 종료
-                        print(f"페이지 {page}에 더 이상 데이터가 없습니다. 종료합니다.")
-                        break
-                    
-                    # 다음 페이지가 없으면 종료
-                    if not data.get('isMoreData', False):
-                        print("더 이상 데이터가 없습니다. 종료합니다.")
-                        break
-                    
-                    # API 요청 간에 짧은 딜레이 추가
-                    time.sleep(0.5)
-                else:
-                    print(f"API 요청 실패: {response.status_code}")
-                    break
-            except Exception as e:
-                print(f"API 요청 중 오류 발생: {e}")
-                break
         
         # 진행 상황 업데이트 완료
         self.update_progress(100, "검색 완료")
@@ -906,20 +1056,14 @@ class NaverLandAPI:
         
         # 검색 결과를 파일로 저장
         result_data = {"complexes": all_complexes}
-        file_path = self.save_response_to_file(result_data, f"cortarId_{cortarId}_complexes.json")
-        print(f"검색 결과가 {file_path} 파일에 저장되었습니다.")
+        self.save_response(result_data, f"cortarId_{cortarId}_complexes")
         
         return result_data
 
     def _make_request(self, url, params=None):
         """API 요청 수행"""
         try:
-            response = requests.get(
-                url,
-                params=params,
-                cookies=self.cookies,
-                headers=self.headers
-            )
+            response = self._get(url, params=params)
             return response
         except Exception as e:
             print(f"API 요청 중 오류 발생: {str(e)}")
@@ -0,0 +1,123 @@
+import numpy as np
+
+
+DEFAULT_PERCENTILES = (10, 25, 75, 90)
+
+
+class PriceStats:
+    """(단지, 거래유형, 면적) 그룹별 가격 통계
+
+    ArticleFrame의 열 배열을 한 번 정렬해서 그룹별 개수/합계/최소/최대/중앙값/분위수/㎡당 가격을
+    벡터 연산으로 계산한다. 그룹별 부분합(개수, 합계, 정렬된 가격)을 보관하므로 거래유형 필터가
+    바뀌어도 매물을 다시 훑지 않고 그룹 단위로만 다시 합친다. 가격이 없거나 0인 매물은 제외한다.
+    """
+
+    def __init__(self, frame, percentiles=DEFAULT_PERCENTILES):
+        self.percentiles = tuple(percentiles)
+        price = frame.price_won
+        valid = np.flatnonzero(price > 0)
+
+        # 그룹 키를 정수 코드로 변환 (고유 키마다 한 번)
+        lookup = {}
+        codes = np.fromiter(
+            (lookup.setdefault(key, len(lookup)) for key in zip(frame.name[valid], frame.trade_type[valid], frame.area_key[valid])),
+            dtype=np.int64, count=len(valid))
+        self.keys = list(lookup)
+        self.trade_types = np.array([key[1] for key in self.keys], dtype=object)
+        group_count = len(self.keys)
+
+        prices = price[valid]
+        areas = frame.area1[valid]
+        self.count = np.bincount(codes, minlength=group_count)
+        self.sum = np.bincount(codes, weights=prices, minlength=group_count)
+
+        # ㎡당 가격: 전용면적이 있는 매물만
+        has_area = areas > 0
+        per_area = np.divide(prices, areas, out=np.zeros_like(prices), where=has_area)
+        self.area_count = np.bincount(codes, weights=has_area.astype(np.float64), minlength=group_count)
+        self.per_area_sum = np.bincount(codes, weights=per_area, minlength=group_count)
+
+        # 그룹 → 가격 오름차순으로 정렬하면 그룹마다 연속 구간이 되어 최소/최대/분위수를 위치로 구함
+        order = np.lexsort((prices, codes))
+        self.sorted_prices = prices[order]
+        self.starts = np.zeros(group_count, dtype=np.int64)
+        if group_count:
+            self.starts[1:] = np.cumsum(self.count)[:-1]
+        self._quantile_cache = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _quantile(self, q):
+        """그룹별 q분위 값 (선형 보간, numpy 기본 방식과 동일)"""
+        cached = self._quantile_cache.get(q)
+        if cached is None:
+            if not len(self.keys):
+                return np.empty(0)
+            position = self.starts + (self.count - 1) * q
+            lower = np.floor(position).astype(np.int64)
+            upper = np.minimum(lower + 1, self.starts + self.count - 1)
+            fraction = position - lower
+            cached = self.sorted_prices[lower] * (1 - fraction) + self.sorted_prices[upper] * fraction
+            self._quantile_cache[q] = cached
+        return cached
+
+    @property
+    def mean(self):
+        return self.sum / np.maximum(self.count, 1)
+
+    @property
+    def median(self):
+        return self._quantile(0.5)
+
+    @property
+    def min(self):
+        return self.sorted_prices[self.starts] if len(self.keys) else np.empty(0)
+
+    @property
+    def max(self):
+        return self.sorted_prices[self.starts + self.count - 1] if len(self.keys) else np.empty(0)
+
+    @property
+    def price_per_area(self):
+        """그룹별 평균 ㎡당 가격 (전용면적 기준, 면적 정보가 없으면 NaN)"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.area_count > 0, self.per_area_sum / np.maximum(self.area_count, 1), np.nan)
+
+    def group_mask(self, trade_type=None):
+        """거래유형 필터에 해당하는 그룹 (None이면 전체)"""
+        if trade_type is None:
+            return np.ones(len(self.keys), dtype=bool)
+        return self.trade_types == trade_type
+
+    def average_prices(self):
+        """{(단지명, 거래유형, 면적키): 평균가} - 테이블 강조 표시용"""
+        return dict(zip(self.keys, self.mean.tolist()))
+
+    def group_table(self, trade_type=None):
+        """그룹별 통계 목록 (각 항목: key, count, mean, median, min, max, pXX, per_area)"""
+        mask = np.flatnonzero(self.group_mask(trade_type))
+        columns = {
+            'count': self.count, 'mean': self.mean, 'median': self.median,
+            'min': self.min, 'max': self.max, 'per_area': self.price_per_area,
+        }
+        for p in self.percentiles:
+            columns[f'p{p}'] = self._quantile(p / 100)
+        rows = []
+        for i in mask.tolist():
+            row = {'key': self.keys[i]}
+            for name, values in columns.items():
+                row[name] = values[i].item()
+            rows.append(row)
+        return rows
+
+    def overall_by_trade_type(self, trade_type=None):
+        """거래유형별 전체 평균가 - 그룹 부분합만 다시 합침 (필터가 있으면 해당 유형만)"""
+        result = {}
+        mask = self.group_mask(trade_type)
+        for trade in dict.fromkeys(self.trade_types[mask].tolist()):
+            selected = mask & (self.trade_types == trade)
+            count = self.count[selected].sum()
+            if count:
+                result[trade] = float(self.sum[selected].sum() / count)
+        return result
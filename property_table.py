@@ -1,437 +1,330 @@
-from PySide6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QPushButton, QFrame, QCheckBox, QApplication
-from PySide6.QtCore import Qt, Signal, Slot
-from datetime import datetime
-from PySide6.QtGui import QFont, QColor
-import re
-import copy
-
-class NumericTableWidgetItem(QTableWidgetItem):
-    def __init__(self, text, numeric_value):
-        super().__init__(text)
-        try:
-            self.numeric_value = float(numeric_value)
-        except (ValueError, TypeError):
-            self.numeric_value = float('-inf') 
+from PySide6.QtWidgets import QTableView, QHeaderView, QAbstractItemView, QStyledItemDelegate, QStyle
+from PySide6.QtCore import Qt, Signal, Slot, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PySide6.QtGui import QFont, QColor, QPainter
+import numpy as np
+from article_frame import ArticleFrame, parse_area, parse_floor, format_price_display
 
-    def __lt__(self, other):
-        if isinstance(other, NumericTableWidgetItem):
-            return self.numeric_value < other.numeric_value
-        try:
-            return self.text() < other.text()
-        except AttributeError: 
-             return super().__lt__(other)
+ARTICLE_HEADERS = ["선택", "매물명", "매매/전세가", "월세", "거래유형", "공급/전용면적", "층수", "방향", "확인일", "특징", "상세보기"]
+COMPLEX_HEADERS = ["선택", "단지명", "부동산유형", "면적", "층수", "방향", "정보"]
+DETAIL_COLUMN = 10
 
-class PropertyTable(QTableWidget):
-    checkbox_toggled = Signal(int, bool)
-    detail_button_clicked = Signal(int)
+# 정렬 키 역할: 숫자 컬럼은 미리 계산한 숫자, 나머지는 표시 문자열
+SORT_KEY_ROLE = Qt.ItemDataRole.UserRole
 
-    def __init__(self, parent=None, is_complex_table=False):
+_LEFT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_CENTER = Qt.AlignmentFlag.AlignCenter
+ARTICLE_ALIGNMENTS = [_CENTER, _LEFT, _RIGHT, _RIGHT, _CENTER, _CENTER, _CENTER, _CENTER, _CENTER, _LEFT, _CENTER]
+COMPLEX_ALIGNMENTS = [_CENTER, _LEFT, _CENTER, _CENTER, _CENTER, _CENTER, _CENTER]
+
+# 평균가보다 싼 매물 강조 색 (거래유형별)
+HIGHLIGHT_COLORS = {'매매': QColor("#FFE4E1"), '전세': QColor("#E9F5E9"), '월세': QColor("#E0F7FA")}
+
+
+class PropertyTableModel(QAbstractTableModel):
+    """매물/단지 목록 모델
+
+    셀 문자열은 화면에 보이는 행만 그릴 때 만들어 캐시하고, 정렬은 컬럼별로 한 번 계산한
+    정렬 키 배열로 표시 순서(데이터 인덱스 목록)만 다시 배열한다. 행 번호를 밖으로 내보낼 때는
+    항상 rows 안의 데이터 인덱스를 쓰므로 정렬/필터와 무관하게 같은 매물을 가리킨다.
+    매물 테이블은 ArticleFrame으로 가격/면적/층을 한 번만 해석해 두고 표시/정렬/강조에 쓴다.
+    매물 dict는 복사하지 않고 호출 측과 공유하므로 읽기 전용으로 다룬다. 필터는 값별 인덱스
+    목록을 한 번 만들어 두고 표시 순서만 바꾸므로 걸러진 행 수만큼의 비용만 든다.
+    """
+
+    def __init__(self, is_complex_table=False, parent=None):
         super().__init__(parent)
-        self.checked_rows = set()
         self.is_complex_table = is_complex_table
-        self._original_header_texts = [] 
+        self.headers = list(COMPLEX_HEADERS if is_complex_table else ARTICLE_HEADERS)
+        self.alignments = COMPLEX_ALIGNMENTS if is_complex_table else ARTICLE_ALIGNMENTS
+        self.rows = []
+        self.frame = ArticleFrame()
+        self.checked = set()
         self.average_prices = {}
-        self.setup_ui()
-        self.cellClicked.connect(self.on_cell_clicked)
-        self.cellClicked.connect(self.on_cell_clicked_for_detail)
-        if self.horizontalHeader():
-            self.horizontalHeader().sortIndicatorChanged.connect(self.update_header_sort_indicators)
+        self._order = []
+        self._render_cache = {}
+        self._sort_keys = {}
+        self._sort_indicator = (-1, Qt.SortOrder.AscendingOrder)
+        self._group_indexes = {}
+        self._filter = None
+
+    # --- QAbstractTableModel 구현 ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation != Qt.Orientation.Horizontal or not (0 <= section < len(self.headers)):
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            sort_column, order = self._sort_indicator
+            if section == sort_column:
+                return f"{self.headers[section]} {'▲' if order == Qt.SortOrder.AscendingOrder else '▼'}"
+            return self.headers[section]
+        return None
 
-        self.field_mapping = {
-            'articleNo': '매물번호', 'articleName': '매물명', 'articleStatus': '매물상태',
-            'realEstateTypeCode': '부동산유형코드', 'realEstateTypeName': '부동산유형',
-            'articleRealEstateTypeCode': '매물부동산유형코드', 'articleRealEstateTypeName': '매물부동산유형',
-            'tradeTypeCode': '거래유형코드', 'tradeTypeName': '거래유형',
-            'verificationTypeCode': '확인유형코드', 'floorInfo': '층정보',
-            'priceChangeState': '가격변동상태', 'isPriceModification': '가격수정여부',
-            'dealOrWarrantPrc': '매매/전세가', 'areaName': '면적명', 'area1': '전용면적', 
-            'area2': '공급면적', 'direction': '방향', 'articleConfirmYmd': '확인일',
-            'articleFeatureDesc': '매물특징', 'tagList': '태그목록',
-            'buildingName': '동이름', 'sameAddrCnt': '동일주소매물수', 'sameAddrMaxPrc': '동일주소최고가',
-            'sameAddrMinPrc': '동일주소최저가', 'latitude': '위도', 'longitude': '경도',
-            'isLocationShow': '위치표시여부', 'realtorName': '부동산중개사명', 'realtorId': '부동산중개사ID',
-            'tradeCheckedByOwner': '소유자확인거래', 'isDirectTrade': '직거래여부', 'isInterest': '관심여부',
-            'isComplex': '단지여부', 'detailAddress': '상세주소', 'detailAddressYn': '상세주소여부',
-            'isVrExposed': 'VR노출여부', 'isSafeLessorOfHug': '안심임대인여부', 'rentPrc': '월세',
-            'complexName': '단지명', 'complexNo': '단지번호', 'cortarAddress': '주소'
-        }
-        self.original_data = []
-        self.data = []
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if not (0 <= row < len(self._order)):
+            return None
+        data_index = self._order[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0 or (not self.is_complex_table and column == DETAIL_COLUMN):
+                return None
+            return self._render(data_index)[0][column]
+        if role == Qt.ItemDataRole.CheckStateRole and column == 0:
+            return Qt.CheckState.Checked if data_index in self.checked else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self.alignments[column]
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._render(data_index)[1]
+        if role == SORT_KEY_ROLE:
+            return self._sort_column(column)[data_index]
+        return None
 
-    def setup_ui(self):
-        header_labels = []
-        if self.is_complex_table:
-            self.setColumnCount(7); header_labels = ["선택", "단지명", "부동산유형", "면적", "층수", "방향", "정보"]
+    def flags(self, index):
+        # 체크 상태는 행 클릭으로 토글하므로 ItemIsUserCheckable은 주지 않음 (이중 토글 방지)
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """정렬 키 배열로 표시 순서만 재배열 (선택 등 영구 인덱스는 유지)"""
+        if not (0 <= column < len(self.headers)):
+            return
+        keys = self._sort_column(column)
+        descending = order == Qt.SortOrder.DescendingOrder
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        old_data_indexes = [self._order[i.row()] for i in old_persistent]
+        if isinstance(keys, np.ndarray):
+            order_array = np.asarray(self._order, dtype=np.int64)
+            visible_keys = keys[order_array]
+            permutation = np.argsort(-visible_keys if descending else visible_keys, kind='stable')
+            self._order = order_array[permutation].tolist()
         else:
-            self.setColumnCount(11); header_labels = ["선택", "매물명", "매매/전세가", "월세", "거래유형", "공급/전용면적", "층수", "방향", "확인일", "특징", "상세보기"]
-        
-        self.setHorizontalHeaderLabels(header_labels)
-        self._original_header_texts = list(header_labels)
-        self.setAlternatingRowColors(True)
-        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.setSortingEnabled(True) 
-        self.verticalHeader().setVisible(False)
-        header = self.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        self.setColumnWidth(0, 40)
-        
-        if not self.is_complex_table:
-            self.setColumnWidth(1, 120); self.setColumnWidth(2, 120); self.setColumnWidth(3, 100);
-            self.setColumnWidth(4, 80); self.setColumnWidth(5, 120); self.setColumnWidth(6, 70);
-            self.setColumnWidth(7, 90); self.setColumnWidth(8, 90); self.setColumnWidth(9, 200);
-            self.setColumnWidth(10, 80)
-            header.setSectionResizeMode(9, QHeaderView.ResizeMode.Stretch)
-            header.setSectionResizeMode(10, QHeaderView.ResizeMode.Fixed)
+            self._order.sort(key=keys.__getitem__, reverse=descending)
+        if old_persistent:
+            position = {data_index: row for row, data_index in enumerate(self._order)}
+            new_persistent = [self.index(position[d], i.column()) for i, d in zip(old_persistent, old_data_indexes)]
+            self.changePersistentIndexList(old_persistent, new_persistent)
+        self.layoutChanged.emit()
+
+    # --- 데이터 관리 ---
+    def load(self, rows, average_prices=None):
+        self.beginResetModel()
+        self.rows = rows
+        self.frame = ArticleFrame() if self.is_complex_table else ArticleFrame(rows)
+        self.average_prices = average_prices or {}
+        self.checked = set()
+        self._order = list(range(len(rows)))
+        self._render_cache = {}
+        self._sort_keys = {}
+        self._group_indexes = {}
+        self._filter = None
+        self.endResetModel()
+
+    def _group_index(self, key):
+        """key 값별 데이터 인덱스 목록 (필터용, 키마다 한 번만 계산)"""
+        groups = self._group_indexes.get(key)
+        if groups is None:
+            groups = {}
+            for data_index, article in enumerate(self.rows):
+                groups.setdefault(article.get(key, ''), []).append(data_index)
+            self._group_indexes[key] = groups
+        return groups
+
+    def set_filter(self, key, value):
+        """key 값이 value인 행만 표시 (value가 None이면 전체), 체크 상태는 초기화"""
+        self.beginResetModel()
+        self._filter = None if value is None else (key, value)
+        if value is None:
+            self._order = list(range(len(self.rows)))
         else:
-            header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-        self.setStyleSheet(PropertyTable.get_style_sheet())
-        
-    def load_data(self, data, average_prices=None):
-        self.setSortingEnabled(False)
+            self._order = list(self._group_index(key).get(value, ()))
+        self.checked = set()
+        self.endResetModel()
+
+    def append(self, rows):
+        if not rows:
+            return
+        start = len(self.rows)
+        new_indexes = range(start, start + len(rows))
+        visible = list(new_indexes)
+        if self._filter:
+            key, value = self._filter
+            visible = [i for i, article in zip(new_indexes, rows) if article.get(key, '') == value]
+        for key, groups in self._group_indexes.items():
+            for data_index, article in zip(new_indexes, rows):
+                groups.setdefault(article.get(key, ''), []).append(data_index)
+        self.rows.extend(rows)
+        if not self.is_complex_table:
+            self.frame.extend(rows)
+        for column, keys in list(self._sort_keys.items()):
+            if isinstance(keys, np.ndarray):
+                del self._sort_keys[column]  # 숫자 컬럼은 frame에서 다시 꺼냄
+            else:
+                keys.extend(self._sort_key(article, column) for article in rows)
+        if visible:
+            self.beginInsertRows(QModelIndex(), len(self._order), len(self._order) + len(visible) - 1)
+            self._order.extend(visible)
+            self.endInsertRows()
+
+    def set_average_prices(self, average_prices):
+        """그룹별 평균가만 교체하고 강조 색상을 다시 그림 (행/정렬은 유지)"""
         self.average_prices = average_prices or {}
-        self.clearContents(); self.setRowCount(0); self.checked_rows.clear()
-        if not data: self.original_data = []; self.data = []; self.setSortingEnabled(True); return
-        
-        self.original_data = copy.deepcopy(data); self.data = copy.deepcopy(data)
-        self.setRowCount(len(data))
-        for row, article in enumerate(self.data):
-            try:
-                checkbox_item = QTableWidgetItem(); checkbox_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-                checkbox_item.setCheckState(Qt.CheckState.Unchecked); checkbox_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.setItem(row, 0, checkbox_item)
-                if self.is_complex_table: self.fill_complex_row(row, article)
-                else:
-                    self.fill_article_row(row, article)
-                    detail_button = self.create_detail_button(row)
-                    if detail_button: self.setCellWidget(row, 10, detail_button)
-            except Exception as e: import traceback; traceback.print_exc()
-        self.resizeRowsToContents(); self.setSortingEnabled(True)
-        self.update_header_sort_indicators(self.horizontalHeader().sortIndicatorSection(), self.horizontalHeader().sortIndicatorOrder())
-    
-    def _get_area_key(self, article):
-        supply_area_str = article.get('area2', '')
-        exclusive_area_str = article.get('area1', '')
-        def _format_num(num_str):
-            if not num_str: return ''
-            try: return f"{float(num_str):.2f}".rstrip('0').rstrip('.')
-            except (ValueError, TypeError): return str(num_str)
-        s_area_fmt = _format_num(supply_area_str)
-        e_area_fmt = _format_num(exclusive_area_str)
-        if s_area_fmt and e_area_fmt: return f"{s_area_fmt}㎡ ({e_area_fmt}㎡)"
-        elif s_area_fmt: return f"{s_area_fmt}㎡"
-        elif e_area_fmt: return f"{e_area_fmt}㎡"
-        return "-"
-
-    def fill_article_row(self, row, article):
-        # (기존 아이템 채우는 로직은 동일)
-        # 매물명
-        name_item = QTableWidgetItem(article.get('articleName', article.get('complexName', '-')))
-        self.setItem(row, 1, name_item)
-        # 매매/전세가
-        price_str = article.get('dealOrWarrantPrc', '-')
-        numeric_price_val = self._get_numeric_value_from_price_str(price_str)
-        price_item = NumericTableWidgetItem(self.format_price_in_won(price_str), numeric_price_val)
-        price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        self.setItem(row, 2, price_item)
-        # 월세
-        rent_price_str = article.get('rentPrc', '-')
-        numeric_rent_val = self._get_numeric_value_from_rent_str(rent_price_str)
-        rent_display = f"{int(numeric_rent_val/10000):,}" if numeric_rent_val > 0 else (rent_price_str or '-')
-        rent_item = NumericTableWidgetItem(rent_display, numeric_rent_val)
-        rent_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        self.setItem(row, 3, rent_item)
-        # 거래유형
-        trade_type = article.get('tradeTypeName', '-')
-        trade_item = QTableWidgetItem(trade_type)
-        trade_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 4, trade_item)
-        # 면적
-        area_key_str = self._get_area_key(article)
-        numeric_area_val = float(article.get('area1', 0))
-        area_item = NumericTableWidgetItem(area_key_str, numeric_area_val)
-        area_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 5, area_item)
-        # (이하 층수, 방향 등 나머지 아이템들도 동일하게 채움)
-        floor_info_str = article.get('floorInfo', '-'); floor_item = NumericTableWidgetItem(str(floor_info_str), self._parse_floor_info_for_sorting(floor_info_str)); floor_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter); self.setItem(row, 6, floor_item)
-        dir_item = QTableWidgetItem(str(article.get('direction', '-'))); dir_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter); self.setItem(row, 7, dir_item)
-        confirm_item = QTableWidgetItem(self.format_date(article.get('articleConfirmYmd', '-'))); confirm_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter); self.setItem(row, 8, confirm_item)
-        info_item = QTableWidgetItem(str(article.get('articleFeatureDesc', '-'))); info_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter); self.setItem(row, 9, info_item)
-
-        # ▼▼▼ 하이라이트 로직 추가 ▼▼▼
-        key = (
-            article.get('articleName', article.get('complexName', '')),
-            trade_type,
-            area_key_str
-        )
-        avg_price = self.average_prices.get(key)
-        
-        if avg_price and numeric_price_val > 0 and numeric_price_val < avg_price:
-            color = None
-            if trade_type == '매매': color = QColor("#FFE4E1") # 선홍색
-            elif trade_type == '전세': color = QColor("#E9F5E9") # 연녹색
-            elif trade_type == '월세': color = QColor("#E0F7FA") # 하늘색
-            
-            if color:
-                for col in range(self.columnCount()):
-                    if self.item(row, col): # 아이템이 있는 경우에만 적용
-                        self.item(row, col).setBackground(color)
-    
-    # ... (이하 기존 메서드들은 변경 없이 유지)
-    # _get_numeric_value_from_price_str, format_price_in_won, _get_area_key 등...
-    # 이 답변에서는 핵심 수정사항 위주로 보여드렸으므로,
-    # 나머지 부분은 이전 답변의 코드를 그대로 사용하시면 됩니다.
-
-    # ... (생략된 기존 코드 시작)
-    @Slot(int, Qt.SortOrder)
-    def update_header_sort_indicators(self, logical_index, order):
-        if not self._original_header_texts or len(self._original_header_texts) != self.columnCount():
-            self._original_header_texts = [self.horizontalHeaderItem(i).text().split(" ")[0] if self.horizontalHeaderItem(i) else "" for i in range(self.columnCount())]
-        for i in range(self.columnCount()):
-            if i < len(self._original_header_texts):
-                original_text = self._original_header_texts[i]
-                new_text = original_text
-                if i == logical_index:
-                    if order == Qt.SortOrder.AscendingOrder: new_text = f"{original_text} ▲"
-                    elif order == Qt.SortOrder.DescendingOrder: new_text = f"{original_text} ▼"
-                header_item = self.horizontalHeaderItem(i)
-                if header_item: header_item.setText(new_text)
-    
-
-    @staticmethod
-    def get_style_sheet():
-        return """
-            QTableWidget { background-color: white; alternate-background-color: #f5f9fc; border: 1px solid #dce6f1; border-radius: 4px; selection-background-color: #e3f2fd; selection-color: #1976d2; gridline-color: #dce6f1; }
-            QTableWidget::item { padding: 4px; border-bottom: 1px solid #e9ecef; }
-            QHeaderView::section { background-color: #0077b6; color: white; padding: 6px; border: none; font-weight: bold; text-align: center; }
-            QScrollBar:vertical { background: #f8f9fa; width: 10px; border-radius: 5px; margin: 0px; }
-            QScrollBar::handle:vertical { background: #ced4da; border-radius: 5px; min-height: 20px; }
-            QScrollBar::handle:vertical:hover { background: #adb5bd; }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { border: none; background: none; height: 0px; }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical { background: none; }
-            QTableWidget QTableCornerButton::section { background-color: #0077b6; border: none; }
-        """
-
-    def load_data(self, data):
-        self.setSortingEnabled(False)
-        self.clearContents(); self.setRowCount(0); self.checked_rows.clear()
-        if not data: self.original_data = []; self.data = []; self.setSortingEnabled(True); return
-        
-        header_labels = []
-        if self.is_complex_table:
-            self.setColumnCount(7); header_labels = ["선택", "단지명", "부동산유형", "면적", "층수", "방향", "정보"]
+        self._render_cache = {}
+        if self._order:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._order) - 1, len(self.headers) - 1),
+                                  [Qt.ItemDataRole.BackgroundRole])
+
+    def data_index(self, row):
+        """표시 행 번호 → rows 안의 데이터 인덱스"""
+        return self._order[row]
+
+    def visible_rows(self):
+        """현재 표시 중인 매물 목록 (표시 순서, dict는 공유)"""
+        rows = self.rows
+        return [rows[i] for i in self._order]
+
+    def set_checked(self, row, checked):
+        data_index = self._order[row]
+        if checked:
+            self.checked.add(data_index)
         else:
-            self.setColumnCount(11); header_labels = ["선택", "매물명", "매매/전세가", "월세", "거래유형", "공급/전용면적", "층수", "방향", "확인일", "특징", "상세보기"]
-        self.setHorizontalHeaderLabels(header_labels)
-        self._original_header_texts = list(header_labels)
-
-        self.original_data = copy.deepcopy(data); self.data = copy.deepcopy(data)
-        self.setRowCount(len(data))
-        for row, article in enumerate(self.data):
-            try:
-                checkbox_item = QTableWidgetItem(); checkbox_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-                checkbox_item.setCheckState(Qt.CheckState.Unchecked); checkbox_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.setItem(row, 0, checkbox_item)
-                if self.is_complex_table: self.fill_complex_row(row, article)
-                else:
-                    self.fill_article_row(row, article)
-                    detail_button = self.create_detail_button(row)
-                    if detail_button: self.setCellWidget(row, 10, detail_button)
-            except Exception as e: import traceback; traceback.print_exc()
-        self.resizeRowsToContents(); self.setSortingEnabled(True)
-        self.update_header_sort_indicators(self.horizontalHeader().sortIndicatorSection(), self.horizontalHeader().sortIndicatorOrder())
-
-    def _get_numeric_value_from_price_str(self, price_str):
-        if not isinstance(price_str, str) or price_str == '-': return 0 
-        try:
-            price_str_cleaned = price_str.replace(',', '').strip()
-            total_won = 0
-            if '억' in price_str_cleaned:
-                parts = price_str_cleaned.split('억')
-                if parts[0].strip().isdigit(): total_won += int(parts[0].strip()) * 100000000
-                if len(parts) > 1 and parts[1].strip().isdigit(): total_won += int(parts[1].strip()) * 10000
-            elif price_str_cleaned.isdigit(): total_won += int(price_str_cleaned) * 10000
-            return total_won
-        except (ValueError, TypeError): return 0
-
-    def _get_numeric_value_from_rent_str(self, rent_str):
-        if not rent_str or rent_str == '-' or not rent_str.strip().isdigit(): return 0
-        try: return int(rent_str.strip()) * 10000
-        except ValueError: return 0
-            
-    def _parse_floor_info_for_sorting(self, floor_str):
-        if not isinstance(floor_str, str): return -1 
-        if '/' in floor_str:
-            try: return int(floor_str.split('/')[0])
-            except ValueError: pass
-        if floor_str.endswith('층'):
-            try: return int(floor_str[:-1])
-            except ValueError: pass
-        if floor_str.isdigit():
-            try: return int(floor_str)
-            except ValueError: pass
-        mapping = {"저": 1, "중": 5, "고": 10}
-        for k, v in mapping.items():
-            if k in floor_str: return v
-        return -1
-
-    def fill_article_row(self, row, article):
-        name_item = QTableWidgetItem(article.get('articleName', article.get('complexName', '-')))
-        name_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        self.setItem(row, 1, name_item)
-
-        price_str = article.get('dealOrWarrantPrc', '-')
-        numeric_price_val = self._get_numeric_value_from_price_str(price_str)
-        formatted_price_display = self.format_price_in_won(price_str)
-        price_item = NumericTableWidgetItem(formatted_price_display, numeric_price_val)
-        price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        self.setItem(row, 2, price_item)
+            self.checked.discard(data_index)
+        cell = self.index(row, 0)
+        self.dataChanged.emit(cell, cell, [Qt.ItemDataRole.CheckStateRole])
+
+    def set_all_checked(self, checked):
+        self.checked = set(self._order) if checked else set()
+        if self._order:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._order) - 1, 0), [Qt.ItemDataRole.CheckStateRole])
+
+    def set_sort_indicator(self, column, order):
+        self._sort_indicator = (column, order)
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self.headers) - 1)
+
+    # --- 셀 문자열/정렬 키 계산 ---
+    def _render(self, data_index):
+        cached = self._render_cache.get(data_index)
+        if cached is None:
+            article = self.rows[data_index]
+            if self.is_complex_table:
+                cached = (self._complex_texts(article), None)
+            else:
+                cached = (self._article_texts(article, data_index), self._highlight_color(data_index))
+            self._render_cache[data_index] = cached
+        return cached
+
+    def _sort_column(self, column):
+        keys = self._sort_keys.get(column)
+        if keys is None:
+            keys = self._frame_sort_keys(column)
+            if keys is None:
+                keys = [self._sort_key(article, column) for article in self.rows]
+            self._sort_keys[column] = keys
+        return keys
+
+    def _frame_sort_keys(self, column):
+        """매물 테이블의 숫자 컬럼 정렬 키 (ArticleFrame 배열, 값이 없으면 0 / 층 -1)"""
+        if self.is_complex_table:
+            return None
+        if column == 2: return self.frame.price_sort_keys()
+        if column == 3: return self.frame.rent_sort_keys()
+        if column == 5: return self.frame.area1_sort_keys()
+        if column == 6: return self.frame.floor_num.astype(np.float64)
+        return None
 
+    def _sort_key(self, article, column):
+        if column == 0:
+            return 0
+        if self.is_complex_table:
+            if column == 3:
+                return np.nan_to_num(parse_area(article.get('minTotalArea', article.get('minArea', ''))))
+            if column == 4:
+                return float(parse_floor(article.get('lowFloor', article.get('minFloor', ''))))
+            if column == 6:
+                return np.nan_to_num(parse_area(article.get('totalHouseholdCount', article.get('householdCount', ''))))
+            return self._complex_texts(article)[column]
+        if column == DETAIL_COLUMN:
+            return 0
+        return self._plain_article_text(article, column)
+
+    def _plain_article_text(self, article, column):
+        # 숫자가 아닌 컬럼의 정렬 키 (표시 문자열과 같음)
+        if column == 1: return str(article.get('articleName', article.get('complexName', '-')))
+        if column == 4: return str(article.get('tradeTypeName', '-'))
+        if column == 7: return str(article.get('direction', '-'))
+        if column == 8: return self.format_date(article.get('articleConfirmYmd', '-'))
+        if column == 9: return str(article.get('articleFeatureDesc', '-'))
+        return ''
+
+    def _article_texts(self, article, data_index):
+        frame = self.frame
         rent_price_str = article.get('rentPrc', article.get('rentPrice', '-'))
-        numeric_rent_val = self._get_numeric_value_from_rent_str(rent_price_str)
+        rent_won = frame.rent_won[data_index]
         formatted_rent_display = "-"
-        if numeric_rent_val > 0 : formatted_rent_display = f"{numeric_rent_val:,}"
+        if rent_won > 0: formatted_rent_display = f"{int(rent_won):,}"
         elif rent_price_str == '0': formatted_rent_display = "0"
-        elif rent_price_str and rent_price_str != '-': formatted_rent_display = rent_price_str
-        rent_item = NumericTableWidgetItem(formatted_rent_display, numeric_rent_val)
-        rent_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        self.setItem(row, 3, rent_item)
-
-        trade_item = QTableWidgetItem(article.get('tradeTypeName', '-'))
-        trade_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 4, trade_item)
+        elif rent_price_str and rent_price_str != '-': formatted_rent_display = str(rent_price_str)
+        return (
+            None,
+            self._plain_article_text(article, 1),
+            format_price_display(article.get('dealOrWarrantPrc', '-'), frame.price_won[data_index]),
+            formatted_rent_display,
+            self._plain_article_text(article, 4),
+            frame.area_key[data_index],
+            str(article.get('floorInfo', '-')),
+            self._plain_article_text(article, 7),
+            self._plain_article_text(article, 8),
+            self._plain_article_text(article, 9),
+            None,
+        )
 
-        # ▼▼▼ 면적 표시 로직 수정 ▼▼▼
-        supply_area_str = article.get('area2', '')      # 공급면적
-        exclusive_area_str = article.get('area1', '')    # 전용면적
+    def _highlight_color(self, data_index):
+        if self.is_below_average(data_index):
+            return HIGHLIGHT_COLORS.get(self.frame.trade_type[data_index])
+        return None
 
-        def _format_num(num_str):
-            if not num_str: return ''
-            try:
-                return f"{float(num_str):.2f}".rstrip('0').rstrip('.')
-            except (ValueError, TypeError):
-                return str(num_str)
-
-        s_area_fmt = _format_num(supply_area_str)
-        e_area_fmt = _format_num(exclusive_area_str)
-
-        formatted_area_display = "-"
-        if s_area_fmt and e_area_fmt:
-            formatted_area_display = f"{s_area_fmt}㎡ ({e_area_fmt}㎡)"
-        elif s_area_fmt:
-            formatted_area_display = f"{s_area_fmt}㎡"
-        elif e_area_fmt:
-            formatted_area_display = f"{e_area_fmt}㎡"
-        
-        numeric_area_val = 0.0
-        try:
-            if exclusive_area_str: numeric_area_val = float(exclusive_area_str)
-        except ValueError: pass
-
-        area_item = NumericTableWidgetItem(formatted_area_display, numeric_area_val)
-        area_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 5, area_item)
-        # ▲▲▲ 면적 표시 로직 수정 끝 ▲▲▲
-
-        floor_info_str = article.get('floorInfo', '-')
-        numeric_floor_val = self._parse_floor_info_for_sorting(floor_info_str)
-        floor_item = NumericTableWidgetItem(str(floor_info_str), numeric_floor_val)
-        floor_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 6, floor_item)
-
-        dir_item = QTableWidgetItem(str(article.get('direction', '-')))
-        dir_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 7, dir_item)
-
-        confirm_date = self.format_date(article.get('articleConfirmYmd', '-'))
-        confirm_item = QTableWidgetItem(confirm_date)
-        confirm_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 8, confirm_item)
-
-        info_item = QTableWidgetItem(str(article.get('articleFeatureDesc', '-')))
-        info_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        self.setItem(row, 9, info_item)
-
-    def format_price_in_won(self, price_str):
-        if not isinstance(price_str, str) or price_str == '-': return "-"
-        try:
-            price_str_cleaned = price_str.replace(',', '').strip()
-            total_won = 0
-            if '억' in price_str_cleaned:
-                parts = price_str_cleaned.split('억')
-                if parts[0].strip().isdigit(): total_won += int(parts[0].strip()) * 100000000
-                if len(parts) > 1 and parts[1].strip().isdigit(): total_won += int(parts[1].strip()) * 10000
-            elif price_str_cleaned.isdigit(): total_won += int(price_str_cleaned) * 10000
-            else: return price_str
-            return f"{total_won:,}" if total_won > 0 else (price_str_cleaned if price_str_cleaned == '0' else price_str)
-        except (ValueError, TypeError): return price_str
-        
-    def fill_complex_row(self, row, article):
-        complex_name = article.get('complexName', article.get('complexNm', '-'))
-        name_item = QTableWidgetItem(complex_name)
-        name_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        self.setItem(row, 1, name_item)
+    def is_below_average(self, data_index):
+        """같은 (단지, 거래유형, 면적) 그룹 평균가보다 싼 매물인지 (강조 표시 기준)"""
+        if not self.average_prices:
+            return False
+        frame = self.frame
+        avg_price = self.average_prices.get((frame.name[data_index], frame.trade_type[data_index], frame.area_key[data_index]))
+        price_won = frame.price_won[data_index]
+        return bool(avg_price and 0 < price_won < avg_price)
 
+    def _complex_texts(self, article):
         type_name = article.get('realEstateTypeName', article.get('realEstateType', article.get('realEstateTypeNm', '-')))
         if type_name == '-':
             type_code = article.get('realEstateTypeCode', '')
             type_name = self.convert_property_type_code(type_code) if type_code else '-'
-        type_item = QTableWidgetItem(type_name)
-        type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 2, type_item)
-
-        area_min_str = article.get('minTotalArea', article.get('minArea', ''))
-        area_max_str = article.get('maxTotalArea', article.get('maxArea', ''))
-        numeric_area_val = 0.0
-        try:
-            if area_min_str: numeric_area_val = float(area_min_str)
-        except ValueError: pass
-        area_info_display = self.format_area_info(area_min_str, area_max_str)
-        area_item = NumericTableWidgetItem(area_info_display, numeric_area_val)
-        area_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 3, area_item)
-
-        floor_min_str = article.get('lowFloor', article.get('minFloor', ''))
-        floor_max_str = article.get('highFloor', article.get('maxFloor', ''))
-        numeric_floor_val = self._parse_floor_info_for_sorting(floor_min_str)
-        floor_info_display = self.format_floor_info(floor_min_str, floor_max_str)
-        floor_item = NumericTableWidgetItem(floor_info_display, numeric_floor_val)
-        floor_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 4, floor_item)
-
-        approve_date_str = article.get('useApproveYmd', article.get('approveYmd', ''))
-        approve_date_display = self.format_date(approve_date_str)
-        direction_item = QTableWidgetItem(approve_date_display) 
-        direction_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 5, direction_item)
 
         household_count_str = article.get('totalHouseholdCount', article.get('householdCount', ''))
         dong_count_str = article.get('totalDongCount', article.get('dongCount', ''))
-        numeric_household_val = 0
-        info_text_raw = "" # 포맷팅 전 세대수 문자열
-        if household_count_str:
-            info_text_raw = str(household_count_str)
-            try:
-                numeric_household_val = int(household_count_str)
-            except ValueError: pass # 변환 실패 시 numeric_household_val은 0 유지
-
         info_text_display = ""
         if household_count_str:
             try:
                 info_text_display += f"{int(household_count_str):,}" # 천단위 콤마
             except ValueError:
-                info_text_display += household_count_str # 숫자가 아니면 그대로
+                info_text_display += str(household_count_str) # 숫자가 아니면 그대로
             info_text_display += "세대"
-
-        if dong_count_str: 
+        if dong_count_str:
             info_text_display += f" {dong_count_str}동" if info_text_display else f"{dong_count_str}동"
-        
-        info_item = NumericTableWidgetItem(info_text_display if info_text_display else "-", numeric_household_val)
-        info_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 6, info_item)
+
+        return (
+            None,
+            str(article.get('complexName', article.get('complexNm', '-'))),
+            str(type_name),
+            self.format_area_info(article.get('minTotalArea', article.get('minArea', '')), article.get('maxTotalArea', article.get('maxArea', ''))),
+            self.format_floor_info(article.get('lowFloor', article.get('minFloor', '')), article.get('highFloor', article.get('maxFloor', ''))),
+            self.format_date(article.get('useApproveYmd', article.get('approveYmd', ''))),
+            info_text_display if info_text_display else "-",
+        )
 
     def format_area_info(self, area_min, area_max):
         if area_min and area_max and area_min != area_max:
@@ -447,14 +340,6 @@ class PropertyTable(QTableWidget):
             except (ValueError, TypeError): return f"{area_min}㎡"
         return "-"
 
-    def format_article_area(self, area_value, area_name):
-        if not area_value: return "-"
-        try:
-            area_fmt = f"{float(area_value):.1f}".rstrip('0').rstrip('.') if '.' in f"{float(area_value):.1f}" else f"{float(area_value):.0f}"
-            return f"{area_fmt}㎡({area_name})" if area_name else f"{area_fmt}㎡"
-        except (ValueError, TypeError):
-            return f"{area_value}㎡({area_name})" if area_name else f"{area_value}㎡"
-
     def format_floor_info(self, floor_min, floor_max):
         if floor_min and floor_max and floor_min != floor_max: return f"{floor_min}~{floor_max}층"
         elif floor_min: return f"{floor_min}층" if isinstance(floor_min, str) and floor_min.isdigit() else f"{floor_min}"
@@ -467,103 +352,212 @@ class PropertyTable(QTableWidget):
         elif len(date_str) == 6: return f"{date_str[:4]}.{date_str[4:6]}"
         return date_str
 
-    def verify_detail_buttons(self):
-        missing_buttons = [row for row in range(self.rowCount()) if not self.cellWidget(row, 10) or not isinstance(self.cellWidget(row, 10), QPushButton)]
-        if missing_buttons:
-            print(f"경고: 다음 행에 상세보기 버튼이 없습니다: {missing_buttons}")
-            for row in missing_buttons:
-                try:
-                    detail_button = self.create_detail_button(row)
-                    if detail_button: self.setCellWidget(row, 10, detail_button); print(f"행 {row}: 상세보기 버튼 생성 성공")
-                except Exception as e: print(f"행 {row}: 상세보기 버튼 생성 실패 - {e}")
-        else: print("모든 행에 상세보기 버튼이 정상적으로 설정되었습니다.")
-
-    def create_detail_button(self, row):
+    def convert_property_type_code(self, code):
+        type_mapping = {'APT': '아파트', 'OPST': '오피스텔', 'VL': '빌라', 'DDDGG': '단독/다가구', 'OR': '원룸', 'JWJT': '주택/점포', 'APTHGFC': '아파트형공장', 'SGJT': '상가주택', 'TOJI': '토지', 'JSGJ': '재개발/재건축', 'GM': '공장/창고', 'SANG': '상가', 'SJ': '사무실', 'OFC': '오피스'}
+        return type_mapping.get(code, code)
+
+
+class PropertySortFilterProxyModel(QSortFilterProxyModel):
+    """정렬은 원본 모델의 정렬 키 배열에 맡기는 프록시 (행마다 lessThan을 부르지 않음)"""
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        source = self.sourceModel()
+        if source is not None:
+            source.sort(column, order)
+
+
+class DetailButtonDelegate(QStyledItemDelegate):
+    """상세보기 컬럼에 버튼 모양을 그리는 델리게이트 (행마다 위젯을 만들지 않음)"""
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = option.rect.adjusted(4, 3, -4, -3)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("#00b4d8" if hovered else "#0077b6"))
+        painter.drawRoundedRect(rect, 4, 4)
+        font = QFont(option.font); font.setBold(True); font.setPointSize(9)
+        painter.setFont(font)
+        painter.setPen(QColor("white"))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "상세보기")
+        painter.restore()
+
+
+class PropertyTable(QTableView):
+    checkbox_toggled = Signal(int, bool)
+    detail_button_clicked = Signal(int)
+
+    def __init__(self, parent=None, is_complex_table=False):
+        super().__init__(parent)
+        self.is_complex_table = is_complex_table
+        self.table_model = PropertyTableModel(is_complex_table, self)
+        self.proxy_model = PropertySortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.table_model)
+        self.setModel(self.proxy_model)
+        self.setup_ui()
+        self.clicked.connect(self.on_cell_clicked)
+        if self.horizontalHeader():
+            self.horizontalHeader().sortIndicatorChanged.connect(self.update_header_sort_indicators)
+
+        self.field_mapping = {
+            'articleNo': '매물번호', 'articleName': '매물명', 'articleStatus': '매물상태',
+            'realEstateTypeCode': '부동산유형코드', 'realEstateTypeName': '부동산유형',
+            'articleRealEstateTypeCode': '매물부동산유형코드', 'articleRealEstateTypeName': '매물부동산유형',
+            'tradeTypeCode': '거래유형코드', 'tradeTypeName': '거래유형',
+            'verificationTypeCode': '확인유형코드', 'floorInfo': '층정보',
+            'priceChangeState': '가격변동상태', 'isPriceModification': '가격수정여부',
+            'dealOrWarrantPrc': '매매/전세가', 'areaName': '면적명', 'area1': '전용면적',
+            'area2': '공급면적', 'direction': '방향', 'articleConfirmYmd': '확인일',
+            'articleFeatureDesc': '매물특징', 'tagList': '태그목록',
+            'buildingName': '동이름', 'sameAddrCnt': '동일주소매물수', 'sameAddrMaxPrc': '동일주소최고가',
+            'sameAddrMinPrc': '동일주소최저가', 'latitude': '위도', 'longitude': '경도',
+            'isLocationShow': '위치표시여부', 'realtorName': '부동산중개사명', 'realtorId': '부동산중개사ID',
+            'tradeCheckedByOwner': '소유자확인거래', 'isDirectTrade': '직거래여부', 'isInterest': '관심여부',
+            'isComplex': '단지여부', 'detailAddress': '상세주소', 'detailAddressYn': '상세주소여부',
+            'isVrExposed': 'VR노출여부', 'isSafeLessorOfHug': '안심임대인여부', 'rentPrc': '월세',
+            'complexName': '단지명', 'complexNo': '단지번호', 'cortarAddress': '주소'
+        }
+
+    @property
+    def data(self):
+        return self.table_model.rows
+
+    @property
+    def original_data(self):
+        return self.table_model.rows
+
+    @property
+    def frame(self):
+        return self.table_model.frame
+
+    @property
+    def average_prices(self):
+        return self.table_model.average_prices
+
+    @property
+    def checked_rows(self):
+        return self.table_model.checked
+
+    def setup_ui(self):
+        self.setAlternatingRowColors(True)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setSortingEnabled(True)
+        self.setMouseTracking(True)
+        self.setWordWrap(False)
+        vertical_header = self.verticalHeader()
+        vertical_header.setVisible(False)
+        # 행 높이를 고정해 행마다 내용 크기를 계산하지 않음 (resizeRowsToContents 대체)
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(30)
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.setColumnWidth(0, 40)
+
         if not self.is_complex_table:
-            if not hasattr(self, 'original_data') or not self.original_data or not (0 <= row < len(self.original_data)):
-                print(f"create_detail_button: 행 {row} 데이터 접근 불가")
-                return None
-            button = QPushButton("상세보기")
-            button.setStyleSheet(PropertyTable.get_detail_button_style_sheet())
-            button.setProperty("row", row)
-            try: button.clicked.disconnect()
-            except: pass
-            button.clicked.connect(lambda checked=False, r=row: self.on_detail_button_clicked(r))
-            return button
-        return None
+            self.setColumnWidth(1, 120); self.setColumnWidth(2, 120); self.setColumnWidth(3, 100);
+            self.setColumnWidth(4, 80); self.setColumnWidth(5, 120); self.setColumnWidth(6, 70);
+            self.setColumnWidth(7, 90); self.setColumnWidth(8, 90); self.setColumnWidth(9, 200);
+            self.setColumnWidth(10, 80)
+            header.setSectionResizeMode(9, QHeaderView.ResizeMode.Stretch)
+            header.setSectionResizeMode(10, QHeaderView.ResizeMode.Fixed)
+            self.setItemDelegateForColumn(DETAIL_COLUMN, DetailButtonDelegate(self))
+        else:
+            header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+        self.setStyleSheet(PropertyTable.get_style_sheet())
+
+    def load_data(self, data, average_prices=None):
+        """목록을 복사하지 않고 그대로 표시 (append_data가 이 목록 끝에 행을 추가함)"""
+        self.table_model.load(data if data else [], average_prices)
+        if not data:
+            return
+        header = self.horizontalHeader()
+        if header.sortIndicatorSection() > 0 and self.isSortingEnabled():
+            self.table_model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+
+    def set_average_prices(self, average_prices):
+        self.table_model.set_average_prices(average_prices)
+
+    def append_data(self, data):
+        """기존 행을 유지한 채 새 데이터를 테이블 끝에 추가 (단지별 검색 결과 스트리밍용)"""
+        if not data: return
+        if not self.table_model.rows: self.load_data(list(data)); return
+        self.table_model.append(data)
+        header = self.horizontalHeader()
+        if header.sortIndicatorSection() > 0 and self.isSortingEnabled():
+            self.table_model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+
+    def filter_by(self, key, value=None):
+        """key 값이 value인 행만 표시 (value가 None이면 전체 표시)"""
+        self.table_model.set_filter(key, value)
+        header = self.horizontalHeader()
+        if header.sortIndicatorSection() > 0 and self.isSortingEnabled():
+            self.table_model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+
+    def visible_data(self):
+        return self.table_model.visible_rows()
+
+    def highlighted_trade_types(self, indices):
+        """데이터 인덱스마다 강조 표시된 매물이면 거래유형, 아니면 None (엑셀 내보내기 색상용)"""
+        model = self.table_model
+        trade_types = model.frame.trade_type
+        return [trade_types[i] if model.is_below_average(i) else None for i in indices]
+
+    def visible_indices(self):
+        """현재 표시 중인 행의 데이터 인덱스 (표시 순서)"""
+        return list(self.table_model._order)
+
+    def rowCount(self):
+        return self.model().rowCount()
+
+    def columnCount(self):
+        return self.model().columnCount()
+
+    @Slot(int, Qt.SortOrder)
+    def update_header_sort_indicators(self, logical_index, order):
+        self.table_model.set_sort_indicator(logical_index, order)
 
     @staticmethod
-    def get_detail_button_style_sheet():
+    def get_style_sheet():
         return """
-            QPushButton { background-color: #0077b6; color: white; border: none; border-radius: 4px; padding: 4px 8px; font-weight: bold; font-size: 9pt; }
-            QPushButton:hover { background-color: #00b4d8; } 
-            QPushButton:pressed { background-color: #005f8f; }
+            QTableView { background-color: white; alternate-background-color: #f5f9fc; border: 1px solid #dce6f1; border-radius: 4px; selection-background-color: #e3f2fd; selection-color: #1976d2; gridline-color: #dce6f1; }
+            QTableView::item { padding: 4px; border-bottom: 1px solid #e9ecef; }
+            QHeaderView::section { background-color: #0077b6; color: white; padding: 6px; border: none; font-weight: bold; text-align: center; }
+            QScrollBar:vertical { background: #f8f9fa; width: 10px; border-radius: 5px; margin: 0px; }
+            QScrollBar::handle:vertical { background: #ced4da; border-radius: 5px; min-height: 20px; }
+            QScrollBar::handle:vertical:hover { background: #adb5bd; }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { border: none; background: none; height: 0px; }
+            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical { background: none; }
+            QTableView QTableCornerButton::section { background-color: #0077b6; border: none; }
         """
 
-    def on_detail_button_clicked(self, row):
-        print(f"\n===== on_detail_button_clicked: 행 {row} 상세보기 버튼 클릭 시작 =====")
-        sender = self.sender()
-        if sender and isinstance(sender, QPushButton):
-            stored_row = sender.property("row")
-            if stored_row is not None and isinstance(stored_row, (int, float)) and stored_row != row:
-                print(f"버튼에 저장된 행 번호({stored_row})로 업데이트 (기존: {row})")
-                row = int(stored_row)
-        if not hasattr(self, 'original_data') or not self.original_data: print("데이터가 없습니다."); return
-        if not (0 <= row < len(self.original_data)):
-            print(f"유효하지 않은 행 번호: {row} (범위: 0-{len(self.original_data)-1})")
-            row = max(0, min(row, len(self.original_data) - 1))
-            print(f"행 번호가 {row}로 보정되었습니다.")
-        try:
-            print(f"detail_button_clicked 시그널 발생: 행 {row}")
-            self.detail_button_clicked.emit(row)
-        except Exception as e: print(f"시그널 발생 중 오류: {str(e)}")
-        print(f"===== on_detail_button_clicked: 행 {row} 상세보기 버튼 클릭 종료 =====\n")
-
-    def on_cell_clicked(self, row, column):
-        try:
-            if not hasattr(self, 'data') or not self.data: return
-            if not (0 <= row < self.rowCount() and 0 <= column < self.columnCount()): return
-            if not self.is_complex_table and column == self.columnCount() - 1: return
-            item = self.item(row, 0)
-            if not item:
-                item = QTableWidgetItem()
-                item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.setItem(row, 0, item)
-            new_state = Qt.CheckState.Unchecked if item.checkState() == Qt.CheckState.Checked else Qt.CheckState.Checked
-            item.setCheckState(new_state)
-            is_checked = (new_state == Qt.CheckState.Checked)
-            if is_checked: self.checked_rows.add(row)
-            else: self.checked_rows.discard(row)
-            self.checkbox_toggled.emit(row, is_checked)
-            QApplication.processEvents()
-        except Exception as e: import traceback; traceback.print_exc()
+    def _source_row(self, index):
+        return self.proxy_model.mapToSource(index).row()
 
-    def on_cell_clicked_for_detail(self, row, column):
+    def on_cell_clicked(self, index):
         try:
-            if not self.is_complex_table and column == self.columnCount() - 1:
-                widget = self.cellWidget(row, column)
-                if widget and isinstance(widget, QPushButton): widget.click()
-                else: self.on_detail_button_clicked(row)
+            if not index.isValid() or not self.table_model.rows: return
+            row = self._source_row(index)
+            data_index = self.table_model.data_index(row)
+            if not self.is_complex_table and index.column() == DETAIL_COLUMN:
+                self.detail_button_clicked.emit(data_index)
+                return
+            is_checked = data_index not in self.table_model.checked
+            self.table_model.set_checked(row, is_checked)
+            self.checkbox_toggled.emit(data_index, is_checked)
         except Exception as e: import traceback; traceback.print_exc()
 
-    def get_checked_items(self): return sorted(list(self.checked_rows))
+    def get_checked_items(self): return sorted(self.table_model.checked)
     def get_checked_data(self):
-        if not hasattr(self, 'data') or not self.data: return []
-        return [self.data[row] for row in self.get_checked_items() if 0 <= row < len(self.data)]
-    def get_checked_rows(self): return list(self.checked_rows)
+        rows = self.table_model.rows
+        return [rows[row] for row in self.get_checked_items() if 0 <= row < len(rows)]
+    def get_checked_rows(self): return list(self.table_model.checked)
 
     def check_all_items(self, checked=True):
-        check_state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
-        for row in range(self.rowCount()):
-            item = self.item(row, 0)
-            if item and item.checkState() != check_state:
-                item.setCheckState(check_state)
-                if checked: self.checked_rows.add(row)
-                else: self.checked_rows.discard(row)
-                self.checkbox_toggled.emit(row, checked)
+        self.table_model.set_all_checked(checked)
         if self.rowCount() > 0: self.checkbox_toggled.emit(self.rowCount() - 1, checked)
-
-    def convert_property_type_code(self, code):
-        type_mapping = {'APT': '아파트', 'OPST': '오피스텔', 'VL': '빌라', 'DDDGG': '단독/다가구', 'OR': '원룸', 'JWJT': '주택/점포', 'APTHGFC': '아파트형공장', 'SGJT': '상가주택', 'TOJI': '토지', 'JSGJ': '재개발/재건축', 'GM': '공장/창고', 'SANG': '상가', 'SJ': '사무실', 'OFC': '오피스'}
-        return type_mapping.get(code, code)
\ No newline at end of file
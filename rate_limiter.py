@@ -0,0 +1,103 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+class TokenBucketRateLimiter:
+    """토큰 버킷 기반 요청 속도 제한기
+
+    모든 API 호출이 하나의 인스턴스를 공유한다. 429 응답을 받으면 속도를 절반으로
+    낮추고 (Retry-After 또는 지터가 섞인 지수 백오프만큼) 전체 요청을 잠시 멈추며,
+    연속으로 성공하면 상한(max_rate)까지 조금씩 속도를 다시 올린다.
+    """
+
+    def __init__(self, rate=5.0, max_rate=10.0, min_rate=0.5, burst=None,
+                 backoff_base=1.0, backoff_max=60.0, recovery_successes=10,
+                 increase_step=0.5, decrease_factor=0.5):
+        self.max_rate = float(max_rate)
+        self.min_rate = float(min(min_rate, self.max_rate))
+        self.rate = min(max(float(rate), self.min_rate), self.max_rate)
+        self.burst = float(burst) if burst else max(1.0, self.rate)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.recovery_successes = recovery_successes
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._consecutive_successes = 0
+        self._consecutive_throttles = 0
+
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+    def reserve(self):
+        """토큰 하나를 예약하고, 요청 전까지 기다려야 하는 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait_time = max(0.0, self._paused_until - now)
+            # 토큰이 모자라면 음수로 빌려 쓰고, 부족분이 채워질 때까지의 시간만큼 대기 (음수 토큰 = 대기열)
+            self._tokens -= 1.0
+            if self._tokens < 0:
+                wait_time += -self._tokens / self.rate
+            return wait_time
+
+    def acquire(self):
+        """요청을 보낼 수 있을 때까지 대기"""
+        wait_time = self.reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    def on_success(self):
+        """요청 성공 기록 - 일정 횟수 연속 성공하면 속도를 올림"""
+        with self._lock:
+            self._consecutive_throttles = 0
+            self._consecutive_successes += 1
+            if self._consecutive_successes >= self.recovery_successes and self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+                self.burst = max(self.burst, self.rate)
+                self._consecutive_successes = 0
+
+    def on_throttled(self, retry_after=None):
+        """429 응답 기록 - 속도를 낮추고 모든 요청을 멈출 시간(초)을 반환"""
+        with self._lock:
+            self._consecutive_successes = 0
+            self._consecutive_throttles += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+
+            delay = self.parse_retry_after(retry_after)
+            if delay is None:
+                # 지터가 섞인 지수 백오프: 상한의 절반은 보장하고 나머지는 무작위
+                ceiling = min(self.backoff_max, self.backoff_base * (2 ** (self._consecutive_throttles - 1)))
+                delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+            delay = min(delay, self.backoff_max)
+
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + delay)
+            # 멈춘 동안 토큰이 쌓여 재개 직후 요청이 몰리지 않도록 버킷을 비움
+            self._tokens = min(self._tokens, 0.0)
+            self._last_refill = max(self._last_refill, now + delay)
+            return delay
+
+    @staticmethod
+    def parse_retry_after(value):
+        """Retry-After 헤더 값(초 또는 HTTP 날짜)을 대기 시간(초)으로 변환"""
+        if value is None or value == '':
+            return None
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+        try:
+            retry_at = parsedate_to_datetime(str(value))
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError, IndexError):
+            return None
@@ -0,0 +1,151 @@
+import threading
+import time
+
+from fetch_engine import ComplexFetchEngine
+
+
+# 네이버 지역 구분 (시/도 → 시/군/구 → 읍/면/동), 단지 목록은 읍/면/동 단위로 받음
+DONG_CORTAR_TYPE = 'sec'
+
+# 체크포인트 항목 상태
+STATUS_PENDING, STATUS_DONE, STATUS_FAILED = 'pending', 'done', 'failed'
+
+
+class RegionCrawler:
+    """지역 코드 하나를 읍/면/동까지 내려가며 모든 단지의 매물을 수집하는 크롤러
+
+    진행 상황(읍/면/동 목록, 단지 목록, 단지별 완료/실패)은 ArticleStore의 crawl_items 테이블에,
+    수집한 매물은 단지마다 끝나는 즉시 articles 테이블에 저장한다. 중간에 멈추거나 실패해도 같은 지역으로
+    다시 crawl을 호출하면 끝난 읍/면/동과 단지는 건너뛰고 남은 것(실패한 단지 포함)만 이어서 받는다.
+    """
+
+    def __init__(self, api, store=None, engine=None, max_workers=4, batch_size=200):
+        self.api = api
+        self.store = store if store is not None else api.store
+        if self.store is None:
+            raise RuntimeError("체크포인트를 저장할 로컬 저장소가 없습니다.")
+        self.engine = engine or ComplexFetchEngine(api, max_workers=max_workers)
+        # 한 번에 엔진에 넘기는 단지 수 (결과는 콜백에서 바로 저장하므로 메모리는 배치 크기와 무관)
+        self.batch_size = max(1, int(batch_size))
+        self._cancel_event = threading.Event()
+        self.articles_saved = 0
+
+    @staticmethod
+    def crawl_id(region_code):
+        return f"region:{region_code}"
+
+    def cancel(self):
+        """수집 중단 (진행 중인 단지는 끝까지 받고, 다음 실행에서 나머지를 이어 받음)"""
+        self._cancel_event.set()
+        self.engine.cancel()
+
+    # --- 1단계: 지역 → 읍/면/동 ---
+    def _walk_regions(self, region_code):
+        """regions/list를 따라 내려가 읍/면/동 목록 [(cortarNo, region)] 반환"""
+        dongs, queue, seen = [], [str(region_code)], set()
+        while queue and not self._cancel_event.is_set():
+            cortar_no = queue.pop(0)
+            if cortar_no in seen:
+                continue
+            seen.add(cortar_no)
+            info = self.api.search_region_info(cortar_no)
+            if info is None:
+                raise RuntimeError(f"지역 목록 조회 실패: {cortar_no}")
+            children = info.get('regionList') or []
+            if not children:
+                # 하위 지역이 없으면 그 자체가 단지 목록을 받을 단위
+                dongs.append((cortar_no, {'cortarNo': cortar_no}))
+                continue
+            for region in children:
+                child_no = str(region.get('cortarNo', ''))
+                if not child_no:
+                    continue
+                if region.get('cortarType') == DONG_CORTAR_TYPE:
+                    dongs.append((child_no, region))
+                else:
+                    queue.append(child_no)
+        return dongs
+
+    # --- 2단계: 읍/면/동 → 단지 ---
+    def _collect_complexes(self, crawl_id):
+        for cortar_no, status, region in self.store.get_crawl_items(crawl_id, 'dong', [STATUS_PENDING, STATUS_FAILED]):
+            if self._cancel_event.is_set():
+                return
+            complexes = self.api.get_region_complexes(cortar_no)
+            if complexes is None:
+                self.store.set_crawl_status(crawl_id, 'dong', cortar_no, STATUS_FAILED)
+                continue
+            complexes = [c for c in complexes if c.get('complexNo')]
+            self.store.upsert_complexes(complexes)
+            self.store.add_crawl_items(crawl_id, 'complex', [(c['complexNo'], c) for c in complexes])
+            self.store.set_crawl_status(crawl_id, 'dong', cortar_no, STATUS_DONE)
+            print(f"{region.get('cortarName', cortar_no)}: 단지 {len(complexes)}개")
+
+    # --- 3단계: 단지 → 매물 ---
+    def _fetch_articles(self, crawl_id, on_progress=None):
+        pending = self.store.get_crawl_items(crawl_id, 'complex', [STATUS_PENDING, STATUS_FAILED])
+        total, done = len(pending), 0
+        counter_lock = threading.Lock()
+
+        def on_result(complex_item, articles):
+            nonlocal done
+            complex_no = complex_item['complexNo']
+            if articles is None:
+                if not self._cancel_event.is_set():
+                    self.store.set_crawl_status(crawl_id, 'complex', complex_no, STATUS_FAILED)
+            else:
+                # 매물 저장과 완료 표시를 단지마다 바로 기록해야 중단 후 이어 받을 수 있음
+                self.store.replace_complex_articles(complex_no, articles)
+                self.store.set_crawl_status(crawl_id, 'complex', complex_no, STATUS_DONE)
+            with counter_lock:
+                done += 1
+                self.articles_saved += len(articles or ())
+                if on_progress:
+                    on_progress(done, total, complex_item.get('complexName', complex_no))
+
+        for start in range(0, total, self.batch_size):
+            if self._cancel_event.is_set():
+                break
+            batch = [data for _, _, data in pending[start:start + self.batch_size]]
+            self.engine.run(batch, on_result=on_result, keep_results=False)
+
+    def crawl(self, region_code, resume=True, on_progress=None):
+        """지역의 모든 단지 매물 수집 (resume=False면 체크포인트를 지우고 처음부터)
+
+        on_progress(done, total, complex_name)는 단지가 끝날 때마다 호출된다.
+        반환값: 진행 요약 (읍/면/동·단지별 상태 개수, 이번 실행에서 저장한 매물 수, 소요 시간)
+        """
+        started = time.time()
+        self.articles_saved = 0
+        crawl_id = self.crawl_id(region_code)
+        self._cancel_event.clear()
+        if not resume:
+            self.store.clear_crawl(crawl_id)
+
+        if not self.store.count_crawl_items(crawl_id, 'dong'):
+            dongs = self._walk_regions(region_code)
+            if self._cancel_event.is_set():
+                return self.summary(region_code, started)
+            self.store.add_crawl_items(crawl_id, 'dong', dongs)
+            print(f"지역 {region_code}: 읍/면/동 {len(dongs)}곳")
+
+        self._collect_complexes(crawl_id)
+        self._fetch_articles(crawl_id, on_progress)
+        return self.summary(region_code, started)
+
+    def summary(self, region_code, started=None):
+        """체크포인트 기준 진행 상황"""
+        crawl_id = self.crawl_id(region_code)
+        dong_status = self.store.count_crawl_items(crawl_id, 'dong')
+        complex_status = self.store.count_crawl_items(crawl_id, 'complex')
+        result = {
+            'regionCode': str(region_code),
+            'dongs': dong_status,
+            'complexes': complex_status,
+            'articlesSaved': self.articles_saved,
+            'isComplete': set(dong_status) == {STATUS_DONE} and set(complex_status) <= {STATUS_DONE},
+            'cancelled': self._cancel_event.is_set(),
+        }
+        if started is not None:
+            result['elapsed'] = round(time.time() - started, 1)
+        return result
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlencode, urlparse
+
+
+# 엔드포인트 종류별 캐시 유지 시간(초): 단지/지역 목록은 거의 바뀌지 않고, 매물 목록은 자주 바뀜
+DEFAULT_TTLS = {
+    'articles': 5 * 60,
+    'search': 60 * 60,
+    'complexes': 24 * 60 * 60,
+    'regions': 7 * 24 * 60 * 60,
+    'default': 10 * 60,
+}
+
+
+def classify_endpoint(url):
+    """URL 경로로 엔드포인트 종류 판별 (TTL 선택용)"""
+    path = urlparse(url).path
+    if '/articles' in path:
+        return 'articles'
+    if path.endswith('/search'):
+        return 'search'
+    if '/regions/complexes' in path:
+        return 'complexes'
+    if '/regions/list' in path:
+        return 'regions'
+    return 'default'
+
+
+def make_cache_key(url, params=None):
+    """엔드포인트 URL과 정규화한 파라미터(키 정렬, 문자열화)로 캐시 키 생성"""
+    normalized = sorted((str(k), '' if v is None else str(v)) for k, v in (params or {}).items())
+    raw = f"{url}?{urlencode(normalized)}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class CachedResponse:
+    """캐시에서 꺼낸 응답 (requests.Response 중 API 메서드가 쓰는 부분만 제공)"""
+
+    status_code = 200
+    from_cache = True
+
+    def __init__(self, content):
+        self.content = content
+        self.headers = {}
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class ResponseCache:
+    """SQLite 기반 API 응답 캐시 (엔드포인트별 TTL, 용량 상한, LRU 제거)"""
+
+    def __init__(self, db_path=None, max_size_bytes=100 * 1024 * 1024, ttls=None):
+        if db_path is None:
+            db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "naver_land_cache.sqlite3")
+        self.db_path = db_path
+        self.max_size_bytes = max_size_bytes
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+        self._conn.commit()
+        self._total_size = 0
+        self.purge_expired()
+
+    def get(self, url, params=None):
+        """유효한 캐시 응답 본문(bytes) 반환, 없거나 만료되면 None"""
+        key = make_cache_key(url, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM responses WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return zlib.decompress(row[0])
+
+    def set(self, url, params, content):
+        """응답 본문(bytes) 저장 - 용량 상한을 넘으면 오래 안 쓴 항목부터 제거"""
+        endpoint = classify_endpoint(url)
+        ttl = self.ttls.get(endpoint, self.ttls['default'])
+        if ttl <= 0:
+            return
+        key = make_cache_key(url, params)
+        body = zlib.compress(content)
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, body, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, body, len(body), now + ttl, now)
+            )
+            self._total_size += len(body) - (old[0] if old else 0)
+            if self._total_size > self.max_size_bytes:
+                self._evict_lru()
+            self._conn.commit()
+
+    def _evict_lru(self):
+        # 상한의 90%까지 줄여서 매번 제거가 일어나지 않도록 함 (호출 측에서 lock 보유)
+        target = int(self.max_size_bytes * 0.9)
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC").fetchall()
+        evicted = []
+        for key, size in rows:
+            if self._total_size <= target:
+                break
+            evicted.append((key,))
+            self._total_size -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def purge_expired(self):
+        """만료된 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+            self._total_size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_size = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
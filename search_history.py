@@ -0,0 +1,70 @@
+import time
+
+
+class SearchSnapshot:
+    """검색 결과 한 시점의 읽기 전용 스냅샷
+
+    매물/단지 dict는 복사하지 않고 참조만 튜플로 묶어 둔다. 화면 코드는 받은 dict를 고치지 않고
+    새 검색은 항상 새 목록을 만들므로, 같은 dict를 여러 기록이 나눠 가져도 안전하다.
+    (기록 하나에 드는 메모리는 목록 길이 × 참조 크기뿐)
+    """
+    __slots__ = ('label', 'keyword', 'data', 'complexes', 'articles', 'created_at')
+
+    def __init__(self, label, keyword, data, complexes, articles):
+        self.label = label
+        self.keyword = keyword
+        self.data = data
+        self.complexes = complexes
+        self.articles = articles
+        self.created_at = time.time()
+
+    def __repr__(self):
+        return f"SearchSnapshot({self.label!r}, 단지 {len(self.complexes)}개, 매물 {len(self.articles)}건)"
+
+
+class SearchHistory:
+    """최근 검색 스냅샷 목록 (최신이 앞)
+
+    직전 기록과 같은 목록 객체가 들어오면 튜플을 다시 만들지 않고 그대로 나눠 쓴다.
+    (단지 검색 후 매물 검색처럼 단지 목록이 그대로인 경우)
+    """
+
+    def __init__(self, max_entries=10):
+        self.max_entries = max_entries
+        self.entries = []
+        self._sources = {}  # 목록 id → (원본 목록, 튜플) - 직전 기록에 쓴 것만 유지
+
+    def _freeze(self, items, sources):
+        if not items:
+            return ()
+        cached = self._sources.get(id(items))
+        # 같은 객체라도 그 사이에 항목이 추가됐을 수 있으므로 길이까지 확인
+        if cached is not None and cached[0] is items and len(cached[1]) == len(items):
+            frozen = cached[1]
+        else:
+            frozen = tuple(items)
+        sources[id(items)] = (items, frozen)
+        return frozen
+
+    def record(self, label, keyword, data, complexes, articles):
+        """현재 검색 결과를 기록하고 스냅샷 반환"""
+        sources = {}
+        snapshot = SearchSnapshot(label, keyword, data,
+                                  self._freeze(complexes, sources), self._freeze(articles, sources))
+        self._sources = sources
+        self.entries.insert(0, snapshot)
+        del self.entries[self.max_entries:]
+        return snapshot
+
+    def clear(self):
+        self.entries.clear()
+        self._sources = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __getitem__(self, index):
+        return self.entries[index]
@@ -0,0 +1,117 @@
+import math
+from collections import defaultdict
+
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_LAT_DEGREE = math.pi * EARTH_RADIUS_KM / 180  # 위도 1도의 거리 (haversine_km과 같은 반지름)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """두 좌표 사이의 대원 거리(km)"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _coordinate(value):
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+class SpatialIndex:
+    """단지 좌표의 격자 해시 색인
+
+    위도/경도를 cell_km 크기의 격자 칸으로 나눠 칸마다 단지 위치를 모아 둔다. 반경/영역 조회는 조회
+    범위에 걸치는 칸만 훑고, 가장 가까운 k개 조회는 반경을 두 배씩 넓혀 k개 이상 찾으면 멈춘다.
+    좌표가 없거나 숫자가 아닌 단지는 색인에서 빠진다.
+    """
+
+    def __init__(self, complexes, cell_km=1.0):
+        self.complexes = []
+        self.latitudes = []
+        self.longitudes = []
+        for complex_info in complexes:
+            lat = _coordinate(complex_info.get('latitude'))
+            lon = _coordinate(complex_info.get('longitude'))
+            if lat is None or lon is None or not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                continue
+            self.complexes.append(complex_info)
+            self.latitudes.append(lat)
+            self.longitudes.append(lon)
+
+        # 칸 크기(도): 경도 방향은 단지들의 평균 위도에서 cell_km가 되도록
+        self.lat_step = cell_km / KM_PER_LAT_DEGREE
+        mean_lat = sum(self.latitudes) / len(self.latitudes) if self.latitudes else 0.0
+        self.lon_step = cell_km / (KM_PER_LAT_DEGREE * max(math.cos(math.radians(mean_lat)), 0.01))
+        self.cells = defaultdict(list)
+        for position, (lat, lon) in enumerate(zip(self.latitudes, self.longitudes)):
+            self.cells[self._cell(lat, lon)].append(position)
+
+    def __len__(self):
+        return len(self.complexes)
+
+    def _cell(self, lat, lon):
+        return math.floor(lat / self.lat_step), math.floor(lon / self.lon_step)
+
+    def _positions_in_bbox(self, south, west, north, east):
+        south_row, west_col = self._cell(south, west)
+        north_row, east_col = self._cell(north, east)
+        latitudes, longitudes = self.latitudes, self.longitudes
+        if (north_row - south_row + 1) * (east_col - west_col + 1) > len(self.cells):
+            # 조회 범위가 색인 전체보다 넓으면 칸을 하나씩 만들어 보는 대신 있는 칸만 확인
+            cells = (positions for (row, col), positions in self.cells.items()
+                     if south_row <= row <= north_row and west_col <= col <= east_col)
+        else:
+            cells = (self.cells.get((row, col), ()) for row in range(south_row, north_row + 1)
+                     for col in range(west_col, east_col + 1))
+        for positions in cells:
+            for position in positions:
+                if south <= latitudes[position] <= north and west <= longitudes[position] <= east:
+                    yield position
+
+    def in_bbox(self, south, west, north, east, limit=None):
+        """위도 south~north, 경도 west~east 사각형 안의 단지 목록"""
+        if south > north or west > east:
+            return []
+        positions = sorted(self._positions_in_bbox(south, west, north, east))
+        if limit:
+            positions = positions[:limit]
+        return [self.complexes[position] for position in positions]
+
+    def _within(self, lat, lon, radius_km):
+        """반경 안의 (거리, 위치) 목록 (가까운 순)"""
+        lat_delta = radius_km / KM_PER_LAT_DEGREE
+        # 극지방 근처에서는 경도 범위를 전부 훑음
+        cos_lat = math.cos(math.radians(min(abs(lat) + lat_delta, 90.0)))
+        lon_delta = radius_km / (KM_PER_LAT_DEGREE * cos_lat) if cos_lat > 1e-6 else 360.0
+        found = []
+        for position in self._positions_in_bbox(lat - lat_delta, lon - lon_delta, lat + lat_delta, lon + lon_delta):
+            distance = haversine_km(lat, lon, self.latitudes[position], self.longitudes[position])
+            if distance <= radius_km:
+                found.append((distance, position))
+        found.sort()
+        return found
+
+    def within_radius(self, lat, lon, radius_km, limit=None):
+        """(lat, lon)에서 radius_km 안의 단지를 가까운 순으로 [(단지, 거리 km), ...]"""
+        found = self._within(lat, lon, radius_km)
+        if limit:
+            found = found[:limit]
+        return [(self.complexes[position], distance) for distance, position in found]
+
+    def nearest(self, lat, lon, k=10):
+        """(lat, lon)에서 가장 가까운 단지 k개를 가까운 순으로 [(단지, 거리 km), ...]"""
+        if k <= 0 or not self.complexes:
+            return []
+        radius_km = self.lat_step * KM_PER_LAT_DEGREE
+        # 지구 반 바퀴를 넘으면 모든 단지가 들어오므로 더 넓힐 필요 없음
+        max_radius_km = math.pi * EARTH_RADIUS_KM
+        while True:
+            found = self._within(lat, lon, radius_km)
+            if len(found) >= k or radius_km >= max_radius_km:
+                break
+            radius_km *= 2
+        return [(self.complexes[position], distance) for distance, position in found[:k]]
@@ -0,0 +1,134 @@
+"""시작 시간 측정 스크립트
+
+새 파이썬 프로세스에서 `python -X importtime`으로 main_window를 불러오는 시간을 재고,
+시작할 때 불러오지 않아야 하는 무거운 모듈(openpyxl, XlsxWriter, pyarrow, aiohttp, 상세 위젯)이 섞여 들어오지 않았는지 확인한다.
+--window를 주면 QApplication 생성부터 첫 창 표시까지 단계별 시간도 잰다.
+
+사용법:
+    python startup_benchmark.py [--runs 5] [--budget-ms 800] [--window] [--offscreen]
+
+측정값이 예산을 넘거나 지연 로딩 모듈이 시작 시 불러와지면 종료 코드 1을 반환한다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+# 처음 쓸 때 불러오도록 바꾼 모듈 - 시작 시 불러와지면 회귀
+LAZY_MODULES = ('openpyxl', 'xlsxwriter', 'pyarrow', 'aiohttp', 'property_detail')
+DEFAULT_BUDGET_MS = 800
+
+WINDOW_SCRIPT = """
+import json, os, sys, time
+started = time.perf_counter()
+from PySide6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+app_ready = time.perf_counter()
+from main_window import MainWindow
+imported = time.perf_counter()
+window = MainWindow(None)
+constructed = time.perf_counter()
+window.show()
+app.processEvents()
+shown = time.perf_counter()
+print(json.dumps({
+    'qapplication': (app_ready - started) * 1000,
+    'import_main_window': (imported - app_ready) * 1000,
+    'construct_window': (constructed - imported) * 1000,
+    'first_paint': (shown - constructed) * 1000,
+    'total': (shown - started) * 1000,
+}))
+sys.stdout.flush()
+os._exit(0)
+"""
+
+
+def _project_dir():
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력 → {모듈: (자체 μs, 누적 μs, 깊이)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            depth = (len(name) - len(name.lstrip())) // 2
+            modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+        except ValueError:
+            continue  # 머리글 줄
+    return modules
+
+
+def measure_imports(module='main_window'):
+    """새 프로세스에서 module을 불러오는 데 걸린 시간(ms)과 모듈별 시간 반환"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=_project_dir(), capture_output=True, text=True)
+    modules = parse_importtime(result.stderr)
+    if module not in modules:
+        raise RuntimeError(f"{module}을(를) 불러오지 못했습니다:\n{result.stderr[-2000:]}")
+    return modules[module][1] / 1000, modules
+
+
+def measure_window(offscreen=False):
+    """새 프로세스에서 첫 창 표시까지 단계별 시간(ms) 반환"""
+    env = dict(os.environ)
+    if offscreen:
+        env['QT_QPA_PLATFORM'] = 'offscreen'
+    result = subprocess.run([sys.executable, '-c', WINDOW_SCRIPT], cwd=_project_dir(), env=env,
+                            capture_output=True, text=True)
+    for line in reversed(result.stdout.splitlines()):
+        if line.startswith('{'):
+            return json.loads(line)
+    raise RuntimeError(f"창 시작 시간을 측정하지 못했습니다:\n{result.stderr[-2000:]}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="시작 시간 측정")
+    parser.add_argument('--runs', type=int, default=5, help="측정 횟수 (중앙값 사용, 기본 5)")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"main_window 불러오기 시간 예산 (기본 {DEFAULT_BUDGET_MS}ms)")
+    parser.add_argument('--top', type=int, default=10, help="누적 시간이 긴 모듈 몇 개를 보여줄지")
+    parser.add_argument('--window', action='store_true', help="첫 창 표시까지 시간도 측정")
+    parser.add_argument('--offscreen', action='store_true', help="화면 없이 창 측정 (QT_QPA_PLATFORM=offscreen)")
+    args = parser.parse_args(argv)
+
+    timings, modules = [], {}
+    for _ in range(max(1, args.runs)):
+        elapsed, modules = measure_imports()
+        timings.append(elapsed)
+    median = statistics.median(timings)
+
+    print(f"main_window 불러오기: 중앙값 {median:.0f}ms (최소 {min(timings):.0f}ms, {len(timings)}회)")
+    # main_window가 직접 불러오는 모듈 중 오래 걸리는 것 (다음에 지연 로딩할 후보)
+    root_depth = modules['main_window'][2]
+    direct = [(name, times) for name, times in modules.items() if times[2] == root_depth + 1]
+    print(f"main_window가 직접 불러오는 모듈 중 누적 시간 상위 {args.top}개 (마지막 측정):")
+    for name, (self_us, cumulative_us, _) in sorted(direct, key=lambda item: -item[1][1])[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f}ms  {name}")
+
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in modules]
+    if eager:
+        print(f"실패: 시작 시 불러오면 안 되는 모듈이 불러와짐: {', '.join(eager)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"실패: 예산 {args.budget_ms:.0f}ms 초과")
+        failed = True
+
+    if args.window:
+        runs = [measure_window(args.offscreen) for _ in range(max(1, args.runs))]
+        print("첫 창 표시까지 (중앙값):")
+        for phase in runs[0]:
+            print(f"  {phase:20s} {statistics.median(run[phase] for run in runs):8.1f}ms")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -32,7 +32,6 @@ a = Analysis(
         'PySide6.QtGui', 
         'PySide6.QtWidgets',
         'requests',
-        'pandas',
         'openpyxl',
         'urllib3',
         'certifi'